@@ -17,26 +17,184 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import numpy as np
 import gspread
 import json
+import html
 import os
+import re
 from datetime import datetime, timedelta
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
 import io
+import importlib.util
 import subprocess
 import psutil
-import glob
 import requests
 from credentials_helper import get_google_sheets_client
 from email_accounts_manager import EmailAccountsManager
+from config import invalidate_email_config_cache
 
 # Load environment variables
 load_dotenv()
 
+# Serialize Plotly figures with orjson (much faster than the stdlib json encoder)
+if importlib.util.find_spec('orjson') is not None:
+    pio.json.config.default_engine = 'orjson'
+
+# Background worker for Google Sheets refreshes (keeps the fetch off the render path)
+SHEETS_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sheets-refresh")
+
+# Date format used by peekr_automation_master when writing sheet dates
+SHEET_DATE_FORMAT = '%Y-%m-%d'
+
+# Arrow-backed string dtype for free-text lead columns (pyarrow ships with streamlit)
+TEXT_DTYPE = 'string[pyarrow]'
+
+def text_columns(df):
+    """Columns holding Python str objects: object dtype, or pandas 3's default str dtype"""
+    return [col for col, dtype in df.dtypes.items()
+            if dtype == object or isinstance(dtype, pd.StringDtype)]
+
+# Low-cardinality lead columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ('Status', 'Category', 'Location', 'Mail Received', 'Reply Received')
+
+# HTML snippets rendered via str.format_map
+METRIC_CARD_TEMPLATE = """
+<div class="metric-card">
+    <div class="metric-title">{title}</div>
+    <div class="metric-value">{value}</div>
+    <div class="metric-change {change_class}">{change}</div>
+</div>
+"""
+
+COMPONENT_ROW_TEMPLATE = """
+<div class="component-row">
+    <div>
+        <div class="component-name">{name}</div>
+        <div class="component-description">{description}</div>
+    </div>
+    {badge}
+</div>
+"""
+
+LOG_ENTRY_TEMPLATE = """
+<div class="log-entry">
+    <span class="log-timestamp">[{timestamp}]</span>
+    <span class="log-level-{level}">[{level_upper}]</span>
+    <span>{message_safe}</span>
+</div>
+"""
+
+LOG_SUMMARY_CARD_TEMPLATE = """
+<div class="metric-card">
+    <div class="metric-title">{title}</div>
+    <div class="metric-value" style="color: var({color});">{value}</div>
+</div>
+"""
+
+# Log summary cards as (level, title, CSS color variable)
+LOG_SUMMARY_CARDS = (
+    ('error', '🚨 Errors', '--color-danger'),
+    ('warning', '⚠️ Warnings', '--color-warning'),
+    ('info', 'ℹ️ Info', '--color-accent'),
+    ('success', 'SUCCESS: Success', '--color-success')
+)
+
+STATUS_BADGE_TEMPLATE = '<span class="status-badge status-{status}">{icon} {status}</span>'
+
+# Badge icon per component status
+STATUS_ICONS = {'active': '●', 'pending': '○', 'inactive': '○'}
+
+# Chart size caps; the long tail is bucketed (pie) or dropped (category chart)
+MAX_PIE_SLICES = 8
+MAX_CHART_CATEGORIES = 15
+
+# Leads table columns, display names and column config (built once at import)
+LEAD_DISPLAY_COLUMNS = ('Title', 'Valid Email', 'Category', 'Location', 'Status', 'Mail Send at', 'Mail Received', 'Phone')
+
+LEAD_COLUMN_RENAMES = {
+    'Mail Send at': 'Mail Sent At',
+    'Valid Email': 'Valid Email',
+    'Mail Received': 'Mail Received',
+    'Last Follow-up Date': 'Last Follow-up Date'
+}
+
+LEAD_COLUMN_CONFIG = {
+    "Status": st.column_config.TextColumn(
+        "Status",
+        help="Current lead status"
+    ),
+    "Valid Email": st.column_config.TextColumn(
+        "Valid Email",
+        help="Validated business email"
+    ),
+    "Phone": st.column_config.TextColumn(
+        "Phone",
+        help="Contact phone number"
+    ),
+    "Mail Sent At": st.column_config.TextColumn(
+        "Mail Sent At",
+        help="Date email was sent"
+    )
+}
+
+# Boolean predicate columns added by clean_leads_data (internal, never exported)
+FLAG_COLUMNS = ('_has_email', '_sent', '_responded', '_interested')
+
+# Log timestamp pattern: YYYY-MM-DD HH:MM:SS
+LOG_TIMESTAMP_RE = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+
+# Log level markers in precedence order (first match wins, default is info)
+LOG_LEVEL_PATTERNS = (
+    ('error', re.compile(r'ERROR|❌', re.IGNORECASE)),
+    ('warning', re.compile(r'WARN|⚠️', re.IGNORECASE)),
+    ('success', re.compile(r'SUCCESS|✅', re.IGNORECASE))
+)
+
+def scan_files(directory, suffix=''):
+    """List (name, stat) for regular files in a directory with a single os.scandir pass"""
+    try:
+        with os.scandir(directory) as entries:
+            return [(entry.name, entry.stat()) for entry in entries
+                    if entry.name.endswith(suffix) and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+def tail_lines(path, max_lines, block_size=8192):
+    """Return the last max_lines lines of a file, reading backwards from the end"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        buffer = b''
+        # Read one extra newline so the first kept line is complete
+        while position > 0 and buffer.count(b'\n') <= max_lines:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            buffer = f.read(step) + buffer
+    
+    return buffer.decode('utf-8', errors='replace').splitlines()[-max_lines:]
+
+@st.cache_resource(show_spinner=False)
+def get_sheets_client():
+    """Authorized gspread client shared across reruns and sessions"""
+    client = get_google_sheets_client()
+    if not client:
+        # Raise rather than return None so a failed auth is not cached
+        raise ValueError("Failed to create Google Sheets client from environment variables")
+    return client
+
+@st.cache_resource(show_spinner=False)
+def get_spreadsheet(spreadsheet_id):
+    """Spreadsheet handle opened once per id (worksheets are resolved per call)"""
+    return get_sheets_client().open_by_key(spreadsheet_id)
+
 # Page configuration
 st.set_page_config(
     page_title="Peekr B2B Admin Dashboard",
@@ -117,6 +275,12 @@ st.markdown("""
         box-shadow: var(--shadow-small);
     }
     
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(5, 1fr);
+        gap: 1rem;
+    }
+    
     .metric-card:hover {
         transform: translateY(-2px);
         box-shadow: var(--shadow-medium);
@@ -372,6 +536,8 @@ class AdminDashboard:
             st.session_state.data_loaded = False
         if 'last_refresh' not in st.session_state:
             st.session_state.last_refresh = None
+        if 'last_refresh_str' not in st.session_state:
+            st.session_state.last_refresh_str = 'Never'
         if 'selected_leads' not in st.session_state:
             st.session_state.selected_leads = []
     
@@ -380,25 +546,24 @@ class AdminDashboard:
         self.spreadsheet_id = os.getenv('SPREADSHEET_ID', '1_SlKC3SkL90lYf2i_lELZrZQvh2tdMUaZSKe5_nG4WQ')
         self.prompts_dir = 'prompts'
     
-    @st.cache_data(show_spinner=False)
-    def load_google_sheets_data(_self):
+    def load_google_sheets_data(self):
         """Load data from Google Sheets using environment variables only"""
+        return self.load_google_sheets_cached(self.spreadsheet_id)
+    
+    @st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+    def load_google_sheets_cached(_self, spreadsheet_id):
+        """Fetch and clean both sheets; cached for 5 minutes per spreadsheet id"""
         try:
-            # Use credentials helper that works with environment variables
-            client = get_google_sheets_client()
-            if not client:
-                raise ValueError("Failed to create Google Sheets client from environment variables")
-            
-            # Load data from both sheets
-            spreadsheet = client.open_by_key(_self.spreadsheet_id)
-            leads_sheet = spreadsheet.worksheet("Incoming Leads")
-            categories_sheet = spreadsheet.worksheet("Categories")
-            
-            leads_data = leads_sheet.get_all_records()
-            categories_data = categories_sheet.get_all_records()
+            # Load data from both sheets in a single batchGet round-trip, reusing
+            # the cached authorized client and spreadsheet handle
+            spreadsheet = get_spreadsheet(spreadsheet_id)
+            response = spreadsheet.values_batch_get(
+                ranges=["'Incoming Leads'!A:Z", "Categories!A:Z"]
+            )
+            value_ranges = response.get('valueRanges', [])
             
-            leads_df = pd.DataFrame(leads_data)
-            categories_df = pd.DataFrame(categories_data)
+            leads_df = _self.values_to_dataframe(value_ranges[0].get('values', []) if len(value_ranges) > 0 else [])
+            categories_df = _self.values_to_dataframe(value_ranges[1].get('values', []) if len(value_ranges) > 1 else [])
             
             # Clean and process data
             leads_df = _self.clean_leads_data(leads_df)
@@ -409,37 +574,136 @@ class AdminDashboard:
             st.error(f"ERROR: Error loading data from Google Sheets: {str(e)}")
             return pd.DataFrame(), pd.DataFrame()
     
+    def load_sheet_summary(self):
+        """Lightweight lead/category counts for the sidebar"""
+        return self.load_sheet_summary_cached(self.spreadsheet_id)
+    
+    @st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+    def load_sheet_summary_cached(_self, spreadsheet_id):
+        """Count leads, valid emails and categories from projected column reads only"""
+        summary = {'n_leads': 0, 'n_valid': 0, 'n_categories': 0}
+        try:
+            spreadsheet = get_spreadsheet(spreadsheet_id)
+            response = spreadsheet.values_batch_get(
+                ranges=["'Incoming Leads'!1:1", "'Incoming Leads'!A:A", "Categories!A:A"]
+            )
+            header_range, first_column, categories_column = (
+                value_range.get('values', []) for value_range in response.get('valueRanges', [])
+            )
+            header = header_range[0] if header_range else []
+            
+            summary['n_leads'] = max(len(first_column) - 1, 0)
+            summary['n_categories'] = max(len(categories_column) - 1, 0)
+            
+            # Same column preference as clean_leads_data's _has_email flag
+            email_col = 'Valid Email' if 'Valid Email' in header else 'Email'
+            if email_col in header:
+                letter = gspread.utils.rowcol_to_a1(1, header.index(email_col) + 1)[:-1]
+                emails = spreadsheet.values_get(f"'Incoming Leads'!{letter}2:{letter}").get('values', [])
+                summary['n_leads'] = max(summary['n_leads'], len(emails))
+                summary['n_valid'] = sum(1 for row in emails if row and row[0] != '')
+        except Exception as e:
+            st.error(f"ERROR: Error loading sheet summary: {str(e)}")
+        
+        return summary
+    
+    def prefetch_google_sheets_data(self):
+        """Start warming the Google Sheets cache in the background"""
+        st.session_state.sheets_prefetch = SHEETS_EXECUTOR.submit(self.load_google_sheets_data)
+    
+    def get_google_sheets_data(self):
+        """Return sheet data, reusing an in-flight background prefetch if there is one"""
+        prefetch = st.session_state.pop('sheets_prefetch', None)
+        if prefetch is not None:
+            try:
+                return prefetch.result()
+            except Exception:
+                pass  # Fall back to a foreground load below
+        return self.load_google_sheets_data()
+    
+    def values_to_dataframe(self, rows):
+        """Build a DataFrame from raw sheet values (first row is the header)"""
+        if not rows:
+            return pd.DataFrame()
+        
+        header = rows[0]
+        width = len(header)
+        # Sheets API trims trailing empty cells, so pad/truncate rows to the header width
+        data = [row[:width] + [''] * (width - len(row)) for row in rows[1:]]
+        
+        # Build column-wise: one transpose via zip, then one object array per column
+        # (positional keys keep duplicate header names intact)
+        columns = zip(*data) if data else ([] for _ in header)
+        df = pd.DataFrame({i: np.array(col, dtype=object) for i, col in enumerate(columns)})
+        df.columns = header
+        return df
+    
     def clean_leads_data(self, df):
         """Clean and standardize the leads data"""
         if df.empty:
             return df
         
-        # Standardize column names and handle missing values
-        df = df.fillna('')
+        # Standardize column names and handle missing values (text columns only,
+        # so numeric columns keep their dtype)
+        object_cols = text_columns(df)
+        df[object_cols] = df[object_cols].fillna('')
         
-        # Convert dates
+        # Convert dates - the automation writes these as YYYY-MM-DD, so parse with a
+        # fixed format (vectorized) and cache repeated values
         date_columns = ['Mail Send at', 'Last Follow-up Date', 'Reply Date']
         for col in date_columns:
             if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+                df[col] = pd.to_datetime(df[col], format=SHEET_DATE_FORMAT, errors='coerce', cache=True)
+        
+        # Remaining text columns move to contiguous Arrow buffers so .str ops and
+        # comparisons run in Arrow kernels instead of on Python str objects
+        text_cols = text_columns(df)
+        df[text_cols] = df[text_cols].astype(TEXT_DTYPE)
         
         # Standardize status values
         if 'Status' in df.columns:
             df['Status'] = df['Status'].str.strip().str.title()
         
+        # Low-cardinality columns become categoricals so filters, value_counts and
+        # groupbys compare integer codes instead of Python strings
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        # Shared predicate columns, computed once and reused by every render_* function.
+        # Comparisons on Arrow strings yield bool[pyarrow], so store plain numpy bools
+        empty = pd.Series('', index=df.index)
+        email_col = 'Valid Email' if 'Valid Email' in df.columns else 'Email'
+        df['_has_email'] = df.get(email_col, empty).ne('').to_numpy(dtype=bool, na_value=False)
+        df['_sent'] = df.get('Status', empty).eq('Sent').to_numpy(dtype=bool, na_value=False)
+        df['_responded'] = df.get('Mail Received', empty).eq('YES').to_numpy(dtype=bool, na_value=False)
+        df['_interested'] = df.get('Reply Received', empty).eq('INTERESTED').to_numpy(dtype=bool, na_value=False)
+        
         return df
     
+    def prompts_fingerprint(self):
+        """Cheap (filename, mtime, size) fingerprint of the prompt files"""
+        return tuple(sorted(
+            (filename, stat.st_mtime, stat.st_size)
+            for filename, stat in scan_files(self.prompts_dir, '.txt')
+        ))
+    
+    @st.cache_data(show_spinner=False)
+    def load_prompts_cached(_self, fingerprint):
+        """Read the prompt files; cached until the fingerprint changes"""
+        prompts = {}
+        for filename, _, _ in fingerprint:
+            filepath = os.path.join(_self.prompts_dir, filename)
+            with open(filepath, 'r', encoding='utf-8') as f:
+                prompts[filename] = f.read()
+        return prompts
+    
     def load_prompts(self):
         """Load all prompt files from the prompts directory"""
-        prompts = {}
         try:
-            if os.path.exists(self.prompts_dir):
-                for filename in os.listdir(self.prompts_dir):
-                    if filename.endswith('.txt'):
-                        filepath = os.path.join(self.prompts_dir, filename)
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            prompts[filename] = f.read()
-            return prompts
+            # save_prompt rewrites the file, which changes its mtime/size and
+            # therefore the cache key
+            return self.load_prompts_cached(self.prompts_fingerprint())
         except Exception as e:
             st.error(f"Error loading prompts: {e}")
             return {}
@@ -455,8 +719,30 @@ class AdminDashboard:
             st.error(f"Error saving prompt: {e}")
             return False
     
+    def component_fingerprint(self):
+        """Cheap key for the inputs check_component_status depends on"""
+        try:
+            prompts_mtime = os.stat(self.prompts_dir).st_mtime
+        except OSError:
+            prompts_mtime = None
+        
+        return (
+            bool(os.getenv('GOOGLE_CREDENTIALS_FILE')),
+            len(os.getenv('OPENAI_API_KEY') or '') > 10,
+            len(os.getenv('APIFY_API_KEY') or '') > 10,
+            bool(os.getenv('EMAIL_ACCOUNT') and os.getenv('EMAIL_PASSWORD')),
+            prompts_mtime
+        )
+    
     def check_component_status(self):
         """Check actual status of system components"""
+        # Status only needs to be fresh to within the cache TTL; the fingerprint
+        # invalidates it early when configuration or prompt files change
+        return self.check_component_status_cached(self.component_fingerprint())
+    
+    @st.cache_data(ttl=30, show_spinner=False)
+    def check_component_status_cached(_self, fingerprint):
+        """Run the component checks; cached for 30s per fingerprint"""
         components = {}
         
         # Check if main automation script exists and is accessible
@@ -515,7 +801,7 @@ class AdminDashboard:
         }
         
         # Check prompt files
-        prompt_files_exist = os.path.exists(self.prompts_dir) and len(os.listdir(self.prompts_dir)) > 0
+        prompt_files_exist = len(scan_files(_self.prompts_dir)) > 0
         components['prompts'] = {
             'name': '📝 Content Templates',
             'description': 'AI prompt templates and messaging framework',
@@ -523,17 +809,9 @@ class AdminDashboard:
         }
         
         # Check log file (indicates recent activity)
-        log_files = glob.glob('*.log')
-        recent_activity = False
-        if log_files:
-            for log_file in log_files:
-                try:
-                    file_time = os.path.getmtime(log_file)
-                    if datetime.now().timestamp() - file_time < 3600:  # Activity in last hour
-                        recent_activity = True
-                        break
-                except:
-                    pass
+        log_files = scan_files('.', '.log')
+        now_ts = time.time()
+        recent_activity = any(now_ts - stat.st_mtime < 3600 for _, stat in log_files)  # Activity in last hour
         
         components['monitoring'] = {
             'name': '📡 Activity Monitoring',
@@ -543,28 +821,35 @@ class AdminDashboard:
         
         return components
     
+    def logs_fingerprint(self):
+        """Cheap (filename, mtime, size) fingerprint of the log files"""
+        return tuple(sorted(
+            (filename, stat.st_mtime, stat.st_size)
+            for filename, stat in scan_files('.', '.log')
+        ))
+    
     def get_system_logs(self, max_lines=100):
         """Get recent system logs"""
+        # Any write to a log file changes its mtime/size and therefore the cache key
+        return self.get_system_logs_cached(max_lines, self.logs_fingerprint())
+    
+    @st.cache_data(max_entries=8, show_spinner=False)
+    def get_system_logs_cached(_self, max_lines, fingerprint):
+        """Tail and parse the log files; cached until the fingerprint changes"""
         logs = []
-        log_files = glob.glob('*.log')
         
-        for log_file in log_files:
+        for log_file, _, _ in fingerprint:
             try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for line in reversed(lines[-max_lines:]):  # Get last max_lines
-                        if line.strip():
-                            logs.append({
-                                'timestamp': self.extract_timestamp(line),
-                                'level': self.extract_log_level(line),
-                                'message': line.strip(),
-                                'file': log_file
-                            })
+                lines = tail_lines(log_file, max_lines)  # Get last max_lines
+                logs.extend(_self.parse_log_lines(reversed(lines), log_file))
             except Exception as e:
+                message = f'Error reading {log_file}: {str(e)}'
                 logs.append({
                     'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                     'level': 'error',
-                    'message': f'Error reading {log_file}: {str(e)}',
+                    'level_upper': 'ERROR',
+                    'message': message,
+                    'message_safe': html.escape(message),
                     'file': 'system'
                 })
         
@@ -572,13 +857,35 @@ class AdminDashboard:
         logs.sort(key=lambda x: x['timestamp'], reverse=True)
         return logs[:max_lines]
     
+    def parse_log_lines(self, lines, log_file):
+        """Extract timestamp and level for a batch of log lines in one vectorized pass"""
+        messages = pd.Series([line.strip() for line in lines if line.strip()], dtype=object)
+        if messages.empty:
+            return []
+        
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamps = messages.str.extract(LOG_TIMESTAMP_RE, expand=False).fillna(now)
+        
+        # One precompiled alternation per level instead of upper() + substring scans
+        levels = np.select(
+            [messages.str.contains(pattern) for _, pattern in LOG_LEVEL_PATTERNS],
+            [level for level, _ in LOG_LEVEL_PATTERNS],
+            default='info'
+        )
+        
+        # Display fields are derived once here (and cached with the parse) rather
+        # than on every render
+        return [
+            {'timestamp': timestamp, 'level': level, 'level_upper': level.upper(),
+             'message': message, 'message_safe': html.escape(message), 'file': log_file}
+            for timestamp, level, message in zip(timestamps, levels.tolist(), messages)
+        ]
+    
     def extract_timestamp(self, log_line):
         """Extract timestamp from log line"""
         try:
             # Look for timestamp pattern: YYYY-MM-DD HH:MM:SS
-            import re
-            pattern = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'
-            match = re.search(pattern, log_line)
+            match = LOG_TIMESTAMP_RE.search(log_line)
             if match:
                 return match.group(1)
             else:
@@ -588,19 +895,12 @@ class AdminDashboard:
     
     def extract_log_level(self, log_line):
         """Extract log level from log line"""
-        log_line_upper = log_line.upper()
-        if 'ERROR' in log_line_upper or 'ERROR:' in log_line:
-            return 'error'
-        elif 'WARNING' in log_line_upper or 'WARN' in log_line_upper or '⚠️' in log_line:
-            return 'warning'
-        elif 'SUCCESS' in log_line_upper or 'SUCCESS:' in log_line:
-            return 'success'
-        elif 'INFO' in log_line_upper:
-            return 'info'
-        else:
-            return 'info'
+        for level, pattern in LOG_LEVEL_PATTERNS:
+            if pattern.search(log_line):
+                return level
+        return 'info'
 
-def render_header():
+def render_header(dashboard):
     """Render the main header"""
     st.markdown('<h1 class="main-header">🎯 Peekr B2B Admin Dashboard</h1>', unsafe_allow_html=True)
     
@@ -608,92 +908,69 @@ def render_header():
     col1, col2 = st.columns([4, 1])
     with col1:
         st.markdown("**Advanced Analytics & Management Interface**")
-        st.markdown(f"*Last updated: {st.session_state.last_refresh.strftime('%A, %B %d, %Y, %H:%M:%S') if st.session_state.last_refresh else 'Never'}*")
+        st.markdown(f"*Last updated: {st.session_state.last_refresh_str}*")
     with col2:
         if st.button("🔄 Refresh Data", type="primary"):
             st.cache_data.clear()
+            dashboard.prefetch_google_sheets_data()
             st.session_state.last_refresh = datetime.now()
+            # Format once here rather than on every rerun
+            st.session_state.last_refresh_str = st.session_state.last_refresh.strftime('%A, %B %d, %Y, %H:%M:%S')
             st.rerun()
 
-def render_overview_metrics(leads_df, categories_df):
+def compute_lead_counts(leads_df):
+    """Compute the headline lead counts from the precomputed flag columns"""
+    def flag_total(flag):
+        # Handle missing columns gracefully (e.g. empty sheet)
+        if flag not in leads_df.columns:
+            return 0
+        return int(leads_df[flag].sum())
+    
+    return {
+        'total': len(leads_df),
+        'valid': flag_total('_has_email'),
+        'sent': flag_total('_sent'),
+        'responses': flag_total('_responded'),
+        'interested': flag_total('_interested')
+    }
+
+def render_overview_metrics(leads_df, categories_df, counts=None):
     """Render overview metrics cards"""
     st.markdown('<div class="section-header">📊 Overview Metrics</div>', unsafe_allow_html=True)
     
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
     # Calculate metrics
-    total_leads = len(leads_df)
-    
-    # Handle missing columns gracefully
-    if 'Valid Email' in leads_df.columns:
-        valid_emails = len(leads_df[leads_df['Valid Email'] != ''])
-    elif 'Email' in leads_df.columns:
-        valid_emails = len(leads_df[leads_df['Email'] != ''])
-    else:
-        valid_emails = 0
-    
-    if 'Status' in leads_df.columns:
-        emails_sent = len(leads_df[leads_df['Status'] == 'Sent'])
-    else:
-        emails_sent = 0
-    
-    if 'Mail Received' in leads_df.columns:
-        responses_received = len(leads_df[leads_df['Mail Received'] == 'YES'])
-    else:
-        responses_received = 0
+    if counts is None:
+        counts = compute_lead_counts(leads_df)
+    
+    total_leads = counts['total']
+    valid_emails = counts['valid']
+    emails_sent = counts['sent']
+    responses_received = counts['responses']
     
     active_campaigns = len(categories_df)
     
     # Response rate
     response_rate = (responses_received / emails_sent * 100) if emails_sent > 0 else 0
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">📈 Total Leads</div>
-            <div class="metric-value">{total_leads:,}</div>
-            <div class="metric-change neutral">Active in system</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        email_rate = (valid_emails / total_leads * 100) if total_leads > 0 else 0
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">📧 Valid Emails</div>
-            <div class="metric-value">{valid_emails:,}</div>
-            <div class="metric-change {'positive' if email_rate > 50 else 'neutral'}">{email_rate:.1f}% coverage</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">📤 Emails Sent</div>
-            <div class="metric-value">{emails_sent:,}</div>
-            <div class="metric-change neutral">Outreach campaigns</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">📬 Responses</div>
-            <div class="metric-value">{responses_received:,}</div>
-            <div class="metric-change {'positive' if response_rate > 5 else 'negative'}">{response_rate:.1f}% response rate</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col5:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">🎯 Active Campaigns</div>
-            <div class="metric-value">{active_campaigns}</div>
-            <div class="metric-change neutral">Categories running</div>
-        </div>
-        """, unsafe_allow_html=True)
+    email_rate = (valid_emails / total_leads * 100) if total_leads > 0 else 0
+    
+    cards = [
+        {'title': '📈 Total Leads', 'value': f"{total_leads:,}",
+         'change_class': 'neutral', 'change': 'Active in system'},
+        {'title': '📧 Valid Emails', 'value': f"{valid_emails:,}",
+         'change_class': 'positive' if email_rate > 50 else 'neutral', 'change': f"{email_rate:.1f}% coverage"},
+        {'title': '📤 Emails Sent', 'value': f"{emails_sent:,}",
+         'change_class': 'neutral', 'change': 'Outreach campaigns'},
+        {'title': '📬 Responses', 'value': f"{responses_received:,}",
+         'change_class': 'positive' if response_rate > 5 else 'negative', 'change': f"{response_rate:.1f}% response rate"},
+        {'title': '🎯 Active Campaigns', 'value': f"{active_campaigns}",
+         'change_class': 'neutral', 'change': 'Categories running'}
+    ]
+    
+    # One markdown write for the whole row instead of one per card
+    cards_html = ''.join(METRIC_CARD_TEMPLATE.format_map(card) for card in cards)
+    st.markdown(f'<div class="metric-grid">{cards_html}</div>', unsafe_allow_html=True)
 
-def render_performance_analytics(leads_df):
+def render_performance_analytics(leads_df, counts=None):
     """Render performance analytics charts"""
     st.markdown('<div class="section-header">📈 Performance Analytics</div>', unsafe_allow_html=True)
     
@@ -702,14 +979,17 @@ def render_performance_analytics(leads_df):
     with col1:
         # Email funnel chart
         if not leads_df.empty:
+            if counts is None:
+                counts = compute_lead_counts(leads_df)
+            
             funnel_data = {
                 'Stage': ['Total Leads', 'Valid Emails', 'Emails Sent', 'Responses', 'Interested'],
                 'Count': [
-                    len(leads_df),
-                    len(leads_df[leads_df['Valid Email'] != '']),
-                    len(leads_df[leads_df['Status'] == 'Sent']),
-                    len(leads_df[leads_df['Mail Received'] == 'YES']),
-                    len(leads_df[leads_df['Reply Received'] == 'INTERESTED'])
+                    counts['total'],
+                    counts['valid'],
+                    counts['sent'],
+                    counts['responses'],
+                    counts['interested']
                 ]
             }
             
@@ -723,6 +1003,14 @@ def render_performance_analytics(leads_df):
         # Status distribution
         if not leads_df.empty and 'Status' in leads_df.columns:
             status_counts = leads_df['Status'].value_counts()
+            status_counts = status_counts[status_counts > 0]
+            
+            # Keep the largest slices and bucket the long tail as "Other"
+            if len(status_counts) > MAX_PIE_SLICES:
+                other = status_counts.iloc[MAX_PIE_SLICES:].sum()
+                status_counts = status_counts.head(MAX_PIE_SLICES)
+                status_counts.index = status_counts.index.astype(str)
+                status_counts['Other'] = other
             
             fig = px.pie(values=status_counts.values, names=status_counts.index,
                         title='📋 Lead Status Distribution',
@@ -737,34 +1025,40 @@ def render_campaign_performance(leads_df):
     
     st.markdown('<div class="section-header">🎯 Campaign Performance by Category</div>', unsafe_allow_html=True)
     
-    # Calculate performance metrics by category
-    category_stats = []
-    for category in leads_df['Category'].unique():
-        if category:
-            cat_df = leads_df[leads_df['Category'] == category]
-            stats = {
-                'Category': category,
-                'Total Leads': len(cat_df),
-                'Valid Emails': len(cat_df[cat_df['Valid Email'] != '']),
-                'Emails Sent': len(cat_df[cat_df['Status'] == 'Sent']),
-                'Responses': len(cat_df[cat_df['Mail Received'] == 'YES']),
-                'Response Rate': len(cat_df[cat_df['Mail Received'] == 'YES']) / len(cat_df[cat_df['Status'] == 'Sent']) * 100 if len(cat_df[cat_df['Status'] == 'Sent']) > 0 else 0
-            }
-            category_stats.append(stats)
+    # Calculate performance metrics by category in a single groupby pass
+    flags = pd.DataFrame({
+        'Category': leads_df['Category'],
+        'Valid Emails': leads_df['_has_email'],
+        'Emails Sent': leads_df['_sent'],
+        'Responses': leads_df['_responded']
+    })
+    flags = flags[flags['Category'] != '']
+    
+    cat_df = flags.groupby('Category', sort=False, observed=True).agg(
+        **{
+            'Total Leads': ('Category', 'size'),
+            'Valid Emails': ('Valid Emails', 'sum'),
+            'Emails Sent': ('Emails Sent', 'sum'),
+            'Responses': ('Responses', 'sum')
+        }
+    ).reset_index()
+    cat_df['Response Rate'] = (cat_df['Responses'] / cat_df['Emails Sent'].replace(0, np.nan) * 100).fillna(0)
     
-    if category_stats:
-        cat_df = pd.DataFrame(category_stats)
+    if not cat_df.empty:
+        
+        # Chart only the busiest categories; the table below keeps all of them
+        chart_df = cat_df.nlargest(MAX_CHART_CATEGORIES, 'Emails Sent')
         
         # Create comparison chart
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         
         fig.add_trace(
-            go.Bar(x=cat_df['Category'], y=cat_df['Emails Sent'], name='Emails Sent', marker_color='#60a5fa'),
+            go.Bar(x=chart_df['Category'], y=chart_df['Emails Sent'], name='Emails Sent', marker_color='#60a5fa'),
             secondary_y=False,
         )
         
         fig.add_trace(
-            go.Scatter(x=cat_df['Category'], y=cat_df['Response Rate'], mode='lines+markers',
+            go.Scattergl(x=chart_df['Category'], y=chart_df['Response Rate'], mode='lines+markers',
                       name='Response Rate (%)', marker_color='#34d399'),
             secondary_y=True,
         )
@@ -772,13 +1066,36 @@ def render_campaign_performance(leads_df):
         fig.update_xaxes(title_text="Category")
         fig.update_yaxes(title_text="Emails Sent", secondary_y=False)
         fig.update_yaxes(title_text="Response Rate (%)", secondary_y=True)
-        fig.update_layout(title_text="📊 Category Performance Overview", height=500)
+        fig.update_layout(title_text="📊 Category Performance Overview", height=500, hovermode='closest')
         
         st.plotly_chart(fig, use_container_width=True)
         
         # Performance table
         st.dataframe(cat_df, use_container_width=True, height=300)
 
+def column_options(df, col):
+    """Distinct values of a column for filter dropdowns"""
+    if isinstance(df[col].dtype, pd.CategoricalDtype):
+        return df[col].cat.categories.tolist()
+    return list(df[col].unique())
+
+def filter_leads(leads_df, status, category, location):
+    """Apply the leads management dropdown filters"""
+    # Combine the filters into one boolean mask and slice once
+    mask = np.ones(len(leads_df), dtype=bool)
+    for col, value in (('Status', status), ('Category', category), ('Location', location)):
+        if value != 'All':
+            mask &= (leads_df[col] == value).to_numpy(dtype=bool)
+    
+    return leads_df[mask]
+
+@st.cache_data(show_spinner=False)
+def export_leads_csv(_leads_df, data_hash, status, category, location):
+    """CSV bytes for the filtered leads; keyed on the data hash and filter values only"""
+    filtered_df = filter_leads(_leads_df, status, category, location)
+    filtered_df = filtered_df.drop(columns=list(FLAG_COLUMNS), errors='ignore')
+    return filtered_df.to_csv(index=False).encode('utf-8')
+
 def render_leads_management(leads_df):
     """Render leads management interface"""
     st.markdown('<div class="section-header">👥 Leads Management</div>', unsafe_allow_html=True)
@@ -791,34 +1108,25 @@ def render_leads_management(leads_df):
     
     with col1:
         # Filter by status
-        status_options = ['All'] + list(leads_df['Status'].unique())
+        status_options = ['All'] + column_options(leads_df, 'Status')
         selected_status = st.selectbox("🏷️ Filter by Status", status_options)
     
     with col2:
         # Filter by category
-        category_options = ['All'] + list(leads_df['Category'].unique())
+        category_options = ['All'] + column_options(leads_df, 'Category')
         selected_category = st.selectbox("📂 Filter by Category", category_options)
     
     with col3:
         # Filter by location
-        location_options = ['All'] + list(leads_df['Location'].unique())
+        location_options = ['All'] + column_options(leads_df, 'Location')
         selected_location = st.selectbox("📍 Filter by Location", location_options)
     
     with col4:
         # Export options
         if st.button("📤 Export Filtered Data"):
-            # Create filtered dataframe for export
-            filtered_df = leads_df.copy()
-            
-            if selected_status != 'All':
-                filtered_df = filtered_df[filtered_df['Status'] == selected_status]
-            if selected_category != 'All':
-                filtered_df = filtered_df[filtered_df['Category'] == selected_category]
-            if selected_location != 'All':
-                filtered_df = filtered_df[filtered_df['Location'] == selected_location]
-            
-            # Convert to CSV
-            csv = filtered_df.to_csv(index=False)
+            # Convert to CSV (cached per data snapshot + filter selection)
+            data_hash = int(pd.util.hash_pandas_object(leads_df, index=False).sum())
+            csv = export_leads_csv(leads_df, data_hash, selected_status, selected_category, selected_location)
             st.download_button(
                 label="📥 Download CSV",
                 data=csv,
@@ -827,14 +1135,7 @@ def render_leads_management(leads_df):
             )
     
     # Apply filters
-    filtered_df = leads_df.copy()
-    
-    if selected_status != 'All':
-        filtered_df = filtered_df[filtered_df['Status'] == selected_status]
-    if selected_category != 'All':
-        filtered_df = filtered_df[filtered_df['Category'] == selected_category]
-    if selected_location != 'All':
-        filtered_df = filtered_df[filtered_df['Location'] == selected_location]
+    filtered_df = filter_leads(leads_df, selected_status, selected_category, selected_location)
     
     # Display filtered results
     st.markdown(f"**Showing {len(filtered_df)} of {len(leads_df)} leads**")
@@ -842,49 +1143,20 @@ def render_leads_management(leads_df):
     # Enhanced dataframe with formatting
     if not filtered_df.empty:
         # Select key columns for display
-        display_columns = ['Title', 'Valid Email', 'Category', 'Location', 'Status', 'Mail Send at', 'Mail Received', 'Phone']
-        available_columns = [col for col in display_columns if col in filtered_df.columns]
-        
-        # Create display-friendly column names
-        column_name_mapping = {
-            'Mail Send at': 'Mail Sent At',
-            'Valid Email': 'Valid Email',
-            'Mail Received': 'Mail Received',
-            'Last Follow-up Date': 'Last Follow-up Date'
-        }
+        available_columns = [col for col in LEAD_DISPLAY_COLUMNS if col in filtered_df.columns]
         
-        display_df = filtered_df[available_columns].copy()
+        # Column selection already yields a new frame, so no explicit copy
+        display_df = filtered_df[available_columns].rename(columns=LEAD_COLUMN_RENAMES)
         
-        # Rename columns for better display
-        display_df = display_df.rename(columns=column_name_mapping)
-        
-        # Format the dataframe
-        for col in display_df.columns:
-            if display_df[col].dtype == 'object':
-                display_df[col] = display_df[col].astype(str)
+        # Convert any remaining object columns in a single astype call
+        object_cols = text_columns(display_df)
+        display_df = display_df.astype({col: TEXT_DTYPE for col in object_cols})
         
         st.dataframe(
             display_df,
             use_container_width=True,
             height=500,
-            column_config={
-                "Status": st.column_config.TextColumn(
-                    "Status",
-                    help="Current lead status"
-                ),
-                "Valid Email": st.column_config.TextColumn(
-                    "Valid Email",
-                    help="Validated business email"
-                ),
-                "Phone": st.column_config.TextColumn(
-                    "Phone",
-                    help="Contact phone number"
-                ),
-                "Mail Sent At": st.column_config.TextColumn(
-                    "Mail Sent At",
-                    help="Date email was sent"
-                )
-            }
+            column_config=LEAD_COLUMN_CONFIG
         )
 
 def render_logs_viewer(dashboard):
@@ -902,17 +1174,19 @@ def render_logs_viewer(dashboard):
     with col3:
         auto_refresh = st.checkbox("🔄 Auto-refresh (10s)", value=False)
     
-    # Auto-refresh functionality
-    if auto_refresh:
-        time.sleep(10)
-        st.rerun()
-    
+    # Auto-refresh reruns only the log fragment, not the whole app
+    render_log_entries_fragment = st.fragment(render_log_entries, run_every="10s" if auto_refresh else None)
+    render_log_entries_fragment(dashboard, log_lines, log_level_filter)
+
+def render_log_entries(dashboard, log_lines, log_level_filter):
+    """Render the log lines, level summary and export for the logs viewer"""
     # Get logs
     logs = dashboard.get_system_logs(log_lines)
     
-    # Filter by log level
+    # Filter by log level (parse_log_lines already stores levels lowercased)
     if log_level_filter != "All":
-        logs = [log for log in logs if log['level'].lower() == log_level_filter.lower()]
+        level_key = log_level_filter.lower()
+        logs = [log for log in logs if log['level'] == level_key]
     
     if not logs:
         st.warning("🔍 No logs found matching the current filters.")
@@ -923,74 +1197,30 @@ def render_logs_viewer(dashboard):
     
     log_container = st.container()
     with log_container:
-        log_html = '<div class="log-container">'
-        
-        for log in logs:
-            level_class = f"log-level-{log['level']}"
-            timestamp_formatted = log['timestamp']
-            message_escaped = log['message'].replace('<', '&lt;').replace('>', '&gt;')
-            
-            log_html += f"""
-            <div class="log-entry">
-                <span class="log-timestamp">[{timestamp_formatted}]</span>
-                <span class="{level_class}">[{log['level'].upper()}]</span>
-                <span>{message_escaped}</span>
-            </div>
-            """
-        
-        log_html += '</div>'
+        entries_html = ''.join(LOG_ENTRY_TEMPLATE.format_map(log) for log in logs)
+        log_html = f'<div class="log-container">{entries_html}</div>'
         st.markdown(log_html, unsafe_allow_html=True)
     
     # Log statistics
     st.markdown("**📊 Log Summary:**")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    level_counts = {}
-    for log in logs:
-        level = log['level']
-        level_counts[level] = level_counts.get(level, 0) + 1
-    
-    with col1:
-        error_count = level_counts.get('error', 0)
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">🚨 Errors</div>
-            <div class="metric-value" style="color: var(--color-danger);">{error_count}</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        warning_count = level_counts.get('warning', 0)
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">⚠️ Warnings</div>
-            <div class="metric-value" style="color: var(--color-warning);">{warning_count}</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        info_count = level_counts.get('info', 0)
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">ℹ️ Info</div>
-            <div class="metric-value" style="color: var(--color-accent);">{info_count}</div>
-        </div>
-        """, unsafe_allow_html=True)
+    level_counts = Counter(log['level'] for log in logs)
     
-    with col4:
-        success_count = level_counts.get('success', 0)
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-title">SUCCESS: Success</div>
-            <div class="metric-value" style="color: var(--color-success);">{success_count}</div>
-        </div>
-        """, unsafe_allow_html=True)
+    cards_html = ''.join(
+        LOG_SUMMARY_CARD_TEMPLATE.format_map({
+            'title': title,
+            'color': color,
+            'value': level_counts.get(level, 0)
+        })
+        for level, title, color in LOG_SUMMARY_CARDS
+    )
+    st.markdown(f'<div class="metric-grid" style="grid-template-columns: repeat(4, 1fr);">{cards_html}</div>',
+                unsafe_allow_html=True)
     
     # Export functionality
     if st.button("📤 Export Current View"):
         filtered_log_text = "\n".join([
-            f"[{log['timestamp']}] {log['level'].upper()}: {log['message']}" 
+            f"[{log['timestamp']}] {log['level_upper']}: {log['message']}" 
             for log in logs
         ])
         
@@ -1097,6 +1327,7 @@ def render_prompt_management(dashboard):
         4. **Backup**: Keep copies of working prompts before major changes
         """)
 
+@st.fragment
 def render_system_status(dashboard):
     """Render system status and monitoring with real component checking"""
     st.markdown('<div class="section-header">⚙️ System Status</div>', unsafe_allow_html=True)
@@ -1109,19 +1340,18 @@ def render_system_status(dashboard):
     with col1:
         st.markdown("**🔧 System Components:**")
         
-        for component_key, component_data in components.items():
-            status_class = f"status-{component_data['status']}"
-            status_icon = "●" if component_data['status'] == 'active' else "○"
-            
-            st.markdown(f"""
-            <div class="component-row">
-                <div>
-                    <div class="component-name">{component_data['name']}</div>
-                    <div class="component-description">{component_data['description']}</div>
-                </div>
-                <span class="status-badge {status_class}">{status_icon} {component_data['status']}</span>
-            </div>
-            """, unsafe_allow_html=True)
+        rows_html = ''.join(
+            COMPONENT_ROW_TEMPLATE.format_map({
+                'name': component_data['name'],
+                'description': component_data['description'],
+                'badge': STATUS_BADGE_TEMPLATE.format_map({
+                    'status': component_data['status'],
+                    'icon': STATUS_ICONS.get(component_data['status'], '○')
+                })
+            })
+            for component_data in components.values()
+        )
+        st.markdown(rows_html, unsafe_allow_html=True)
     
     with col2:
         st.markdown("**📅 Automation Schedule:**")
@@ -1133,15 +1363,11 @@ def render_system_status(dashboard):
             ("📡 Reply Monitoring", "24/7 Real-time")
         ]
         
-        for task, schedule in schedule_items:
-            st.markdown(f"""
-            <div class="component-row">
-                <div>
-                    <div class="component-name">{task}</div>
-                    <div class="component-description">{schedule}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        schedule_html = ''.join(
+            COMPONENT_ROW_TEMPLATE.format_map({'name': task, 'description': schedule, 'badge': ''})
+            for task, schedule in schedule_items
+        )
+        st.markdown(schedule_html, unsafe_allow_html=True)
     
     # Quick actions
     st.markdown("**⚡ Quick Actions:**")
@@ -1150,7 +1376,9 @@ def render_system_status(dashboard):
     
     with col1:
         if st.button("🔄 Refresh Status"):
-            st.cache_data.clear()
+            # Only the status caches; sheet data keeps its own TTL
+            AdminDashboard.check_component_status_cached.clear()
+            AdminDashboard.get_system_logs_cached.clear()
             st.success("SUCCESS: System status refreshed!")
             st.rerun()
     
@@ -1166,7 +1394,7 @@ def render_system_status(dashboard):
         if st.button("📋 Export Logs"):
             logs = dashboard.get_system_logs(500)
             if logs:
-                log_text = "\n".join([f"[{log['timestamp']}] {log['level'].upper()}: {log['message']}" for log in logs])
+                log_text = "\n".join([f"[{log['timestamp']}] {log['level_upper']}: {log['message']}" for log in logs])
                 st.download_button(
                     label="📥 Download Logs",
                     data=log_text,
@@ -1236,6 +1464,8 @@ def render_email_accounts_management():
                         if not account.get('is_active'):
                             if st.button(f"🔄 Activate", key=f"activate_{account['id']}"):
                                 if email_manager.set_active_account(account['id']):
+                                    # The automation runs in this process; make it pick up the switch now
+                                    invalidate_email_config_cache()
                                     st.success(f"✅ Activated {account['email']}")
                                     st.rerun()
                                 else:
@@ -1342,7 +1572,7 @@ def main():
     dashboard = AdminDashboard()
     
     # Render header
-    render_header()
+    render_header(dashboard)
     
     # Sidebar navigation
     with st.sidebar:
@@ -1356,19 +1586,24 @@ def main():
         st.markdown("---")
         st.markdown("### 📈 Quick Stats")
         
-        # Load data for sidebar stats
-        with st.spinner("Loading data..."):
-            leads_df, categories_df = dashboard.load_google_sheets_data()
+        # Sidebar stats only need counts, not the full sheets
+        summary = dashboard.load_sheet_summary()
         
-        if not leads_df.empty:
-            st.metric("Total Leads", len(leads_df))
-            st.metric("Valid Emails", len(leads_df[leads_df['Valid Email'] != '']))
-            st.metric("Active Categories", len(categories_df))
+        if summary['n_leads']:
+            st.metric("Total Leads", summary['n_leads'])
+            st.metric("Valid Emails", summary['n_valid'])
+            st.metric("Active Categories", summary['n_categories'])
+    
+    # Only the Analytics and Leads tabs need the full lead data
+    if selected_tab in ("📊 Analytics", "👥 Leads"):
+        with st.spinner("Loading data..."):
+            leads_df, categories_df = dashboard.get_google_sheets_data()
     
     # Main content based on selected tab
     if selected_tab == "📊 Analytics":
-        render_overview_metrics(leads_df, categories_df)
-        render_performance_analytics(leads_df)
+        lead_counts = compute_lead_counts(leads_df)
+        render_overview_metrics(leads_df, categories_df, lead_counts)
+        render_performance_analytics(leads_df, lead_counts)
         render_campaign_performance(leads_df)
         
     elif selected_tab == "👥 Leads":
@@ -4,14 +4,66 @@ Automation Status Checker
 Shows real-time status of the Peekr automation engine
 """
 
+import io
 import os
+import re
 import sys
-import psutil
-import pytz
-from datetime import datetime, timedelta
+import argparse
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from config import Config
-import logging
-import json
+
+# Timezones resolved once at import
+UTC = timezone.utc
+try:
+    DUBAI_TZ = ZoneInfo(Config.TIMEZONE)
+except (ZoneInfoNotFoundError, ValueError):
+    DUBAI_TZ = UTC
+
+# Command lines that identify the automation engine and the Streamlit dashboard
+AUTOMATION_CMD_RE = re.compile(r'peekr_automation_master\.py|combined_app\.py')
+DASHBOARD_CMD_RE = re.compile(r'streamlit.*admin_dashboard\.py|admin_dashboard\.py.*streamlit')
+
+# Message count in an IMAP STATUS response
+IMAP_MESSAGES_RE = re.compile(rb'MESSAGES (\d+)')
+
+# Scheduled tasks as (name, weekday, hour, minute) in UTC (matching peekr_automation_master.py)
+SCHEDULED_TASKS = (
+    # Lead Generation (Email Fetching)
+    ('Lead Generation (Email Fetching)', 5, 20, 0),  # Saturday 20:00 UTC = Sunday 00:00 Dubai
+    ('Lead Generation (Email Fetching)', 1, 20, 0),  # Tuesday 20:00 UTC = Wednesday 00:00 Dubai
+    
+    # Email Outreach
+    ('Email Outreach', 0, 4, 0),  # Monday 04:00 UTC = Monday 08:00 Dubai
+    ('Email Outreach', 3, 4, 0),  # Thursday 04:00 UTC = Thursday 08:00 Dubai
+    
+    # Follow-up Campaigns
+    ('Follow-up Campaigns', 0, 7, 0),  # Monday 07:00 UTC = Monday 11:00 Dubai
+)
+
+TASK_EMOJIS = {
+    'Lead Generation (Email Fetching)': '📊',
+    'Email Outreach': '📧',
+    'Follow-up Campaigns': '🔄'
+}
+
+def tail_lines(path, max_lines, block_size=8192):
+    """Return the last max_lines lines of a file, reading backwards from the end"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        buffer = b''
+        # Read one extra newline so the first kept line is complete
+        while position > 0 and buffer.count(b'\n') <= max_lines:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            buffer = f.read(step) + buffer
+    
+    return buffer.decode('utf-8', errors='replace').splitlines()[-max_lines:]
 
 def get_server_time_info():
     """Get comprehensive time information"""
@@ -19,12 +71,11 @@ def get_server_time_info():
     print("=" * 50)
     
     # Current UTC time
-    utc_now = datetime.now(pytz.UTC)
+    utc_now = datetime.now(UTC)
     print(f"🌍 Current UTC time: {utc_now.strftime('%Y-%m-%d %H:%M:%S UTC')}")
     
     # Current Dubai time
-    dubai_tz = pytz.timezone(Config.TIMEZONE)
-    dubai_now = datetime.now(dubai_tz)
+    dubai_now = datetime.now(DUBAI_TZ)
     print(f"🇦🇪 Current Dubai time: {dubai_now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
     
     # Current local server time
@@ -38,54 +89,31 @@ def get_next_scheduled_runs():
     print("\n📅 NEXT SCHEDULED RUNS")
     print("=" * 50)
     
-    utc_now = datetime.now(pytz.UTC)
+    utc_now = datetime.now(UTC)
     
-    # Define scheduled tasks (matching peekr_automation_master.py)
-    scheduled_tasks = [
-        # Lead Generation (Email Fetching)
-        {'name': 'Lead Generation (Email Fetching)', 'day': 5, 'hour': 20, 'minute': 0},  # Saturday 20:00 UTC = Sunday 00:00 Dubai
-        {'name': 'Lead Generation (Email Fetching)', 'day': 1, 'hour': 20, 'minute': 0},  # Tuesday 20:00 UTC = Wednesday 00:00 Dubai
-        
-        # Email Outreach  
-        {'name': 'Email Outreach', 'day': 0, 'hour': 4, 'minute': 0},   # Monday 04:00 UTC = Monday 08:00 Dubai
-        {'name': 'Email Outreach', 'day': 3, 'hour': 4, 'minute': 0},   # Thursday 04:00 UTC = Thursday 08:00 Dubai
-        
-        # Follow-up Campaigns
-        {'name': 'Follow-up Campaigns', 'day': 0, 'hour': 7, 'minute': 0},  # Monday 07:00 UTC = Monday 11:00 Dubai
-    ]
+    # Weekday and midnight are the same for every task, so compute them once
+    now_weekday = utc_now.weekday()
+    today_midnight = utc_now.replace(hour=0, minute=0, second=0, microsecond=0)
     
     next_runs = {}
     
-    for task in scheduled_tasks:
-        # Calculate next occurrence
-        next_run_utc = get_next_occurrence(utc_now, task['day'], task['hour'], task['minute'])
-        
-        # Convert to Dubai time
-        dubai_tz = pytz.timezone(Config.TIMEZONE)
-        next_run_dubai = next_run_utc.astimezone(dubai_tz)
-        
-        # Calculate time remaining
-        time_remaining = next_run_utc - utc_now
-        
-        task_name = task['name']
+    for task_name, target_day, target_hour, target_minute in SCHEDULED_TASKS:
+        # Calculate next occurrence (0=Monday, ..., 6=Sunday)
+        days_ahead = (target_day - now_weekday) % 7
+        next_run_utc = today_midnight + timedelta(days=days_ahead, hours=target_hour, minutes=target_minute)
+        if next_run_utc <= utc_now:  # Target time already passed today
+            next_run_utc += timedelta(days=7)
         
         # Keep the earliest next run for each task type
         if task_name not in next_runs or next_run_utc < next_runs[task_name]['utc_time']:
             next_runs[task_name] = {
                 'utc_time': next_run_utc,
-                'dubai_time': next_run_dubai,
-                'time_remaining': time_remaining
+                'dubai_time': next_run_utc.astimezone(DUBAI_TZ),
+                'time_remaining': next_run_utc - utc_now
             }
     
-    # Display next runs with emojis
-    task_emojis = {
-        'Lead Generation (Email Fetching)': '📊',
-        'Email Outreach': '📧',
-        'Follow-up Campaigns': '🔄'
-    }
-    
     for task_name, info in next_runs.items():
-        emoji = task_emojis.get(task_name, '📋')
+        emoji = TASK_EMOJIS.get(task_name, '📋')
         print(f"\n{emoji} {task_name}:")
         print(f"   ⏰ Next run (Dubai): {info['dubai_time'].strftime('%A, %B %d at %I:%M %p %Z')}")
         print(f"   🌍 Next run (UTC): {info['utc_time'].strftime('%Y-%m-%d %H:%M:%S UTC')}")
@@ -97,46 +125,27 @@ def get_next_scheduled_runs():
         else:
             print(f"   ⏳ Time remaining: {format_duration(total_seconds)}")
 
-def get_next_occurrence(current_time, target_day, target_hour, target_minute):
-    """Calculate next occurrence of a weekly scheduled task"""
-    # target_day: 0=Monday, 1=Tuesday, ..., 6=Sunday
-    current_weekday = current_time.weekday()
-    
-    # Calculate days until target day
-    days_ahead = target_day - current_weekday
-    if days_ahead < 0:  # Target day already happened this week
-        days_ahead += 7
-    elif days_ahead == 0:  # Target day is today
-        # Check if target time has already passed today
-        target_time_today = current_time.replace(hour=target_hour, minute=target_minute, second=0, microsecond=0)
-        if current_time >= target_time_today:
-            days_ahead = 7  # Next occurrence is next week
-    
-    next_occurrence = current_time + timedelta(days=days_ahead)
-    next_occurrence = next_occurrence.replace(hour=target_hour, minute=target_minute, second=0, microsecond=0)
-    
-    return next_occurrence
-
+@functools.lru_cache(maxsize=256)
 def format_duration(seconds):
     """Format duration in human readable format"""
+    # One divmod chain instead of separate // and % per unit
+    minutes, _ = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    
     if seconds < 60:
         return f"{seconds} seconds"
     elif seconds < 3600:
-        minutes = seconds // 60
         return f"{minutes} minutes"
     elif seconds < 86400:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
         return f"{hours}h {minutes}m"
     else:
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
         return f"{days}d {hours}h"
 
-def check_process_running():
-    """Check if automation processes are running"""
-    print("\n🔍 PROCESS STATUS")
-    print("=" * 50)
+@functools.lru_cache(maxsize=1)
+def scan_processes():
+    """Walk the process table once and classify automation and dashboard processes"""
+    import psutil  # Imported lazily; only the process checks need it
     
     automation_processes = []
     dashboard_processes = []
@@ -145,30 +154,32 @@ def check_process_running():
         try:
             cmdline = ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else ''
             
-            # Check for automation processes
-            if any(script in cmdline for script in [
-                'peekr_automation_master.py',
-                'combined_app.py'
-            ]):
-                automation_processes.append({
-                    'pid': proc.info['pid'],
-                    'name': proc.info['name'],
-                    'cmdline': cmdline,
-                    'uptime': datetime.now() - datetime.fromtimestamp(proc.info['create_time'])
-                })
+            if AUTOMATION_CMD_RE.search(cmdline):
+                target = automation_processes
+            elif DASHBOARD_CMD_RE.search(cmdline):
+                target = dashboard_processes
+            else:
+                continue
             
-            # Check for dashboard processes
-            elif 'streamlit' in cmdline and 'admin_dashboard.py' in cmdline:
-                dashboard_processes.append({
-                    'pid': proc.info['pid'],
-                    'name': proc.info['name'],
-                    'cmdline': cmdline,
-                    'uptime': datetime.now() - datetime.fromtimestamp(proc.info['create_time'])
-                })
+            target.append({
+                'pid': proc.info['pid'],
+                'name': proc.info['name'],
+                'cmdline': cmdline,
+                'uptime': datetime.now() - datetime.fromtimestamp(proc.info['create_time'])
+            })
                 
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
     
+    return automation_processes, dashboard_processes
+
+def check_process_running():
+    """Check if automation processes are running"""
+    print("\n🔍 PROCESS STATUS")
+    print("=" * 50)
+    
+    automation_processes, dashboard_processes = scan_processes()
+    
     # Display automation processes
     if automation_processes:
         print("✅ AUTOMATION ENGINE STATUS: RUNNING")
@@ -197,9 +208,7 @@ def check_log_files():
     if os.path.exists(log_file):
         try:
             # Get last 10 lines of log file
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                recent_lines = lines[-10:] if len(lines) >= 10 else lines
+            recent_lines = tail_lines(log_file, 10)
             
             if recent_lines:
                 print(f"📄 Last {len(recent_lines)} log entries from {log_file}:")
@@ -227,22 +236,13 @@ def check_email_monitoring_stats():
     print("=" * 50)
     
     # Check if automation engine is running (reply monitoring runs within it)
-    automation_running = False
-    try:
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time']):
-            try:
-                cmdline = ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else ''
-                if 'peekr_automation_master.py' in cmdline or 'combined_app.py' in cmdline:
-                    automation_running = True
-                    uptime = datetime.now() - datetime.fromtimestamp(proc.info['create_time'])
-                    print(f"✅ Reply monitoring engine: RUNNING")
-                    print(f"   🤖 Process: {proc.info['name']} (PID {proc.info['pid']})")
-                    print(f"   ⏰ Uptime: {format_duration(int(uptime.total_seconds()))}")
-                    break
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-    except Exception:
-        pass
+    automation_processes, _ = scan_processes()
+    automation_running = bool(automation_processes)
+    if automation_running:
+        proc = automation_processes[0]
+        print(f"✅ Reply monitoring engine: RUNNING")
+        print(f"   🤖 Process: {proc['name']} (PID {proc['pid']})")
+        print(f"   ⏰ Uptime: {format_duration(int(proc['uptime'].total_seconds()))}")
     
     if not automation_running:
         print("❌ Reply monitoring engine: NOT RUNNING")
@@ -261,12 +261,15 @@ def check_email_monitoring_stats():
         # Test IMAP connection
         mail = imaplib.IMAP4_SSL(Config.IMAP_SERVER, Config.IMAP_PORT)
         mail.login(Config.EMAIL_ACCOUNT, Config.EMAIL_PASSWORD)
-        mail.select("inbox")
         
-        # Get recent emails count
-        result, data = mail.search(None, "ALL")
+        # Get the inbox message count from STATUS rather than listing every id
+        result, data = mail.status("INBOX", "(MESSAGES)")
+        
+        # EXAMINE (read-only select) so the date search below never touches flags
+        mail.select("inbox", readonly=True)
+        
         if result == 'OK':
-            email_count = len(data[0].split())
+            email_count = int(IMAP_MESSAGES_RE.search(data[0]).group(1))
             print(f"✅ Email server connectivity: ACTIVE")
             print(f"   📧 Total emails in inbox: {email_count}")
             print(f"   🔗 Connected to: {Config.IMAP_SERVER}:{Config.IMAP_PORT}")
@@ -318,16 +321,14 @@ def check_reply_monitoring_logs():
         
         recent_monitoring_activity = []
         
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-            # Check last 50 lines for monitoring activity
-            recent_lines = lines[-50:] if len(lines) >= 50 else lines
-            
-            for line in recent_lines:
-                for keyword in monitoring_keywords:
-                    if keyword.lower() in line.lower():
-                        recent_monitoring_activity.append(line.strip())
-                        break
+        # Check last 50 lines for monitoring activity
+        recent_lines = tail_lines(log_file, 50)
+        
+        for line in recent_lines:
+            for keyword in monitoring_keywords:
+                if keyword.lower() in line.lower():
+                    recent_monitoring_activity.append(line.strip())
+                    break
         
         if recent_monitoring_activity:
             print(f"✅ Recent monitoring activity found ({len(recent_monitoring_activity)} entries):")
@@ -375,8 +376,9 @@ def check_google_sheets_connectivity():
         # Check worksheets
         try:
             incoming_leads = sheet.worksheet("Incoming Leads")
-            data = incoming_leads.get_all_records()
-            print(f"   📋 'Incoming Leads' worksheet: {len(data)} records")
+            # Count records from a single column instead of downloading the whole grid
+            record_count = max(len(incoming_leads.col_values(1)) - 1, 0)
+            print(f"   📋 'Incoming Leads' worksheet: {record_count} records")
         except:
             print("   ⚠️ 'Incoming Leads' worksheet: NOT ACCESSIBLE")
             
@@ -384,28 +386,58 @@ def check_google_sheets_connectivity():
         print(f"❌ Google Sheets connectivity: FAILED")
         print(f"   Error: {e}")
 
-def main():
-    """Run complete automation status check"""
-    print("🚀 PEEKR AUTOMATION STATUS CHECKER")
-    print("=" * 60)
-    
-    # Get time information
-    get_server_time_info()
+class ThreadLocalStdout(io.TextIOBase):
+    """sys.stdout proxy that sends each worker thread's prints to its own buffer"""
     
-    # Check process status
-    check_process_running()
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
     
-    # Get next scheduled runs
-    get_next_scheduled_runs()
+    def write(self, text):
+        return getattr(self.local, 'buffer', self.stream).write(text)
     
-    # Check log files
-    check_log_files()
+    def flush(self):
+        self.stream.flush()
+
+def run_captured(stdout_proxy, check):
+    """Run a status check with its output captured; returns the printed text"""
+    stdout_proxy.local.buffer = io.StringIO()
+    try:
+        check()
+    except Exception as e:
+        print(f"❌ {check.__name__} failed: {e}")
+    finally:
+        output = stdout_proxy.local.buffer.getvalue()
+        del stdout_proxy.local.buffer
+    return output
+
+def run_checks_concurrently(checks):
+    """Run independent checks in parallel (IMAP and Sheets are network-bound) and
+    print their output in the given order"""
+    stdout_proxy = ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout_proxy
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(run_captured, stdout_proxy, check) for check in checks]
+            outputs = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout_proxy.stream
+    
+    for output in outputs:
+        sys.stdout.write(output)
+
+def main(only=None):
+    """Run complete automation status check (or a single section with only=...)"""
+    print("🚀 PEEKR AUTOMATION STATUS CHECKER")
+    print("=" * 60)
     
-    # Check email monitoring
-    check_email_monitoring_stats()
+    if only:
+        SECTIONS[only]()
+        return
     
-    # Check Google Sheets
-    check_google_sheets_connectivity()
+    # Time info, process status, next scheduled runs, log files, email monitoring
+    # and Google Sheets are independent, so run them together
+    run_checks_concurrently(SECTIONS.values())
     
     print("\n" + "=" * 60)
     print("📊 STATUS CHECK COMPLETE")
@@ -415,19 +447,9 @@ def main():
     print("\n💡 RECOMMENDATIONS:")
     print("-" * 30)
     
-    # Check if automation is running (with error handling)
-    automation_running = False
-    try:
-        for proc in psutil.process_iter(['cmdline']):
-            try:
-                cmdline = proc.info['cmdline']
-                if cmdline and ('peekr_automation_master.py' in str(cmdline) or 'combined_app.py' in str(cmdline)):
-                    automation_running = True
-                    break
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-    except Exception:
-        pass
+    # Reuse the process scan from check_process_running
+    automation_processes, _ = scan_processes()
+    automation_running = bool(automation_processes)
     
     if not automation_running:
         print("❌ CRITICAL: Automation engine is not running!")
@@ -450,5 +472,17 @@ def main():
     print("\n🔄 Run this script regularly to monitor your automation status!")
     print("💡 The reply monitoring runs 24/7 as part of the main automation engine")
 
+# Individually runnable sections for --only
+SECTIONS = {
+    'time': get_server_time_info,
+    'processes': check_process_running,
+    'schedule': get_next_scheduled_runs,
+    'logs': check_log_files,
+    'email': check_email_monitoring_stats,
+    'sheets': check_google_sheets_connectivity
+}
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Show the status of the Peekr automation engine")
+    parser.add_argument('--only', choices=SECTIONS, help="run a single section instead of the full check")
+    main(parser.parse_args().only)
@@ -7,8 +7,6 @@ Runs both automation engine and dashboard in one service
 import os
 import sys
 import threading
-import subprocess
-import time
 import signal
 import logging
 
@@ -19,7 +17,7 @@ logger = logging.getLogger(__name__)
 class CombinedApp:
     def __init__(self):
         self.automation_process = None
-        self.dashboard_process = None
+        self.automation_ready = threading.Event()
         self.running = True
         
         # Register signal handlers for graceful shutdown
@@ -30,7 +28,6 @@ class CombinedApp:
         """Handle shutdown signals"""
         logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
-        self.stop_processes()
         sys.exit(0)
     
     def start_automation_engine(self):
@@ -40,8 +37,9 @@ class CombinedApp:
             # Import and run automation directly to avoid subprocess overhead
             from peekr_automation_master import PeekrAutomationMaster
             
-            # Use a flag to track successful initialization
-            automation_success = threading.Event()
+            # Use a flag to track successful initialization; run() proceeds as soon
+            # as it is set instead of sleeping a fixed amount
+            automation_success = self.automation_ready
             automation_error = threading.Event()
             error_message = None
             
@@ -78,65 +76,32 @@ class CombinedApp:
             return False
     
     def start_dashboard(self):
-        """Start the Streamlit dashboard"""
+        """Run the Streamlit dashboard in this process (blocks until the server stops)"""
         try:
             logger.info("📊 Starting admin dashboard...")
+            from streamlit.web import bootstrap
             
             # Get port from environment (Digital Ocean sets this)
             port = os.getenv('PORT', '8501')
             
-            # Start Streamlit dashboard
-            cmd = [
-                sys.executable, '-m', 'streamlit', 'run', 
-                'admin_dashboard.py',
-                '--server.port', str(port),
-                '--server.address', '0.0.0.0',
-                '--server.headless', 'true',
-                '--server.enableCORS', 'false',
-                '--server.enableXsrfProtection', 'false'
-            ]
+            flag_options = {
+                'server.port': int(port),
+                'server.address': '0.0.0.0',
+                'server.headless': True,
+                'server.enableCORS': False,
+                'server.enableXsrfProtection': False
+            }
+            bootstrap.load_config_options(flag_options=flag_options)
             
-            self.dashboard_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
-            )
-            
-            logger.info(f"✅ Dashboard started on port {port}")
+            logger.info(f"✅ Dashboard starting on port {port}")
+            # Streamlit installs its own signal handlers, so it has to own the main thread
+            bootstrap.run('admin_dashboard.py', False, [], flag_options)
             return True
             
         except Exception as e:
             logger.error(f"❌ Failed to start dashboard: {e}")
             return False
     
-    def stop_processes(self):
-        """Stop all running processes"""
-        if self.dashboard_process:
-            logger.info("🛑 Stopping dashboard...")
-            self.dashboard_process.terminate()
-            try:
-                self.dashboard_process.wait(timeout=10)
-            except subprocess.TimeoutExpired:
-                self.dashboard_process.kill()
-    
-    def monitor_dashboard(self):
-        """Monitor dashboard process and log output"""
-        if not self.dashboard_process:
-            return
-        
-        try:
-            while self.running and self.dashboard_process.poll() is None:
-                output = self.dashboard_process.stdout.readline()
-                if output:
-                    # Log dashboard output (remove newlines and streamlit noise)
-                    line = output.strip()
-                    if line and not any(noise in line.lower() for noise in ['collecting usage statistics', 'you can now view your streamlit app']):
-                        logger.info(f"📊 Dashboard: {line}")
-                time.sleep(0.1)
-        except Exception as e:
-            logger.error(f"Error monitoring dashboard: {e}")
-    
     def run(self):
         """Run the combined application"""
         logger.info("🚀 Starting Peekr B2B Automation (Combined Mode)")
@@ -147,26 +112,16 @@ class CombinedApp:
             logger.error("❌ Failed to start automation engine")
             return 1
         
-        # Give automation time to initialize
-        time.sleep(5)
-        
-        # Start dashboard
-        if not self.start_dashboard():
-            logger.error("❌ Failed to start dashboard")
-            return 1
-        
-        logger.info("✅ Both services started successfully!")
-        logger.info("📊 Dashboard accessible via web interface")
         logger.info("🤖 Automation engine running in background")
         logger.info("🔄 Press Ctrl+C to stop all services")
         
-        # Monitor dashboard output
+        # Serve the dashboard from this process; returns when the server stops
         try:
-            self.monitor_dashboard()
+            if not self.start_dashboard():
+                logger.error("❌ Failed to start dashboard")
+                return 1
         except KeyboardInterrupt:
             logger.info("🛑 Received interrupt signal")
-        finally:
-            self.stop_processes()
         
         return 0
 
@@ -1,10 +1,19 @@
 import os
+import functools
+from types import MappingProxyType
 from dotenv import load_dotenv
-from email_accounts_manager import EmailAccountsManager
 
 # Load environment variables
 load_dotenv()
 
+# Email accounts file managed by EmailAccountsManager
+EMAIL_ACCOUNTS_FILE = 'email_accounts.json'
+
+# Settings validate_config requires, and the email settings needed when no
+# account is active in the JSON file
+REQUIRED_CONFIG_VARS = frozenset(('OPENAI_API_KEY', 'SPREADSHEET_ID'))
+EMAIL_ENV_VARS = ('EMAIL_ACCOUNT', 'EMAIL_PASSWORD', 'SENDER_NAME')
+
 class Config:
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
@@ -40,83 +49,94 @@ class Config:
     @classmethod
     def get_active_email_config(cls):
         """Get active email account configuration from JSON file"""
+        # Re-read the accounts file only when its mtime/size changes
         try:
-            email_manager = EmailAccountsManager()
-            active_account = email_manager.get_active_account()
-            
-            if active_account:
-                return {
-                    'EMAIL_ACCOUNT': active_account['email'],
-                    'EMAIL_PASSWORD': active_account['password'],
-                    'SMTP_SERVER': active_account['smtp_server'],
-                    'SMTP_PORT': active_account['smtp_port'],
-                    'IMAP_SERVER': active_account['imap_server'],
-                    'IMAP_PORT': active_account['imap_port'],
-                    'SENDER_NAME': active_account['name'],
-                    'SENDER_EMAIL': active_account['email']
-                }
-            else:
-                # Fallback to environment variables if no active account
-                return {
-                    'EMAIL_ACCOUNT': cls.EMAIL_ACCOUNT,
-                    'EMAIL_PASSWORD': cls.EMAIL_PASSWORD,
-                    'SMTP_SERVER': cls.SMTP_SERVER,
-                    'SMTP_PORT': cls.SMTP_PORT,
-                    'IMAP_SERVER': cls.IMAP_SERVER,
-                    'IMAP_PORT': cls.IMAP_PORT,
-                    'SENDER_NAME': cls.SENDER_NAME,
-                    'SENDER_EMAIL': cls.SENDER_EMAIL
-                }
-        except Exception as e:
-            print(f"⚠️ Error loading active email config: {e}")
-            # Fallback to environment variables
-            return {
-                'EMAIL_ACCOUNT': cls.EMAIL_ACCOUNT,
-                'EMAIL_PASSWORD': cls.EMAIL_PASSWORD,
-                'SMTP_SERVER': cls.SMTP_SERVER,
-                'SMTP_PORT': cls.SMTP_PORT,
-                'IMAP_SERVER': cls.IMAP_SERVER,
-                'IMAP_PORT': cls.IMAP_PORT,
-                'SENDER_NAME': cls.SENDER_NAME,
-                'SENDER_EMAIL': cls.SENDER_EMAIL
-            }
+            stat = os.stat(EMAIL_ACCOUNTS_FILE)
+            accounts_key = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            accounts_key = None
+        return _load_active_email_config(accounts_key)
+    
+    @classmethod
+    def get_env_email_config(cls):
+        """Email configuration from environment variables"""
+        return {
+            'EMAIL_ACCOUNT': cls.EMAIL_ACCOUNT,
+            'EMAIL_PASSWORD': cls.EMAIL_PASSWORD,
+            'SMTP_SERVER': cls.SMTP_SERVER,
+            'SMTP_PORT': cls.SMTP_PORT,
+            'IMAP_SERVER': cls.IMAP_SERVER,
+            'IMAP_PORT': cls.IMAP_PORT,
+            'SENDER_NAME': cls.SENDER_NAME,
+            'SENDER_EMAIL': cls.SENDER_EMAIL
+        }
     
     @classmethod
     def validate_config(cls):
         """Validate that all required environment variables are set"""
         # Core required variables
-        required_vars = ['OPENAI_API_KEY', 'SPREADSHEET_ID']
-        
-        missing_vars = []
-        for var in required_vars:
-            if not getattr(cls, var):
-                missing_vars.append(var)
+        values = {var: getattr(cls, var, None) for var in REQUIRED_CONFIG_VARS}
+        missing_vars = {var for var, value in values.items() if not value}
         
         # Check for Google credentials (either file or JSON)
         if not cls.GOOGLE_CREDENTIALS_FILE and not cls.GOOGLE_CREDENTIALS_JSON:
-            missing_vars.append('GOOGLE_CREDENTIALS_JSON (or GOOGLE_CREDENTIALS_FILE)')
+            missing_vars.add('GOOGLE_CREDENTIALS_JSON (or GOOGLE_CREDENTIALS_FILE)')
         
         # Check for email configuration (either from JSON file or environment variables)
         try:
-            email_manager = EmailAccountsManager()
-            active_account = email_manager.get_active_account()
-            
-            if not active_account:
-                # No active account in JSON, check environment variables
-                email_env_vars = ['EMAIL_ACCOUNT', 'EMAIL_PASSWORD', 'SENDER_NAME']
-                for var in email_env_vars:
-                    if not getattr(cls, var):
-                        missing_vars.append(f"{var} (or configure email account in JSON)")
-                        break  # Only report once that email config is missing
-        except:
-            # JSON file doesn't exist or has issues, check environment variables
-            email_env_vars = ['EMAIL_ACCOUNT', 'EMAIL_PASSWORD', 'SENDER_NAME']
-            for var in email_env_vars:
-                if not getattr(cls, var):
-                    missing_vars.append(f"{var} (or configure email account in JSON)")
-                    break  # Only report once that email config is missing
+            from email_accounts_manager import EmailAccountsManager
+            active_account = EmailAccountsManager(EMAIL_ACCOUNTS_FILE).get_active_account()
+        except Exception:
+            # JSON file doesn't exist or has issues
+            active_account = None
+        
+        if not active_account:
+            missing_vars |= {f"{var} (or configure email account in JSON)"
+                             for var in EMAIL_ENV_VARS if not getattr(cls, var, None)}
         
         if missing_vars:
-            raise ValueError(f"Missing required configuration: {', '.join(missing_vars)}")
+            raise ValueError(f"Missing required configuration: {', '.join(sorted(missing_vars))}")
         
-        return True 
\ No newline at end of file
+        return True 
+
+@functools.lru_cache(maxsize=4)
+def _load_active_email_config(accounts_key):
+    """Build the active email config; cached per accounts file (mtime, size) key.
+    Returns a read-only mapping since the result is shared between callers."""
+    try:
+        from email_accounts_manager import EmailAccountsManager
+        email_manager = EmailAccountsManager(EMAIL_ACCOUNTS_FILE)
+        active_account = email_manager.get_active_account()
+        
+        if active_account:
+            config = {
+                'EMAIL_ACCOUNT': active_account['email'],
+                'EMAIL_PASSWORD': active_account['password'],
+                'SMTP_SERVER': active_account['smtp_server'],
+                'SMTP_PORT': active_account['smtp_port'],
+                'IMAP_SERVER': active_account['imap_server'],
+                'IMAP_PORT': active_account['imap_port'],
+                'SENDER_NAME': active_account['name'],
+                'SENDER_EMAIL': active_account['email']
+            }
+        else:
+            # Fallback to environment variables if no active account
+            config = Config.get_env_email_config()
+    except Exception as e:
+        print(f"⚠️ Error loading active email config: {e}")
+        # Fallback to environment variables
+        config = Config.get_env_email_config()
+    
+    return MappingProxyType(config)
+
+def invalidate_email_config_cache():
+    """Drop the cached active email config, e.g. right after rotating accounts"""
+    _load_active_email_config.cache_clear()
+
+def __getattr__(name):
+    # EmailAccountsManager used to be imported at module level; keep
+    # `from config import EmailAccountsManager` working without the eager import
+    if name == 'EmailAccountsManager':
+        from email_accounts_manager import EmailAccountsManager
+        return EmailAccountsManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,25 +7,29 @@ This script helps handle Google Service Account credentials securely
 import os
 import json
 import base64
-import gspread
-from google.oauth2.service_account import Credentials
+import functools
+import threading
 from config import Config
 
+# Scopes for the service account
+SCOPES = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
+
+# Authorized client shared by every caller in the process
+_client = None
+_client_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _decode_credentials(encoded):
+    """Decode base64 encoded service account JSON; raises on bad input so failures aren't cached"""
+    return json.loads(base64.b64decode(encoded))
+
 def create_credentials_from_env():
-    """Create credentials from environment variable (base64 encoded JSON)"""
+    """Decode service account info from environment variable (base64 encoded JSON), once"""
     try:
         # ONLY use environment variable - no file fallback
         if Config.GOOGLE_CREDENTIALS_JSON:
-            # Decode base64 JSON
-            credentials_json = base64.b64decode(Config.GOOGLE_CREDENTIALS_JSON).decode('utf-8')
-            credentials_data = json.loads(credentials_json)
-            
-            # Create temporary credentials file
-            temp_cred_file = '/tmp/credentials.json'
-            with open(temp_cred_file, 'w') as f:
-                json.dump(credentials_data, f)
-            
-            return temp_cred_file
+            # Decode base64 JSON and keep it in memory (no temporary credentials file)
+            return _decode_credentials(Config.GOOGLE_CREDENTIALS_JSON)
         
         else:
             raise FileNotFoundError("GOOGLE_CREDENTIALS_JSON environment variable not found")
@@ -35,17 +39,27 @@ def create_credentials_from_env():
         return None
 
 def get_google_sheets_client():
-    """Get authenticated Google Sheets client"""
+    """Get authenticated Google Sheets client (authorized once, then reused)"""
+    global _client
+    if _client is not None:
+        return _client
+    
     try:
-        credentials_file = create_credentials_from_env()
-        if not credentials_file:
-            raise Exception("No credentials file available")
-        
-        scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-        creds = Credentials.from_service_account_file(credentials_file, scopes=scope)
-        client = gspread.authorize(creds)
+        with _client_lock:
+            if _client is None:
+                credentials_info = create_credentials_from_env()
+                if not credentials_info:
+                    raise Exception("No credentials available")
+                
+                # Imported here so importing this module stays cheap for callers
+                # that never build a client
+                import gspread
+                from google.oauth2.service_account import Credentials
+                
+                creds = Credentials.from_service_account_info(credentials_info, scopes=SCOPES)
+                _client = gspread.authorize(creds)
         
-        return client
+        return _client
         
     except Exception as e:
         print(f"ERROR: Failed to create Google Sheets client: {e}")
@@ -4,20 +4,67 @@ Email Fetching Diagnostic Script
 Helps diagnose email fetching issues on the server
 """
 
+import io
 import os
+import ssl
 import sys
 import imaplib
 import socket
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config import Config
 
+# TLS context shared by every IMAP connection the diagnostics open
+IMAP_SSL_CONTEXT = ssl.create_default_context()
+IMAP_SSL_CONTEXT.set_alpn_protocols(['imap'])
+
+# Serializes lookups so the DNS and IMAP probes share a single resolution
+_resolve_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=8)
+def _getaddrinfo_cached(host, port):
+    return tuple((family, type_, proto, sockaddr) for family, type_, proto, _, sockaddr
+                 in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM,
+                                       flags=socket.AI_NUMERICSERV))
+
+def resolve_imap_server(host, port):
+    """Resolve host:port once per run; returns every (family, type, proto, sockaddr)"""
+    with _resolve_lock:
+        return _getaddrinfo_cached(host, str(port))
+
+class ResolvedIMAP4_SSL(imaplib.IMAP4_SSL):
+    """IMAP4_SSL that connects to already resolved addresses (trying each in turn,
+    like socket.create_connection), still verifying the certificate against the hostname"""
+    
+    def __init__(self, host, port, addrinfos, ssl_context=None):
+        self.addrinfos = addrinfos
+        super().__init__(host, port, ssl_context=ssl_context)
+    
+    def _create_socket(self, timeout=None):
+        error = None
+        for family, type_, proto, sockaddr in self.addrinfos:
+            sock = socket.socket(family, type_, proto)
+            try:
+                if timeout is not None:
+                    sock.settimeout(timeout)
+                sock.connect(sockaddr)
+            except OSError as e:
+                sock.close()
+                error = e
+                continue
+            return self.ssl_context.wrap_socket(sock, server_hostname=self.host)
+        raise error or OSError(f"getaddrinfo returned no addresses for {self.host}")
+
 def test_dns_resolution():
     """Test DNS resolution for IMAP server"""
     print("🔍 Testing DNS resolution...")
     try:
         imap_server = Config.IMAP_SERVER
-        ip = socket.gethostbyname(imap_server)
-        print(f"✅ DNS resolution successful: {imap_server} -> {ip}")
+        addrinfos = resolve_imap_server(imap_server, Config.IMAP_PORT)
+        addresses = ', '.join(dict.fromkeys(sockaddr[0] for *_, sockaddr in addrinfos))
+        print(f"✅ DNS resolution successful: {imap_server} -> {addresses}")
         return True
     except Exception as e:
         print(f"❌ DNS resolution failed: {e}")
@@ -27,24 +74,24 @@ def test_imap_connection():
     """Test IMAP connection"""
     print("🔍 Testing IMAP connection...")
     try:
-        mail = imaplib.IMAP4_SSL(Config.IMAP_SERVER, Config.IMAP_PORT)
+        # Reuse the address resolved by the DNS probe instead of looking it up again
+        addrinfos = resolve_imap_server(Config.IMAP_SERVER, Config.IMAP_PORT)
+        mail = ResolvedIMAP4_SSL(Config.IMAP_SERVER, Config.IMAP_PORT, addrinfos,
+                                 ssl_context=IMAP_SSL_CONTEXT)
         print(f"✅ IMAP connection successful to {Config.IMAP_SERVER}:{Config.IMAP_PORT}")
         
         # Test login
         mail.login(Config.EMAIL_ACCOUNT, Config.EMAIL_PASSWORD)
         print(f"✅ IMAP login successful for {Config.EMAIL_ACCOUNT}")
         
-        # Test inbox selection
-        mail.select("inbox")
-        print("✅ Inbox selection successful")
-        
-        # Check for emails
-        result, data = mail.search(None, "ALL")
+        # Test inbox selection (read-only). The SELECT response already carries the
+        # EXISTS count, so no SEARCH ALL round-trip is needed to count messages
+        result, data = mail.select("inbox", readonly=True)
         if result == 'OK':
-            email_ids = data[0].split()
-            print(f"✅ Found {len(email_ids)} emails in inbox")
+            print("✅ Inbox selection successful")
+            print(f"✅ Found {int(data[0])} emails in inbox")
         else:
-            print("⚠️ Could not search emails")
+            print("⚠️ Could not select inbox")
         
         mail.close()
         mail.logout()
@@ -92,11 +139,12 @@ def test_google_sheets_connection():
         sheet = gc.open_by_key(Config.SPREADSHEET_ID)
         print(f"✅ Google Sheets connection successful: {sheet.title}")
         
-        # Try to access worksheets
-        try:
-            incoming_leads = sheet.worksheet("Incoming Leads")
+        # Check worksheets against the titles from a single metadata request
+        meta = sheet.fetch_sheet_metadata(params={'fields': 'sheets.properties.title'})
+        titles = {s['properties']['title'] for s in meta.get('sheets', [])}
+        if "Incoming Leads" in titles:
             print("✅ 'Incoming Leads' worksheet accessible")
-        except:
+        else:
             print("⚠️ 'Incoming Leads' worksheet not found")
         
         return True
@@ -105,6 +153,32 @@ def test_google_sheets_connection():
         print(f"❌ Google Sheets connection failed: {e}")
         return False
 
+class ThreadLocalStdout(io.TextIOBase):
+    """sys.stdout proxy that sends each worker thread's prints to its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, text):
+        return getattr(self.local, 'buffer', self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+def run_captured(stdout_proxy, test_func):
+    """Run a diagnostic with its output captured; returns (passed, printed text)"""
+    stdout_proxy.local.buffer = io.StringIO()
+    try:
+        passed = test_func()
+    except Exception as e:
+        print(f"❌ {test_func.__name__} failed: {e}")
+        passed = False
+    finally:
+        output = stdout_proxy.local.buffer.getvalue()
+        del stdout_proxy.local.buffer
+    return passed, output
+
 def main():
     """Run all diagnostic tests"""
     print("🚀 PEEKR EMAIL FETCHING DIAGNOSTIC")
@@ -120,13 +194,25 @@ def main():
         ("Google Sheets", test_google_sheets_connection),
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
+    # The probes are independent network/DNS waits, so run them together and
+    # print each one's captured output in the original order
+    stdout_proxy = ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout_proxy
+    try:
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            futures = [executor.submit(run_captured, stdout_proxy, test_func) for _, test_func in tests]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout_proxy.stream
+    
+    passed = 0
+    for (test_name, _), (ok, output) in zip(tests, results):
         print(f"\n📋 {test_name}:")
         print("-" * 30)
-        if test_func():
+        sys.stdout.write(output)
+        if ok:
             passed += 1
         print()
     
@@ -5,25 +5,59 @@ Handles CRUD operations for email accounts used in outreach campaigns
 
 import json
 import os
+import time
+import functools
 from datetime import datetime
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+def now_iso() -> str:
+    """Current local time as an ISO string at one-second resolution; the string
+    is built once per second and reused by every call within it"""
+    return _iso_for_second(int(time.time()))
+
 class EmailAccountsManager:
     def __init__(self, accounts_file: str = "email_accounts.json"):
         self.accounts_file = accounts_file
         self.accounts = self.load_accounts()
+        self._rebuild_index()
+    
+    def _rebuild_index(self):
+        """Map account id -> position in self.accounts (first match wins, like the old scans),
+        lowercased email -> account id, and remember the active account id"""
+        self._id_to_index = {}
+        self._email_index = {}
+        self._active_id = None
+        for i, account in enumerate(self.accounts):
+            self._id_to_index.setdefault(account.get('id'), i)
+            self._email_index.setdefault(str(account.get('email', '')).lower(), account.get('id'))
+            if self._active_id is None and account.get('is_active', False):
+                self._active_id = account.get('id')
     
     def load_accounts(self) -> List[Dict]:
         """Load email accounts from JSON file"""
         try:
             if os.path.exists(self.accounts_file):
-                with open(self.accounts_file, 'r', encoding='utf-8') as file:
-                    accounts = json.load(file)
-                    logger.info(f"✅ Loaded {len(accounts)} email accounts")
-                    return accounts
+                if orjson is not None:
+                    with open(self.accounts_file, 'rb') as file:
+                        accounts = orjson.loads(file.read())
+                else:
+                    with open(self.accounts_file, 'r', encoding='utf-8') as file:
+                        accounts = json.load(file)
+                logger.info(f"✅ Loaded {len(accounts)} email accounts")
+                return accounts
             else:
                 logger.warning(f"📁 Email accounts file not found: {self.accounts_file}")
                 return []
@@ -34,31 +68,36 @@ class EmailAccountsManager:
     def save_accounts(self) -> bool:
         """Save email accounts to JSON file"""
         try:
-            with open(self.accounts_file, 'w', encoding='utf-8') as file:
-                json.dump(self.accounts, file, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(self.accounts_file, 'wb') as file:
+                    file.write(orjson.dumps(self.accounts, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(self.accounts_file, 'w', encoding='utf-8') as file:
+                    json.dump(self.accounts, file, indent=2, ensure_ascii=False)
             logger.info(f"💾 Saved {len(self.accounts)} email accounts")
             return True
         except Exception as e:
             logger.error(f"❌ Error saving email accounts: {e}")
             return False
     
-    def get_all_accounts(self) -> List[Dict]:
-        """Get all email accounts"""
-        return self.accounts.copy()
+    def get_all_accounts(self) -> Tuple[Dict, ...]:
+        """Get all email accounts (read-only view; use the update methods to change them)"""
+        return tuple(self.accounts)
+    
+    def _find(self, account_id: str) -> Optional[Dict]:
+        """Account dict for an id via the index, or None"""
+        i = self._id_to_index.get(account_id)
+        return self.accounts[i] if i is not None else None
     
-    def get_active_account(self) -> Optional[Dict]:
-        """Get the currently active email account"""
-        for account in self.accounts:
-            if account.get('is_active', False):
-                return account.copy()
-        return None
+    def get_active_account(self) -> Optional[Mapping]:
+        """Get the currently active email account (read-only mapping)"""
+        account = self._find(self._active_id)
+        return MappingProxyType(account) if account is not None else None
     
-    def get_account_by_id(self, account_id: str) -> Optional[Dict]:
-        """Get specific account by ID"""
-        for account in self.accounts:
-            if account.get('id') == account_id:
-                return account.copy()
-        return None
+    def get_account_by_id(self, account_id: str) -> Optional[Mapping]:
+        """Get specific account by ID (read-only mapping)"""
+        account = self._find(account_id)
+        return MappingProxyType(account) if account is not None else None
     
     def add_account(self, account_data: Dict) -> bool:
         """Add new email account"""
@@ -82,7 +121,15 @@ class EmailAccountsManager:
                 if field not in account_data or not account_data[field]:
                     raise ValueError(f"Missing required field: {field}")
             
+            email_key = account_data['email'].lower()
+            if email_key in self._email_index:
+                raise ValueError(f"Account already exists for {account_data['email']}")
+            
             self.accounts.append(account_data)
+            self._id_to_index.setdefault(account_data['id'], len(self.accounts) - 1)
+            self._email_index[email_key] = account_data['id']
+            if account_data['is_active'] and self._active_id is None:
+                self._active_id = account_data['id']
             self.save_accounts()
             logger.info(f"✅ Added new email account: {account_data['email']}")
             return True
@@ -94,16 +141,22 @@ class EmailAccountsManager:
     def update_account(self, account_id: str, updates: Dict) -> bool:
         """Update existing email account"""
         try:
-            for i, account in enumerate(self.accounts):
-                if account.get('id') == account_id:
-                    # Don't allow changing ID or created_at
-                    updates.pop('id', None)
-                    updates.pop('created_at', None)
-                    
-                    self.accounts[i].update(updates)
-                    self.save_accounts()
-                    logger.info(f"✅ Updated email account: {account_id}")
-                    return True
+            i = self._id_to_index.get(account_id)
+            if i is not None:
+                # Don't allow changing ID or created_at
+                updates.pop('id', None)
+                updates.pop('created_at', None)
+                
+                if 'email' in updates:
+                    self._email_index.pop(str(self.accounts[i].get('email', '')).lower(), None)
+                    self._email_index[str(updates['email']).lower()] = account_id
+                
+                self.accounts[i].update(updates)
+                if 'is_active' in updates:
+                    self._rebuild_index()
+                self.save_accounts()
+                logger.info(f"✅ Updated email account: {account_id}")
+                return True
             
             logger.warning(f"⚠️ Account not found: {account_id}")
             return False
@@ -115,10 +168,12 @@ class EmailAccountsManager:
     def delete_account(self, account_id: str) -> bool:
         """Delete email account"""
         try:
-            original_count = len(self.accounts)
-            self.accounts = [acc for acc in self.accounts if acc.get('id') != account_id]
+            i = self._id_to_index.get(account_id)
             
-            if len(self.accounts) < original_count:
+            if i is not None:
+                del self.accounts[i]
+                # Positions after the deleted account shift down
+                self._rebuild_index()
                 self.save_accounts()
                 logger.info(f"🗑️ Deleted email account: {account_id}")
                 return True
@@ -133,39 +188,38 @@ class EmailAccountsManager:
     def set_active_account(self, account_id: str) -> bool:
         """Set an account as active (deactivates others)"""
         try:
-            found = False
-            for account in self.accounts:
-                if account.get('id') == account_id:
-                    account['is_active'] = True
-                    account['status'] = 'active'
-                    account['last_used'] = datetime.now().isoformat()
-                    found = True
-                else:
-                    account['is_active'] = False
-                    account['status'] = 'inactive'
-            
-            if found:
-                self.save_accounts()
-                logger.info(f"✅ Set active email account: {account_id}")
-                return True
-            else:
+            target = self._find(account_id)
+            if target is None:
                 logger.warning(f"⚠️ Account not found: {account_id}")
                 return False
+            
+            for account in self.accounts:
+                account['is_active'] = False
+                account['status'] = 'inactive'
+            target['is_active'] = True
+            target['status'] = 'active'
+            target['last_used'] = now_iso()
+            self._active_id = account_id
+            
+            self.save_accounts()
+            logger.info(f"✅ Set active email account: {account_id}")
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Error setting active account: {e}")
             return False
     
-    def increment_sent_count(self, account_id: str) -> bool:
-        """Increment sent emails count for today"""
+    def increment_sent_count(self, account_id: str, last_used: Optional[str] = None) -> bool:
+        """Increment sent emails count for today; batch senders can pass one
+        last_used timestamp for the whole batch"""
         try:
-            for account in self.accounts:
-                if account.get('id') == account_id:
-                    account['sent_today'] = account.get('sent_today', 0) + 1
-                    account['last_used'] = datetime.now().isoformat()
-                    self.save_accounts()
-                    return True
-            return False
+            account = self._find(account_id)
+            if account is None:
+                return False
+            account['sent_today'] = account.get('sent_today', 0) + 1
+            account['last_used'] = last_used or now_iso()
+            self.save_accounts()
+            return True
         except Exception as e:
             logger.error(f"❌ Error incrementing sent count: {e}")
             return False
@@ -6,8 +6,14 @@ This script converts your credentials.json to a base64 string for secure deploym
 
 import json
 import base64
+import mmap
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def encode_credentials_file(file_path):
     """Encode credentials file to base64 string"""
     try:
@@ -15,12 +21,15 @@ def encode_credentials_file(file_path):
             print(f"❌ File not found: {file_path}")
             return None
         
-        with open(file_path, 'r') as f:
-            credentials_data = json.load(f)
-        
-        # Convert to JSON string then to base64
-        json_string = json.dumps(credentials_data)
-        encoded_string = base64.b64encode(json_string.encode('utf-8')).decode('utf-8')
+        # The file is already JSON: make sure it parses, then base64 the bytes as-is
+        # (no re-serialization). Both work straight off a read-only mapping of the file
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    orjson.loads(view)
+            else:
+                json.loads(mm[:])
+            encoded_string = base64.b64encode(mm).decode('ascii')
         
         print(f"✅ Successfully encoded {file_path}")
         print("\n🔐 Base64 Encoded Credentials:")
@@ -0,0 +1,187 @@
+"""
+IMAP Connection Pool
+Keeps authenticated IMAP connections alive between checks so the automation
+doesn't pay a TLS handshake + LOGIN for every inbox poll and reply fetch,
+plus an IDLE watcher that wakes the monitor only when new mail arrives
+"""
+
+import ssl
+import time
+import imaplib
+import logging
+import threading
+from contextlib import contextmanager
+
+try:
+    from imapclient import IMAPClient
+except ImportError:
+    IMAPClient = None
+
+logger = logging.getLogger(__name__)
+
+# One TLS context for every pooled connection (creating it loads the CA store)
+SSL_CONTEXT = ssl.create_default_context()
+
+# Idle (connection, released_at) pairs keyed on (server, port, account); a connection
+# is removed while borrowed so two threads never talk over the same socket
+_IMAP_POOL = {}
+# Last TLS session per key, offered on reconnect for session resumption
+_TLS_SESSIONS = {}
+_pool_lock = threading.RLock()
+
+# Servers such as Gmail and iCloud drop sessions idle for ~29 minutes; older
+# connections are discarded without spending a NOOP round-trip on them
+MAX_IDLE_SECONDS = 25 * 60
+
+# Errors that mean the connection itself is unusable
+CONNECTION_ERRORS = (imaplib.IMAP4.abort, ssl.SSLError, OSError)
+
+class _ResumingIMAP4_SSL(imaplib.IMAP4_SSL):
+    """IMAP4_SSL that offers a previous TLS session during the handshake"""
+    
+    def __init__(self, host, port, tls_session=None):
+        self.tls_session = tls_session
+        super().__init__(host, port, ssl_context=SSL_CONTEXT)
+    
+    def _create_socket(self, timeout=None):
+        sock = imaplib.IMAP4._create_socket(self, timeout)
+        return self.ssl_context.wrap_socket(sock, server_hostname=self.host,
+                                            session=self.tls_session)
+
+def _discard(conn):
+    try:
+        conn.shutdown()
+    except Exception:
+        pass
+
+def get_conn(server, port, account, password):
+    """Borrow an authenticated connection, reusing an idle one when it still answers NOOP"""
+    key = (server, port, account)
+    while True:
+        with _pool_lock:
+            idle = _IMAP_POOL.get(key)
+            conn, released_at = idle.pop() if idle else (None, None)
+            tls_session = _TLS_SESSIONS.get(key)
+        if conn is None:
+            break
+        if time.monotonic() - released_at > MAX_IDLE_SECONDS:
+            _discard(conn)
+            continue
+        try:
+            conn.noop()
+            return conn
+        except (imaplib.IMAP4.error,) + CONNECTION_ERRORS:
+            _discard(conn)
+    
+    try:
+        conn = _ResumingIMAP4_SSL(server, port, tls_session)
+    except ssl.SSLError:
+        # Server rejected the cached session; fall back to a full handshake
+        conn = _ResumingIMAP4_SSL(server, port)
+    try:
+        conn.login(account, password)
+    except BaseException:
+        _discard(conn)
+        raise
+    with _pool_lock:
+        _TLS_SESSIONS[key] = conn.sock.session
+    return conn
+
+def release_conn(conn, server, port, account):
+    """Return a borrowed connection to the pool"""
+    try:
+        if conn.state == 'SELECTED':
+            conn.close()
+    except (imaplib.IMAP4.error,) + CONNECTION_ERRORS:
+        _discard(conn)
+        return
+    with _pool_lock:
+        _IMAP_POOL.setdefault((server, port, account), []).append((conn, time.monotonic()))
+
+@contextmanager
+def connection(server, port, account, password):
+    """Context manager around get_conn/release_conn; drops the connection on error"""
+    conn = get_conn(server, port, account, password)
+    try:
+        yield conn
+    except BaseException:
+        _discard(conn)
+        raise
+    release_conn(conn, server, port, account)
+
+def close_all():
+    """Log out every idle pooled connection"""
+    with _pool_lock:
+        conns = [conn for idle in _IMAP_POOL.values() for conn, _ in idle]
+        _IMAP_POOL.clear()
+    for conn in conns:
+        try:
+            conn.logout()
+        except Exception:
+            _discard(conn)
+
+class InboxWatcher:
+    """Long-lived IMAP IDLE (RFC 2177) connection used to wait for new inbox mail.
+    Without imapclient, or against a server lacking IDLE, wait() simply sleeps"""
+    
+    def __init__(self):
+        self.client = None
+        self.key = None
+        self.idle_since = 0.0
+        self.idle_supported = IMAPClient is not None
+    
+    def _connect(self, server, port, account, password):
+        self.close()
+        client = IMAPClient(server, port=port, ssl=True, ssl_context=SSL_CONTEXT)
+        try:
+            client.login(account, password)
+            if not client.has_capability('IDLE'):
+                logger.info(f"IMAP server {server} has no IDLE support; polling instead")
+                self.idle_supported = False
+                client.logout()
+                return
+            client.select_folder('INBOX', readonly=True)
+            client.idle()
+        except BaseException:
+            _discard(client)
+            raise
+        self.client = client
+        self.key = (server, port, account)
+        self.idle_since = time.monotonic()
+    
+    def wait(self, server, port, account, password, timeout, poll_interval):
+        """Block until the server reports new mail (up to `timeout` seconds) and return True.
+        Falls back to sleeping `poll_interval` seconds and returning False"""
+        if not self.idle_supported:
+            time.sleep(poll_interval)
+            return False
+        try:
+            if self.client is None or self.key != (server, port, account):
+                self._connect(server, port, account, password)
+                if self.client is None:
+                    time.sleep(poll_interval)
+                    return False
+            elif time.monotonic() - self.idle_since > MAX_IDLE_SECONDS:
+                # Renew IDLE before the server's ~29 minute timeout
+                self.client.idle_done()
+                self.client.idle()
+                self.idle_since = time.monotonic()
+            
+            responses = self.client.idle_check(timeout=timeout)
+            return any(len(response) > 1 and response[1] in (b'EXISTS', b'RECENT') for response in responses)
+        except Exception as e:
+            logger.debug(f"IMAP IDLE failed, reconnecting on the next wait: {e}")
+            self.close()
+            time.sleep(poll_interval)
+            return False
+    
+    def close(self):
+        """End IDLE and log out"""
+        client, self.client = self.client, None
+        if client is None:
+            return
+        try:
+            client.idle_done()
+            client.logout()
+        except Exception:
+            _discard(client)
@@ -19,24 +19,25 @@ import time
 import subprocess
 import sys
 import threading
+import functools
+import random
 import queue
-import imaplib
 import email
+import html
 import smtplib
 import gspread
 import openai
 import requests
 import json
-import hashlib
 import logging
-import pytz
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.iterators import typed_subpart_iterator
 from oauth2client.service_account import ServiceAccountCredentials
-from bs4 import BeautifulSoup
-import markdown
 import re
 import pandas as pd
 from config import Config
@@ -51,6 +52,18 @@ from prompt_loader import (
     generate_followup_prompt
 )
 from credentials_helper import get_google_sheets_client
+import imap_pool
+import smtp_pool
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ==========================================
 # LOGGING SETUP
@@ -68,37 +81,250 @@ logger = logging.getLogger(__name__)
 # ==========================================
 # NETWORK UTILITIES
 # ==========================================
+CONNECTIVITY_TEST_HOSTS = ('8.8.8.8', '1.1.1.1', 'google.com')
+
+# Outreach: leads prepared in parallel, SMTP sends still spaced for deliverability
+OUTREACH_WORKERS = 5
+OUTREACH_SEND_INTERVAL = 10  # seconds between outreach emails
+
+# Follow-ups: same scheme, with the original 2 second spacing between sends
+FOLLOWUP_WORKERS = 5
+FOLLOWUP_SEND_INTERVAL = 2  # seconds between follow-up emails
+
+# Message ids per IMAP FETCH; some servers reject overly long command lines
+IMAP_FETCH_BATCH = 200
+
+# Longest wait in IMAP IDLE before checking the inbox anyway (catches mail that
+# arrived between a check and re-entering the wait)
+IDLE_WAIT_SECONDS = 60
+
+# How long the valid email -> sheet row index is trusted before it is re-read
+LEAD_INDEX_TTL = 60  # seconds
+
+# Reply-status writes are queued and sent together once this many leads are
+# pending, the oldest has waited this long, or the reply queue is drained
+STATUS_FLUSH_SIZE = 25
+STATUS_FLUSH_SECONDS = 10
+
+def probe_host(host):
+    socket.create_connection((host, 80), timeout=5).close()
+    return True
+
 def test_internet_connectivity():
     """Test basic internet connectivity"""
-    # Test multiple reliable hosts
-    test_hosts = ['8.8.8.8', '1.1.1.1', 'google.com']
-    for host in test_hosts:
-        try:
-            socket.create_connection((host, 80), timeout=5).close()
-            return True
-        except (socket.gaierror, socket.timeout, OSError):
-            continue
-    return False
+    # Probe all reliable hosts at once; the first successful connection wins
+    executor = ThreadPoolExecutor(max_workers=len(CONNECTIVITY_TEST_HOSTS))
+    try:
+        futures = [executor.submit(probe_host, host) for host in CONNECTIVITY_TEST_HOSTS]
+        for future in as_completed(futures):
+            if future.exception() is None:
+                return True
+        return False
+    finally:
+        # Don't wait for slower probes once one has succeeded
+        executor.shutdown(wait=False, cancel_futures=True)
+
+@functools.lru_cache(maxsize=8)
+def backoff_schedule(max_retries, backoff_factor):
+    """Sleep before each retry: (1, f, f**2, ...) for max_retries - 1 retries"""
+    return tuple(backoff_factor ** attempt for attempt in range(max_retries - 1))
 
-def retry_with_backoff(func, max_retries=3, backoff_factor=2, exceptions=(Exception,)):
-    """Retry function with exponential backoff"""
+def retry_with_backoff(func, max_retries=3, backoff_factor=2, exceptions=(Exception,), cap=30, jitter=0):
+    """Retry function with exponential backoff, capped at `cap` seconds.
+    A jitter of j stretches each sleep by a random 0..j fraction so parallel callers spread out"""
+    sleeps = backoff_schedule(max_retries, backoff_factor)
     for attempt in range(max_retries):
         try:
             return func()
         except exceptions as e:
             if attempt == max_retries - 1:
                 raise e
-            wait_time = backoff_factor ** attempt
-            logger.warning(f"RETRY Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
+            wait_time = min(cap, sleeps[attempt] * (1 + random.uniform(0, jitter)))
+            logger.warning(f"RETRY Attempt {attempt + 1} failed: {e}. Retrying in {wait_time:.1f}s...")
             time.sleep(wait_time)
     return None
 
+# Transient failures worth retrying: rate limiting and upstream/server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+APIFY_RETRY_ERRORS = (ConnectionError, requests.exceptions.Timeout, requests.exceptions.HTTPError)
+OPENAI_MAX_RETRIES = 3
+SMTP_RETRY_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)
+
+# {{Name}} placeholders in the email templates
+TEMPLATE_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+# Used when Config.EMAIL_TEMPLATE_PATH is missing
+FALLBACK_EMAIL_TEMPLATE = """
+<html><body>
+<h2>{{Subject}}</h2>
+<p>Dear {{Title}},</p>
+<div>{{body}}</div>
+<ul>
+<li>{{solution1}}</li>
+<li>{{solution2}}</li>
+<li>{{solution3}}</li>
+</ul>
+<p>Best regards,<br>Muhammad from Peekr</p>
+</body></html>
+"""
+
+class RateLimiter:
+    """Spaces calls to wait() at least `interval` seconds apart across threads"""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+    
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+# Cached OpenAI results: bounded, and expired after a day so prompt changes show up
+LLM_CACHE_SIZE = 4096
+LLM_CACHE_TTL = 24 * 60 * 60  # seconds
+WHITESPACE_RE = re.compile(r'\s+')
+
+def normalize_reply(body):
+    """Cache key for a reply body: lowercased, whitespace collapsed, first 2000 chars"""
+    return WHITESPACE_RE.sub(' ', body.lower()).strip()[:2000]
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire `ttl` seconds after they are set"""
+    
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+    
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
 # ==========================================
 # PROMPT LOADING - Using External Files
 # ==========================================
 # Note: Prompt functions are now imported from prompt_loader.py
 # which loads templates from the prompts/ folder
 
+# ==========================================
+# EMAIL VALIDATION PATTERNS (compiled once)
+# ==========================================
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+EMAIL_SEPARATOR_RE = re.compile(r'[,;]')
+
+# Generic/non-business local parts, excluded outright
+EXCLUDED_EMAIL_PREFIXES = frozenset({
+    'hr', 'support', 'info', 'admin', 'noreply', 'no-reply',
+    'contact', 'sales', 'marketing', 'help', 'service',
+    'office', 'reception', 'general', 'customer', 'team',
+    'mail', 'enquiry', 'inquiry', 'hello', 'web'
+})
+
+# Generic terms anywhere in the local part (noreply, bounce, ...)
+EXCLUDED_TERMS_RE = re.compile(r'noreply|no-reply|donotreply|do-not-reply|postmaster|mailer-daemon|bounce')
+
+# Decision-maker looking addresses, in order of preference (matched against the lowercased email)
+PREFERRED_EMAIL_RES = (
+    re.compile(r'^[a-zA-Z]+\.[a-zA-Z]+@'),  # firstname.lastname@
+    re.compile(r'^[a-zA-Z]{2,}@'),          # reasonable length names
+    re.compile(r'^(ceo|cto|cfo|founder|owner|director|manager)[@\.]'),  # executive titles
+)
+
+# Reply header parsing in check_new_emails_fast; these run on the raw FETCH bytes
+# so only the captured sender/subject get decoded
+HEADER_FROM_RE = re.compile(rb'^From: ([^\r\n]+)', re.M | re.I)
+HEADER_SUBJECT_RE = re.compile(rb'^Subject: ([^\r\n]+)', re.M | re.I)
+EMAIL_ADDRESS_RE = re.compile(rb'[\w\.-]+@[\w\.-]+')
+
+# Rule-based first stage of classify_interest: only an unambiguous opt-out skips the
+# OpenAI call. Positive-sounding words are left to the model ("no demo needed",
+# "don't call me", "no longer interested" all contain one)
+NEGATIVE_REPLY_RE = re.compile(r'\b(unsubscribe|not interested|remove me|stop emailing|stop sending)\b', re.I)
+
+# Out-of-office and auto-responder wording in a subject line. Only the subject is
+# checked: a person may well write "I was on vacation, let's talk" in the body
+AUTO_REPLY_RE = re.compile(r'\b(auto[- ]?reply|automatic reply|out of (the )?office|on vacation)\b', re.I)
+
+# HTML-only replies: script/style blocks and quoted history (blockquotes, and the
+# Gmail/Outlook/Yahoo/Thunderbird quote containers to the end of the message) are
+# dropped, block tags become line breaks, and the remaining tags are removed
+HTML_NON_TEXT_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.I | re.S)
+HTML_QUOTE_RE = re.compile(r'<blockquote\b.*</blockquote\s*>'
+                           r'|<div\b[^>]*(gmail_quote|divRplyFwdMsg|yahoo_quoted|moz-cite-prefix).*', re.I | re.S)
+HTML_BREAK_RE = re.compile(r'<(br|/p|/div|/li|/tr|hr)\b[^>]*>', re.I)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Reply text handed to OpenAI: quoted history and signature removed, then capped
+QUOTED_HISTORY_RE = re.compile(r'^On .{0,300}?wrote:.*', re.M | re.S)  # "On <date>, <name> wrote:" and below
+SIGNATURE_RE = re.compile(r'^-- $.*', re.M | re.S)
+QUOTED_LINE_RE = re.compile(r'^>.*$', re.M)
+CLASSIFY_INPUT_CHARS = 1500
+REPLY_INPUT_CHARS = 4000
+
+def html_to_text(body):
+    """Visible text of an HTML reply without its quoted history, one line per block"""
+    body = HTML_QUOTE_RE.sub(' ', HTML_NON_TEXT_RE.sub(' ', body))
+    text = html.unescape(HTML_TAG_RE.sub(' ', HTML_BREAK_RE.sub('\n', body)))
+    return '\n'.join(line.strip() for line in text.splitlines())
+
+def prefilter_reply(text):
+    """NOT INTERESTED for an unambiguous opt-out, else None (the model decides)"""
+    return "NOT INTERESTED" if NEGATIVE_REPLY_RE.search(text) else None
+
+def is_auto_reply(msg):
+    """True for auto-responders, judged from headers (RFC 3834 Auto-Submitted,
+    X-Autoreply, Precedence: auto_reply, X-Auto-Response-Suppress) and the subject"""
+    auto_submitted = str(msg.get('Auto-Submitted', 'no')).strip().lower()
+    if auto_submitted != 'no' or msg.get('X-Autoreply') is not None:
+        return True
+    if str(msg.get('Precedence', '')).strip().lower() == 'auto_reply':
+        return True
+    if msg.get('X-Auto-Response-Suppress') is not None:
+        return True
+    return AUTO_REPLY_RE.search(str(msg.get('Subject', ''))) is not None
+
+def clean_reply_text(body):
+    """The reply's own text, whitespace collapsed and capped at REPLY_INPUT_CHARS"""
+    text = QUOTED_LINE_RE.sub('', SIGNATURE_RE.sub('', QUOTED_HISTORY_RE.sub('', body)))
+    text = WHITESPACE_RE.sub(' ', text).strip()
+    # Fall back to the raw body if everything was quoted
+    return (text or WHITESPACE_RE.sub(' ', body).strip())[:REPLY_INPUT_CHARS]
+
+# ==========================================
+# LEADS SHEET LAYOUT
+# ==========================================
+# Column letters of the fields read back from the leads sheet (see save_leads_to_sheet)
+LEAD_COLUMNS = {
+    'Title': 'A',
+    'Website': 'B',
+    'Email': 'C',
+    'Valid Email': 'D',
+    'Phone': 'G',
+    'Category': 'H',
+    'Status': 'L',
+}
+
 # ==========================================
 # MASTER AUTOMATION CLASS
 # ==========================================
@@ -106,20 +332,47 @@ class PeekrAutomationMaster:
     def __init__(self):
         """Initialize the complete automation system"""
         Config.validate_config()
-        self.openai_client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
+        # The client retries connection errors, 429 and 5xx itself with jittered backoff
+        self.openai_client = openai.OpenAI(api_key=Config.OPENAI_API_KEY, max_retries=OPENAI_MAX_RETRIES)
         
         # Set timezone from environment variable (configurable by client)
         try:
-            self.timezone = pytz.timezone(Config.TIMEZONE)
+            self.timezone = ZoneInfo(Config.TIMEZONE)
             logger.info(f"TIMEZONE: Timezone set to: {Config.TIMEZONE} ({self.timezone})")
-        except pytz.exceptions.UnknownTimeZoneError:
+        except (ZoneInfoNotFoundError, ValueError):
             logger.warning(f"WARNING: Unknown timezone '{Config.TIMEZONE}', falling back to UTC")
-            self.timezone = pytz.UTC
+            self.timezone = timezone.utc
             logger.info(f"TIMEZONE: Timezone set to: UTC (fallback)")
         
         # Initialize dynamic email configuration
         self._email_config = None
         
+        # Worksheet handles by title (each lookup is a metadata request)
+        self._worksheets = {}
+        
+        # Outreach workers share one send pace and serialize sheet writes
+        self.send_rate_limiter = RateLimiter(OUTREACH_SEND_INTERVAL)
+        self.followup_rate_limiter = RateLimiter(FOLLOWUP_SEND_INTERVAL)
+        
+        # Reply monitoring waits on IMAP IDLE instead of polling when the server supports it
+        self.inbox_watcher = imap_pool.InboxWatcher()
+        self.sheet_lock = threading.Lock()
+        
+        # Valid email -> sheet row, rebuilt from column D when stale or on a miss
+        self._lead_index = {}
+        self._lead_index_time = 0.0
+        
+        # Queued reply-status writes, one list of ranges per lead (see flush_lead_status)
+        self._status_updates = []
+        self._status_updates_since = 0.0
+        self._status_lock = threading.Lock()
+        
+        # OpenAI results: outreach (subject, body, solutions) keyed on (normalized title, category),
+        # classifications and reply/follow-up drafts keyed on what their prompts are built from
+        self._content_cache = TTLCache(LLM_CACHE_SIZE, LLM_CACHE_TTL)
+        self._classification_cache = TTLCache(LLM_CACHE_SIZE, LLM_CACHE_TTL)
+        self._draft_cache = TTLCache(LLM_CACHE_SIZE, LLM_CACHE_TTL)
+        
         # Test internet connectivity first
         if not test_internet_connectivity():
             logger.error("ERROR: No internet connectivity detected. Please check your connection.")
@@ -152,9 +405,10 @@ class PeekrAutomationMaster:
         # Real-time email monitoring setup
         self.running = False
         self.email_queue = queue.Queue()
-        self.valid_emails = set()
+        self.valid_emails = frozenset()
+        self._valid_emails_modified = None  # spreadsheet modifiedTime at the last load
         self.processed_emails = set()
-        self.existing_leads_cache = {}
+        self.existing_leads = set()
         
         # Statistics
         self.stats = {
@@ -166,6 +420,24 @@ class PeekrAutomationMaster:
         
         logger.info("READY: Peekr Automation Master initialized - ALL systems ready!")
     
+    def get_worksheet(self, title):
+        """Worksheet handle by title, fetched once and then reused"""
+        worksheet = self._worksheets.get(title)
+        if worksheet is None:
+            worksheet = self._worksheets[title] = self.sheet.worksheet(title)
+        return worksheet
+    
+    def load_lead_columns(self, *names):
+        """Fetch only the named leads-sheet columns in one batchGet, as a DataFrame of strings.
+        Row i of the frame is sheet row i + 2"""
+        ranges = [f"{LEAD_COLUMNS[name]}2:{LEAD_COLUMNS[name]}" for name in names]
+        columns = [[cell[0] if cell else '' for cell in values]
+                   for values in self.leads_worksheet.batch_get(ranges)]
+        # Trailing empty cells are omitted by the API, so pad columns to a common length
+        length = max(map(len, columns), default=0)
+        return pd.DataFrame({name: column + [''] * (length - len(column))
+                             for name, column in zip(names, columns)})
+    
     def get_email_config(self):
         """Get current email configuration (refreshed each time)"""
         try:
@@ -175,16 +447,7 @@ class PeekrAutomationMaster:
         except Exception as e:
             logger.error(f"❌ Error getting email config: {e}")
             # Fallback to static config
-            return {
-                'EMAIL_ACCOUNT': Config.EMAIL_ACCOUNT,
-                'EMAIL_PASSWORD': Config.EMAIL_PASSWORD,
-                'SMTP_SERVER': Config.SMTP_SERVER,
-                'SMTP_PORT': Config.SMTP_PORT,
-                'IMAP_SERVER': Config.IMAP_SERVER,
-                'IMAP_PORT': Config.IMAP_PORT,
-                'SENDER_NAME': Config.SENDER_NAME,
-                'SENDER_EMAIL': Config.SENDER_EMAIL
-            }
+            return Config.get_env_email_config()
     
     # ==========================================
     # 1. LEAD GENERATION (APIFY)
@@ -192,68 +455,53 @@ class PeekrAutomationMaster:
     def load_existing_leads_for_deduplication(self):
         """Load existing leads to prevent duplicates"""
         try:
-            data = self.leads_worksheet.get_all_records()
-            self.existing_leads_cache = {}
-            
-            for row in data:
-                title = str(row.get('Title', '')).strip().lower()
-                website = str(row.get('Website', '')).strip().lower()
-                phone = str(row.get('Phone', '')).strip()
-                
-                if title:
-                    title_hash = hashlib.md5(title.encode()).hexdigest()
-                    self.existing_leads_cache[title_hash] = True
-                
-                if website:
-                    website_hash = hashlib.md5(website.encode()).hexdigest()
-                    self.existing_leads_cache[website_hash] = True
-                
-                if phone:
-                    phone_hash = hashlib.md5(phone.encode()).hexdigest()
-                    self.existing_leads_cache[phone_hash] = True
-            
-            logger.info(f"LOADED: Loaded {len(self.existing_leads_cache)} existing leads for deduplication")
+            df = self.load_lead_columns('Title', 'Website', 'Phone')
+            # Plain strings: the set hashes them itself, no digest needed
+            self.existing_leads = set()
+            
+            # Normalize each column with vectorized string ops and add the
+            # non-empty values in one bulk update per column
+            for column, lowercase in (('Title', True), ('Website', True), ('Phone', False)):
+                values = df[column].str.strip()
+                if lowercase:
+                    values = values.str.lower()
+                self.existing_leads.update(values[values != ''].tolist())
+            
+            logger.info(f"LOADED: Loaded {len(self.existing_leads)} existing leads for deduplication")
             return True
             
         except Exception as e:
             logger.error(f"ERROR: Error loading existing leads: {e}")
             return False
     
-    def is_duplicate_lead(self, lead_data):
-        """Check if lead is duplicate using multiple criteria"""
+    def new_lead_keys(self, lead_data, batch_keys=()):
+        """Dedup keys of a lead, or None if it duplicates an existing lead or one in batch_keys.
+        Nothing is registered here; process_lead_data adds the keys in bulk"""
         title = str(lead_data.get('title', '')).strip().lower()
         website = str(lead_data.get('website', '')).strip().lower()
         phone = str(lead_data.get('phone', '')).strip()
         
-        # Create composite key and individual hashes
+        # Create composite key
         composite_key = f"{title}|{website}|{phone}".replace(" ", "")
-        title_hash = hashlib.md5(title.encode()).hexdigest()
-        website_hash = hashlib.md5(website.encode()).hexdigest() if website else ""
-        phone_hash = hashlib.md5(phone.encode()).hexdigest() if phone else ""
         
-        # Check for duplicates
-        if (composite_key in self.existing_leads_cache or 
-            title_hash in self.existing_leads_cache or
-            (website_hash and website_hash in self.existing_leads_cache) or
-            (phone_hash and phone_hash in self.existing_leads_cache)):
-            return True
+        keys = (composite_key, title)
+        if website: keys += (website,)
+        if phone: keys += (phone,)
         
-        # Add to cache
-        self.existing_leads_cache[composite_key] = True
-        self.existing_leads_cache[title_hash] = True
-        if website_hash: self.existing_leads_cache[website_hash] = True
-        if phone_hash: self.existing_leads_cache[phone_hash] = True
+        # Check for duplicates
+        if any(key in self.existing_leads or key in batch_keys for key in keys):
+            return None
         
-        return False
+        return keys
     
     def search_leads_with_apify(self, location, category, max_results=75):
-        """Search for leads using Apify (using your original working approach)"""
+        """Search for leads using Apify (using your original working approach).
+        Yields leads as they are parsed, so processing starts before the download ends"""
         try:
             # Using your original working API endpoint and approach
             url = "https://api.apify.com/v2/acts/lukaskrivka~google-maps-with-contact-details/run-sync-get-dataset-items"
             
             headers = {
-                'Content-Type': 'application/json',
                 'Accept': 'application/json',
                 'Authorization': f'Bearer {Config.APIFY_API_KEY}'
             }
@@ -268,30 +516,48 @@ class PeekrAutomationMaster:
             
             logger.info(f"SEARCH: Searching Apify for '{category}' in '{location}' (max {max_results} results)")
             
-            response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=600)
+            def start_run():
+                response = requests.post(url, headers=headers, json=payload, timeout=600, stream=True)
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    response.close()
+                    raise requests.exceptions.HTTPError(f"Apify returned {response.status_code}", response=response)
+                return response
             
-            logger.info(f"API: Apify response status: {response.status_code}")
+            response = retry_with_backoff(start_run, max_retries=3, exceptions=APIFY_RETRY_ERRORS, jitter=0.5)
             
-            if response.status_code == 201:  # Your original used 201, not 200
-                leads = response.json()
-                logger.info(f"RESULT: Apify returned {len(leads)} raw leads for {category} in {location}")
-                return leads
-            else:
-                logger.error(f"ERROR: Apify API error: {response.status_code}")
-                logger.error(f"ERROR: Response content: {response.text}")
-                return []
+            with response:
+                logger.info(f"API: Apify response status: {response.status_code}")
+                
+                if response.status_code == 201:  # Your original used 201, not 200
+                    if ijson is not None:
+                        # Parse the dataset array item by item instead of buffering the whole body
+                        response.raw.decode_content = True
+                        leads = ijson.items(response.raw, 'item', use_float=True)
+                    else:
+                        leads = response.json()
+                    
+                    count = 0
+                    for lead in leads:
+                        count += 1
+                        yield lead
+                    logger.info(f"RESULT: Apify returned {count} raw leads for {category} in {location}")
+                else:
+                    logger.error(f"ERROR: Apify API error: {response.status_code}")
+                    logger.error(f"ERROR: Response content: {response.text}")
                 
         except Exception as e:
             logger.error(f"ERROR: Error calling Apify API: {e}")
-            return []
     
     def process_lead_data(self, raw_leads, category, location):
         """Process and filter lead data (matching your original approach)"""
         processed_leads = []
+        batch_keys = set()
         
         for lead_data in raw_leads:
-            if self.is_duplicate_lead(lead_data):
+            keys = self.new_lead_keys(lead_data, batch_keys)
+            if keys is None:
                 continue
+            batch_keys.update(keys)
             
             # Extract and clean data (matching your original field names)
             title = str(lead_data.get('title', '')).strip()
@@ -340,6 +606,9 @@ class PeekrAutomationMaster:
             
             processed_leads.append(processed_lead)
         
+        # Register the whole batch with the dedup cache in one bulk update
+        self.existing_leads.update(batch_keys)
+        
         logger.info(f"SUCCESS: Processed {len(processed_leads)} unique leads")
         return processed_leads
     
@@ -349,10 +618,6 @@ class PeekrAutomationMaster:
             if not leads:
                 return 0
             
-            # Get current data to append
-            existing_data = self.leads_worksheet.get_all_values()
-            start_row = len(existing_data) + 1
-            
             # Prepare data for batch insert
             rows_to_insert = []
             for lead in leads:
@@ -382,10 +647,10 @@ class PeekrAutomationMaster:
                 ]
                 rows_to_insert.append(row)
             
-            # Batch insert
+            # Batch append; the API finds the end of the table, so no prior read is needed
             if rows_to_insert:
-                range_name = f"A{start_row}:V{start_row + len(rows_to_insert) - 1}"
-                self.leads_worksheet.update(range_name, rows_to_insert)
+                self.leads_worksheet.append_rows(rows_to_insert, value_input_option='RAW',
+                                                 insert_data_option='INSERT_ROWS')
                 logger.info(f"SUCCESS: Saved {len(rows_to_insert)} leads to Google Sheets")
             
             return len(rows_to_insert)
@@ -406,10 +671,12 @@ class PeekrAutomationMaster:
             
             # Get categories and locations
             try:
-                categories_sheet = self.sheet.worksheet("Categories")
+                categories_sheet = self.get_worksheet("Categories")
                 categories_data = categories_sheet.get_all_records()
                 categories_df = pd.DataFrame(categories_data)
             except Exception as e:
+                # Drop the cached handle in case the worksheet was renamed or removed
+                self._worksheets.pop("Categories", None)
                 logger.error(f"ERROR:  Error loading categories: {e}")
                 return
             
@@ -437,15 +704,15 @@ class PeekrAutomationMaster:
                 
                 # Search for leads
                 raw_leads = self.search_leads_with_apify(location, category, leads_per_search)
+                processed_leads = self.process_lead_data(raw_leads, category, location)
                 
-                if raw_leads:
-                    processed_leads = self.process_lead_data(raw_leads, category, location)
+                if processed_leads:
                     saved_count = self.save_leads_to_sheet(processed_leads)
                     total_leads_generated += saved_count
                     
                     logger.info(f"✅ Category {processed_categories}/{total_categories} complete: {saved_count} leads added (Total: {total_leads_generated})")
                 else:
-                    logger.warning(f"⚠️ No leads found for {category} in {location}")
+                    logger.warning(f"⚠️ No new leads found for {category} in {location}")
                     
                 time.sleep(10)  # Rate limiting
             
@@ -459,39 +726,17 @@ class PeekrAutomationMaster:
     # ==========================================
     def is_valid_email(self, email):
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return EMAIL_RE.match(email) is not None
     
     def is_business_email(self, email):
         """Check if email is a valid business email (not generic)"""
         if not email or not self.is_valid_email(email):
             return False
         
-        email_lower = email.lower()
-        
-        # Exclude generic/non-business email patterns
-        excluded_patterns = [
-            'hr@', 'support@', 'info@', 'admin@', 'noreply@', 'no-reply@',
-            'contact@', 'sales@', 'marketing@', 'help@', 'service@',
-            'office@', 'reception@', 'general@', 'customer@', 'team@',
-            'mail@', 'enquiry@', 'inquiry@', 'hello@', 'web@'
-        ]
-        
-        # Check if email starts with excluded patterns
-        for pattern in excluded_patterns:
-            if email_lower.startswith(pattern):
-                return False
-        
-        # Additional checks for generic terms in email
-        excluded_terms = [
-            'noreply', 'no-reply', 'donotreply', 'do-not-reply',
-            'postmaster', 'mailer-daemon', 'bounce'
-        ]
-        
-        email_prefix = email_lower.split('@')[0]
-        for term in excluded_terms:
-            if term in email_prefix:
-                return False
+        # One split, then a set lookup for generic prefixes and a regex scan for generic terms
+        email_prefix = email.lower().split('@', 1)[0]
+        if email_prefix in EXCLUDED_EMAIL_PREFIXES or EXCLUDED_TERMS_RE.search(email_prefix):
+            return False
         
         return True
     
@@ -502,7 +747,7 @@ class PeekrAutomationMaster:
         
         # Handle multiple emails (comma or semicolon separated)
         if ',' in email_data or ';' in email_data:
-            emails = re.split('[,;]', email_data)
+            emails = EMAIL_SEPARATOR_RE.split(email_data)
         else:
             emails = [email_data]
         
@@ -516,24 +761,31 @@ class PeekrAutomationMaster:
         if not valid_emails:
             return None
         
-        # Prefer emails that look like decision-maker emails
-        preferred_patterns = [
-            r'^[a-zA-Z]+\.[a-zA-Z]+@',  # firstname.lastname@
-            r'^[a-zA-Z]{2,}@',          # reasonable length names
-            r'^(ceo|cto|cfo|founder|owner|director|manager)[@\.]'  # executive titles
-        ]
-        
-        # First, try to find preferred emails
-        for pattern in preferred_patterns:
-            for email in valid_emails:
-                if re.match(pattern, email.lower()):
+        # First, try to find preferred (decision-maker looking) emails
+        lowered = [email.lower() for email in valid_emails]
+        for pattern in PREFERRED_EMAIL_RES:
+            for email, email_lower in zip(valid_emails, lowered):
+                if pattern.match(email_lower):
                     return email
         
         # If no preferred email found, return the first valid one
         return valid_emails[0]
     
     def generate_subject_and_body(self, title, category):
-        """Generate email subject and body using AI"""
+        """Generate email subject and body using AI (cached per title and category)"""
+        cache_key = (str(title).strip().lower(), category)
+        cached = self._content_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        subject, body, solutions = self._generate_subject_and_body(title, category)
+        # Only successful generations are cached so failures are retried next time
+        if subject and body:
+            self._content_cache.set(cache_key, (subject, body, solutions))
+        return subject, body, solutions
+    
+    def _generate_subject_and_body(self, title, category):
+        """Call OpenAI and parse the subject, body and solutions from its response"""
         try:
             prompt = get_subject_prompt(title, category)
             
@@ -544,77 +796,27 @@ class PeekrAutomationMaster:
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=1000,
+                # JSON mode: the response is always a strict JSON object
+                response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content.strip()
-            
-            # Parse response - JSON format from external prompts
-            subject = ""
-            body = ""
+            content = response.choices[0].message.content
             solutions = ["Optimize workflows", "Improve efficiency", "Drive growth"]
             
             # Debug the AI response
             logger.debug(f"🤖 AI Response:\n{content}")
             
+            # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors
             try:
-                # Try to parse as JSON (new format from external prompts)
-                import json
-                
-                # Extract JSON from response (may be wrapped in markdown)
-                json_start = content.find('{')
-                json_end = content.rfind('}') + 1
-                
-                if json_start != -1 and json_end > json_start:
-                    json_content = content[json_start:json_end]
-                    data = json.loads(json_content)
-                    
-                    subject = data.get('subject', '')
-                    body = data.get('email', '')
-                    solutions = data.get('solutions', solutions)
-                    
-                    logger.debug(f"SUCCESS: JSON parsing successful")
-                else:
-                    raise ValueError("No JSON found in response")
-                    
-            except (json.JSONDecodeError, ValueError, KeyError) as e:
-                logger.debug(f"ERROR:  JSON parsing failed: {e}, trying fallback parsing...")
-                
-                # Fallback to old format parsing
-                lines = content.split('\n')
-                current_section = None
-                body_lines = []
-                
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('SUBJECT:'):
-                        subject = line.replace('SUBJECT:', '').strip()
-                        current_section = "subject"
-                    elif line.startswith('BODY:'):
-                        body_content = line.replace('BODY:', '').strip()
-                        if body_content:
-                            body_lines.append(body_content)
-                        current_section = "body"
-                    elif line.startswith('SOLUTIONS:'):
-                        solutions_text = line.replace('SOLUTIONS:', '').strip()
-                        if '|' in solutions_text:
-                            solutions = [s.strip() for s in solutions_text.split('|')]
-                        current_section = "solutions"
-                    elif current_section == "body" and line:
-                        body_lines.append(line)
-                
-                # Join body lines
-                body = ' '.join(body_lines) if body_lines else ""
-                
-                # Final fallback if both parsing methods failed
-                if not body and content:
-                    if "Dear" in content or "Hello" in content or "<p>" in content:
-                        body = content
-                        if not subject:
-                            first_line = content.split('\n')[0]
-                            if len(first_line) < 100:
-                                subject = first_line.strip()
-                                body = '\n'.join(content.split('\n')[1:]).strip()
+                data = orjson.loads(content) if orjson is not None else json.loads(content)
+            except ValueError as e:
+                logger.error(f"ERROR:  AI response is not valid JSON: {e}")
+                return "", "", solutions
+            
+            subject = data.get('subject', '')
+            body = data.get('email', '')
+            solutions = data.get('solutions', solutions)
             
             logger.debug(f"📧 Parsed - Subject: '{subject[:50]}...', Body length: {len(body)}")
             
@@ -624,6 +826,11 @@ class PeekrAutomationMaster:
             logger.error(f"ERROR:  Error generating email content: {e}")
             return "", "", ["Optimize workflows", "Improve efficiency", "Drive growth"]
     
+    def smtp_connection(self, email_config):
+        """Logged-in SMTP connection for the active account, borrowed from the pool"""
+        return smtp_pool.connection(email_config['SMTP_SERVER'], email_config['SMTP_PORT'],
+                                    email_config['EMAIL_ACCOUNT'], email_config['EMAIL_PASSWORD'])
+    
     def send_email(self, to_email, subject, html_body):
         """Send email via SMTP"""
         try:
@@ -636,9 +843,12 @@ class PeekrAutomationMaster:
             msg["Subject"] = f"{subject} - Let's Explore"
             msg.attach(MIMEText(html_body, "html"))
             
-            with smtplib.SMTP_SSL(email_config['SMTP_SERVER'], email_config['SMTP_PORT']) as server:
-                server.login(email_config['EMAIL_ACCOUNT'], email_config['EMAIL_PASSWORD'])
-                server.send_message(msg)
+            def deliver():
+                # A dropped pooled connection is discarded, so the retry gets a fresh one
+                with self.smtp_connection(email_config) as server:
+                    server.send_message(msg)
+            
+            retry_with_backoff(deliver, max_retries=3, exceptions=SMTP_RETRY_ERRORS, jitter=0.5)
             
             logger.info(f"SUCCESS: Email sent to {to_email}")
             return True
@@ -647,122 +857,115 @@ class PeekrAutomationMaster:
             logger.error(f"ERROR:  Failed to send email to {to_email}: {e}")
             return False
     
+    def load_email_template(self):
+        """Read the outreach HTML template (falls back to a simple built-in one)"""
+        try:
+            with open(Config.EMAIL_TEMPLATE_PATH, "r", encoding="utf-8") as file:
+                return file.read()
+        except FileNotFoundError:
+            return FALLBACK_EMAIL_TEMPLATE
+    
+    def send_outreach_email(self, html_template, row_number, valid_email, title, category):
+        """Generate, send and record one outreach email; returns True if it was sent"""
+        try:
+            # Generate content
+            subject, body, solutions = self.generate_subject_and_body(title, category)
+            
+            if not subject or not body:
+                logger.warning(f"WARNING: Failed to generate content for {title}")
+                return False
+            
+            # Replace template variables in a single pass (unknown placeholders are left as-is)
+            values = {
+                'Subject': subject,
+                'Title': title,
+                'body': body,
+                'solution1': solutions[0] if len(solutions) > 0 else "Optimize workflows",
+                'solution2': solutions[1] if len(solutions) > 1 else "Improve efficiency",
+                'solution3': solutions[2] if len(solutions) > 2 else "Drive growth",
+            }
+            html_body = TEMPLATE_PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), html_template)
+            
+            # Send email to validated address, paced across all workers
+            self.send_rate_limiter.wait()
+            success = self.send_email(valid_email, subject, html_body)
+            
+            if success:
+                # Update sheet with sent status and metadata in one request:
+                # Mail Send at, Mail Send time, Subject, Status (Columns I-L)
+                current_time = datetime.now(self.timezone)
+                with self.sheet_lock:
+                    self.leads_worksheet.batch_update([{
+                        'range': f'I{row_number}:L{row_number}',
+                        'values': [[current_time.strftime("%Y-%m-%d"), current_time.strftime("%H:%M:%S"), subject, "Sent"]]
+                    }], value_input_option='USER_ENTERED')
+                
+                logger.info(f"📧 Email sent to {valid_email} ({title})")
+                return True
+            else:
+                logger.error(f"ERROR:  Failed to send email to {valid_email}")
+                return False
+        
+        except Exception as e:
+            logger.error(f"ERROR:  Error processing {valid_email}: {e}")
+            return False
+    
     def run_email_outreach(self):
         """Main email outreach process"""
         try:
             logger.info("📧 Starting email outreach campaign...")
             
-            data = self.leads_worksheet.get_all_records()
-            df = pd.DataFrame(data)
+            df = self.load_lead_columns('Email', 'Valid Email', 'Status')
             
             # Step 1: Email Validation and Filtering
             logger.info("🔍 Step 1: Filtering and validating emails...")
             validation_count = 0
+            validation_updates = []
             
-            for index, row in df.iterrows():
-                email_data = row.get("Email", "")
-                valid_email = row.get("Valid Email", "")
-                status = str(row.get("Status", "")).strip().upper()
-                
-                # Skip if already has valid email or not waiting
-                if valid_email or status != "WAITING" or not email_data:
-                    continue
+            # Only waiting rows with raw emails and no valid email yet, selected with one vectorized mask
+            waiting = df['Status'].str.strip().str.upper().eq("WAITING")
+            pending = waiting & df['Valid Email'].eq('') & df['Email'].ne('')
+            
+            for index, email_data in df.loc[pending, 'Email'].items():
+                row_number = index + 2
                 
                 # Extract best business email
                 best_email = self.extract_best_email(email_data)
                 
                 if best_email:
-                    row_number = index + 2
-                    try:
-                        # Update Valid Email column
-                        self.leads_worksheet.update_cell(row_number, 4, best_email)  # Column D (Valid Email)
-                        logger.info(f"SUCCESS: Validated email for row {row_number}: {best_email}")
-                        validation_count += 1
-                        time.sleep(1)  # Rate limiting for sheet updates
-                    except Exception as e:
-                        logger.error(f"ERROR:  Error updating Valid Email for row {row_number}: {e}")
+                    # Queue the Valid Email update (Column D); all rows are written in one request below
+                    validation_updates.append({'range': f'D{row_number}', 'values': [[best_email]]})
+                    logger.info(f"SUCCESS: Validated email for row {row_number}: {best_email}")
                 else:
                     logger.debug(f"WARNING: No valid business email found in: {email_data}")
             
+            if validation_updates:
+                try:
+                    self.leads_worksheet.batch_update(validation_updates, value_input_option='USER_ENTERED')
+                    validation_count = len(validation_updates)
+                except Exception as e:
+                    logger.error(f"ERROR:  Error updating Valid Email column: {e}")
+            
             logger.info(f"📊 Email validation completed: {validation_count} emails validated")
             
             # Step 2: Reload data to get updated Valid Email column
             logger.info("🔄 Step 2: Reloading data with validated emails...")
-            data = self.leads_worksheet.get_all_records()
-            df = pd.DataFrame(data)
+            df = self.load_lead_columns('Valid Email', 'Title', 'Category', 'Status')
             
             # Step 3: Send emails to validated addresses
             logger.info("📧 Step 3: Sending outreach emails...")
-            sent_count = 0
+            # Only send to rows with valid email and waiting status
+            df['Valid Email'] = df['Valid Email'].str.strip()
+            ready = df['Valid Email'].ne('') & df['Status'].str.strip().str.upper().eq("WAITING")
+            candidates = [(index + 2, valid_email, title, category)
+                          for index, valid_email, title, category, _ in df[ready].itertuples(name=None)]
             
-            for index, row in df.iterrows():
-                valid_email = row.get("Valid Email", "").strip()
-                title = row.get("Title", "")
-                category = row.get("Category", "")
-                status = str(row.get("Status", "")).strip().upper()
-                
-                # Only send to rows with valid email and waiting status
-                if not valid_email or status != "WAITING":
-                    continue
-                
-                row_number = index + 2
-                
-                try:
-                    # Generate content
-                    subject, body, solutions = self.generate_subject_and_body(title, category)
-                    
-                    if not subject or not body:
-                        logger.warning(f"WARNING: Failed to generate content for {title}")
-                        continue
-                    
-                    # Load email template
-                    try:
-                        with open(Config.EMAIL_TEMPLATE_PATH, "r", encoding="utf-8") as file:
-                            html_template = file.read()
-                    except FileNotFoundError:
-                        # Fallback simple template
-                        html_template = """
-                        <html><body>
-                        <h2>{{Subject}}</h2>
-                        <p>Dear {{Title}},</p>
-                        <div>{{body}}</div>
-                        <ul>
-                        <li>{{solution1}}</li>
-                        <li>{{solution2}}</li>
-                        <li>{{solution3}}</li>
-                        </ul>
-                        <p>Best regards,<br>Muhammad from Peekr</p>
-                        </body></html>
-                        """
-                    
-                    # Replace template variables
-                    html_body = html_template.replace("{{Subject}}", subject)
-                    html_body = html_body.replace("{{Title}}", title)
-                    html_body = html_body.replace("{{body}}", body)
-                    html_body = html_body.replace("{{solution1}}", solutions[0] if len(solutions) > 0 else "Optimize workflows")
-                    html_body = html_body.replace("{{solution2}}", solutions[1] if len(solutions) > 1 else "Improve efficiency")
-                    html_body = html_body.replace("{{solution3}}", solutions[2] if len(solutions) > 2 else "Drive growth")
-                    
-                    # Send email to validated address
-                    success = self.send_email(valid_email, subject, html_body)
-                    
-                    if success:
-                        # Update sheet with sent status and metadata
-                        self.leads_worksheet.update_cell(row_number, 12, "Sent")  # Status (Column L)
-                        self.leads_worksheet.update_cell(row_number, 11, subject)  # Subject (Column K)
-                        
-                        current_time = datetime.now(self.timezone)
-                        self.leads_worksheet.update_cell(row_number, 9, current_time.strftime("%Y-%m-%d"))  # Mail Send at (Column I)
-                        self.leads_worksheet.update_cell(row_number, 10, current_time.strftime("%H:%M:%S"))  # Mail Send time (Column J)
-                        
-                        logger.info(f"📧 Email sent to {valid_email} ({title})")
-                        sent_count += 1
-                        time.sleep(10)  # Rate limiting between emails
-                    else:
-                        logger.error(f"ERROR:  Failed to send email to {valid_email}")
-                
-                except Exception as e:
-                    logger.error(f"ERROR:  Error processing {valid_email}: {e}")
+            # Read the template once per run rather than once per email
+            html_template = self.load_email_template()
+            
+            # Content generation for upcoming leads overlaps with the paced SMTP sends
+            with ThreadPoolExecutor(max_workers=OUTREACH_WORKERS) as executor:
+                sent_count = sum(executor.map(lambda lead: self.send_outreach_email(html_template, *lead), candidates))
             
             logger.info(f"SUCCESS: Email outreach completed! Sent {sent_count} emails")
             
@@ -772,12 +975,27 @@ class PeekrAutomationMaster:
     # ==========================================
     # 3. REAL-TIME REPLY MONITORING
     # ==========================================
+    def spreadsheet_modified_time(self):
+        """Drive modifiedTime of the spreadsheet (a small metadata request), or None if unavailable"""
+        try:
+            get_last_update = getattr(self.sheet, 'get_lastUpdateTime', None)
+            return get_last_update() if get_last_update else self.sheet.lastUpdateTime
+        except Exception as e:
+            logger.debug(f"Could not read spreadsheet modified time: {e}")
+            return None
+    
     def load_valid_emails(self):
-        """Load valid emails for monitoring"""
+        """Load valid emails for monitoring (skipped while the spreadsheet is unchanged)"""
         try:
-            data = self.leads_worksheet.get_all_records()
-            emails = {row.get('Valid Email', '').strip().lower() for row in data if row.get('Valid Email')}
-            self.valid_emails = {email for email in emails if email and '@' in email}
+            # Read before the column so an edit made during the load triggers the next one
+            modified = self.spreadsheet_modified_time()
+            if modified is not None and modified == self._valid_emails_modified:
+                return True
+            
+            emails = self.load_lead_columns('Valid Email')['Valid Email'].str.strip().str.lower()
+            # Lowercased ASCII bytes, so fetched From addresses are checked without decoding
+            self.valid_emails = frozenset(email.encode('ascii', 'ignore') for email in emails if email and '@' in email)
+            self._valid_emails_modified = modified
             
             logger.info(f"📋 Loaded {len(self.valid_emails)} valid emails for monitoring")
             return True
@@ -789,84 +1007,116 @@ class PeekrAutomationMaster:
     def check_new_emails_fast(self):
         """Check for new emails quickly"""
         try:
-            # Test DNS resolution first
             # Get current email configuration
             email_config = self.get_email_config()
             
-            try:
-                socket.gethostbyname(email_config['IMAP_SERVER'])
-            except socket.gaierror:
-                return 0  # Skip this check if DNS resolution fails
-            
-            mail = imaplib.IMAP4_SSL(email_config['IMAP_SERVER'], email_config['IMAP_PORT'])
-            mail.login(email_config['EMAIL_ACCOUNT'], email_config['EMAIL_PASSWORD'])
-            mail.select("inbox")
-            
-            # Search for unseen emails
-            result, data = mail.search(None, '(UNSEEN)')
-            mail_ids = data[0].split()
-            
-            new_emails = 0
-            for mail_id in mail_ids:
-                # Get email headers quickly
-                result, msg_data = mail.fetch(mail_id, '(BODY[HEADER.FIELDS (FROM SUBJECT)])')
+            # Borrow a logged-in connection from the pool instead of a new TLS handshake + LOGIN.
+            # A pooled connection needs no DNS lookup; a new one resolves the host while connecting
+            with imap_pool.connection(email_config['IMAP_SERVER'], email_config['IMAP_PORT'],
+                                      email_config['EMAIL_ACCOUNT'], email_config['EMAIL_PASSWORD']) as mail:
+                mail.select("inbox")
                 
-                if result == 'OK' and msg_data[0]:
-                    header_data = msg_data[0][1].decode()
-                    
-                    # Extract sender
-                    from_match = re.search(r'From: (.+)', header_data)
-                    if from_match:
-                        from_line = from_match.group(1)
-                        from_email = re.findall(r'[\w\.-]+@[\w\.-]+', from_line)
+                # Search for unseen emails
+                result, data = mail.search(None, '(UNSEEN)')
+                mail_ids = data[0].split()
+                
+                new_emails = 0
+                # Get unseen headers with one FETCH per IMAP_FETCH_BATCH messages
+                # instead of one round-trip per message
+                msg_data = []
+                for start in range(0, len(mail_ids), IMAP_FETCH_BATCH):
+                    batch_ids = b','.join(mail_ids[start:start + IMAP_FETCH_BATCH])
+                    result, batch_data = mail.fetch(batch_ids, '(BODY[HEADER.FIELDS (FROM SUBJECT)])')
+                    if result == 'OK':
+                        msg_data.extend(batch_data)
+                
+                # Replies from known leads, by message id
+                replies = {}
+                for response_part in msg_data:
+                    if isinstance(response_part, tuple):
+                        mail_id = response_part[0].split()[0]
+                        header_data = response_part[1]
                         
-                        if from_email and from_email[0].lower() in self.valid_emails:
-                            # Extract subject
-                            subject_match = re.search(r'Subject: (.+)', header_data)
-                            subject = subject_match.group(1) if subject_match else "No Subject"
+                        # Extract sender
+                        from_match = HEADER_FROM_RE.search(header_data)
+                        if from_match:
+                            email_match = EMAIL_ADDRESS_RE.search(from_match.group(1))
+                            from_email = email_match.group(0).lower() if email_match else None
                             
-                            # Add to processing queue
-                            email_info = {
-                                'id': mail_id,
-                                'sender': from_email[0].lower(),
-                                'subject': subject.strip()
-                            }
+                            if from_email and from_email in self.valid_emails:
+                                # Extract subject
+                                subject_match = HEADER_SUBJECT_RE.search(header_data)
+                                subject = subject_match.group(1).decode(errors='replace') if subject_match else "No Subject"
+                                
+                                replies[mail_id] = {
+                                    'id': mail_id,
+                                    'sender': from_email.decode('ascii'),
+                                    'subject': subject.strip()
+                                }
+                
+                # Fetch the full replies in this same session, so the workers don't
+                # need an IMAP round-trip of their own
+                reply_ids = list(replies)
+                for start in range(0, len(reply_ids), IMAP_FETCH_BATCH):
+                    result, batch_data = mail.fetch(b','.join(reply_ids[start:start + IMAP_FETCH_BATCH]), '(RFC822)')
+                    if result != 'OK':
+                        continue
+                    for response_part in batch_data:
+                        if isinstance(response_part, tuple):
+                            email_info = replies.get(response_part[0].split()[0])
+                            if email_info is None:
+                                continue
+                            email_info['msg'] = email.message_from_bytes(response_part[1])
                             
+                            # Add to processing queue
                             self.email_queue.put(email_info)
                             new_emails += 1
             
-            mail.close()
-            mail.logout()
-            
             if new_emails > 0:
                 logger.info(f"📧 Found {new_emails} new emails to process")
             
             return new_emails
             
+        except socket.gaierror:
+            return 0  # Skip this check if DNS resolution fails
         except Exception as e:
             logger.error(f"ERROR:  Error checking emails: {e}")
             return 0
     
     def extract_email_body(self, msg):
-        """Extract text from email"""
-        body = ""
-        
-        if msg.is_multipart():
-            for part in msg.walk():
-                if part.get_content_type() == "text/plain":
-                    payload = part.get_payload(decode=True)
-                    if payload:
-                        body = payload.decode(errors='ignore')
-                        break
-        else:
-            payload = msg.get_payload(decode=True)
-            if payload:
-                body = payload.decode(errors='ignore')
+        """Extract text from email: the first text/plain part, else the first text/html part
+        converted with html_to_text. Returns (text, came_from_html)"""
+        for subtype in ('plain', 'html'):
+            for part in typed_subpart_iterator(msg, 'text', subtype):
+                payload = part.get_payload(decode=True)
+                if not payload:
+                    continue
+                
+                try:
+                    body = payload.decode(part.get_content_charset() or 'utf-8', errors='replace')
+                except LookupError:  # unknown charset name
+                    body = payload.decode('utf-8', errors='replace')
+                
+                if subtype == 'html':
+                    body = html_to_text(body)
+                return body.strip(), subtype == 'html'
         
-        return body.strip()
+        return "", False
     
-    def classify_interest(self, email_body):
-        """Classify email interest level using AI"""
+    def classify_interest(self, email_body, use_rules=True):
+        """Classify email interest level: clear opt-outs by rule, everything else by AI.
+        Pass use_rules=False for text recovered from HTML, whose leftover footer and
+        markup wording ("unsubscribe") shouldn't decide the label"""
+        interest_level = prefilter_reply(email_body) if use_rules else None
+        if interest_level is not None:
+            return interest_level
+        
+        # Repeated bodies (templated auto-responses) reuse the earlier classification
+        cache_key = normalize_reply(email_body)
+        cached = self._classification_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = classify(email_body)
             
@@ -881,7 +1131,9 @@ class PeekrAutomationMaster:
             )
             
             classification = response.choices[0].message.content.strip().upper()
-            return "INTERESTED" if "INTERESTED" in classification else "NOT INTERESTED"
+            interest_level = "NOT INTERESTED" if "NOT" in classification else "INTERESTED"
+            self._classification_cache.set(cache_key, interest_level)
+            return interest_level
             
         except Exception as e:
             logger.error(f"ERROR:  Error classifying interest: {e}")
@@ -890,22 +1142,26 @@ class PeekrAutomationMaster:
     def send_reply(self, to_email, original_subject, email_content, interest_level):
         """Send personalized reply"""
         try:
-            if interest_level == "INTERESTED":
-                prompt = generate_interested_reply(email_content)
-            else:
-                prompt = generate_not_interested_reply(email_content)
-            
-            response = self.openai_client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a professional B2B email writer. Generate personalized replies in HTML format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
-            
-            reply_content = response.choices[0].message.content.strip()
+            cache_key = (interest_level, normalize_reply(email_content))
+            reply_content = self._draft_cache.get(cache_key)
+            if reply_content is None:
+                if interest_level == "INTERESTED":
+                    prompt = generate_interested_reply(email_content)
+                else:
+                    prompt = generate_not_interested_reply(email_content)
+                
+                response = self.openai_client.chat.completions.create(
+                    model=Config.OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": "You are a professional B2B email writer. Generate personalized replies in HTML format."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=1000
+                )
+                
+                reply_content = response.choices[0].message.content.strip()
+                self._draft_cache.set(cache_key, reply_content)
             
             # Send email
             subject = f"Re: {original_subject}" if original_subject else "Thank you for your response"
@@ -919,9 +1175,8 @@ class PeekrAutomationMaster:
             msg["Subject"] = subject
             msg.attach(MIMEText(reply_content, "html"))
             
-            with smtplib.SMTP_SSL(email_config['SMTP_SERVER'], email_config['SMTP_PORT']) as server:
-                server.login(email_config['EMAIL_ACCOUNT'], email_config['EMAIL_PASSWORD'])
-                server.sendmail(email_config['EMAIL_ACCOUNT'], to_email, msg.as_string())
+            with self.smtp_connection(email_config) as server:
+                server.send_message(msg)
             
             logger.info(f"SUCCESS: {interest_level} reply sent to {to_email}")
             return True
@@ -930,77 +1185,108 @@ class PeekrAutomationMaster:
             logger.error(f"ERROR:  Error sending reply to {to_email}: {e}")
             return False
     
+    def refresh_lead_index(self):
+        """Rebuild the valid email -> row index from the Valid Email column (D)"""
+        index = {}
+        for i, valid_email in enumerate(self.leads_worksheet.col_values(4)[1:], start=2):
+            index.setdefault(valid_email.strip().lower(), i)  # first matching row wins
+        self._lead_index = index
+        self._lead_index_time = time.monotonic()
+    
+    def find_lead_row(self, email):
+        """Sheet row of the lead with this valid email, or None"""
+        email = email.lower()
+        row = None
+        if time.monotonic() - self._lead_index_time <= LEAD_INDEX_TTL:
+            row = self._lead_index.get(email)
+        if row is None:
+            # Stale index, or a lead added since it was built
+            self.refresh_lead_index()
+            row = self._lead_index.get(email)
+        return row
+    
     def update_lead_status(self, email, status, reply_content=""):
-        """Update lead status in Google Sheets"""
+        """Queue a lead status update for Google Sheets"""
         try:
-            data = self.leads_worksheet.get_all_records()
-            for i, row in enumerate(data, start=2):
-                if row.get('Valid Email', '').strip().lower() == email.lower():
-                    current_date = datetime.now(self.timezone).strftime('%Y-%m-%d')
-                    
-                    # Update reply tracking
-                    self.leads_worksheet.update_cell(i, 13, "YES")  # Mail Received (Column M)
-                    self.leads_worksheet.update_cell(i, 14, reply_content[:500])  # Reply Message (Column N)
-                    self.leads_worksheet.update_cell(i, 15, "YES")  # Mail reply send (Column O)
-                    self.leads_worksheet.update_cell(i, 21, status)  # Reply Received (Column U)
-                    self.leads_worksheet.update_cell(i, 22, current_date)  # Reply Date (Column V)
-                    
-                    break
-                    
+            i = self.find_lead_row(email)
+            if i is not None:
+                current_date = datetime.now(self.timezone).strftime('%Y-%m-%d')
+                
+                with self._status_lock:
+                    if not self._status_updates:
+                        self._status_updates_since = time.monotonic()
+                    self._status_updates.append([
+                        # Mail Received, Reply Message, Mail reply send (Columns M-O)
+                        {'range': f'M{i}:O{i}', 'values': [["YES", reply_content[:500], "YES"]]},
+                        # Reply Received, Reply Date (Columns U-V)
+                        {'range': f'U{i}:V{i}', 'values': [[status, current_date]]},
+                    ])
+                self.flush_lead_status(force=False)
+                
         except Exception as e:
             logger.error(f"ERROR:  Error updating lead status: {e}")
     
+    def flush_lead_status(self, force=True):
+        """Write queued lead status updates in one batch_update.
+        Unless forced, waits for STATUS_FLUSH_SIZE leads or STATUS_FLUSH_SECONDS"""
+        with self._status_lock:
+            if not self._status_updates:
+                return
+            if (not force and len(self._status_updates) < STATUS_FLUSH_SIZE
+                    and time.monotonic() - self._status_updates_since < STATUS_FLUSH_SECONDS):
+                return
+            pending, self._status_updates = self._status_updates, []
+        
+        try:
+            self.leads_worksheet.batch_update([update for updates in pending for update in updates],
+                                              value_input_option='USER_ENTERED')
+        except Exception as e:
+            logger.error(f"ERROR:  Error updating lead status for {len(pending)} leads: {e}")
+    
     def process_email_detailed(self, email_info):
         """Process email in detail"""
         try:
-            # Get current email configuration
-            email_config = self.get_email_config()
-            
-            mail = imaplib.IMAP4_SSL(email_config['IMAP_SERVER'], email_config['IMAP_PORT'])
-            mail.login(email_config['EMAIL_ACCOUNT'], email_config['EMAIL_PASSWORD'])
-            mail.select("inbox")
-            
-            # Get full email content
-            result, msg_data = mail.fetch(email_info['id'], "(RFC822)")
+            # The full message was fetched by check_new_emails_fast; fetching the
+            # headers there already flagged it \Seen
+            msg = email_info['msg']
+            
+            # Get email body
+            email_body, from_html = self.extract_email_body(msg)
+            
+            if not email_body.strip():
+                return True
+            
+            logger.info(f"📧 Processing reply from: {email_info['sender']}")
+            
+            # Only the reply itself goes to OpenAI, not the quoted thread
+            reply_text = clean_reply_text(email_body)
+            
+            # Don't answer autoresponders or mark the lead from one; out-of-office
+            # wording in the body is left to the classifier
+            if is_auto_reply(msg):
+                logger.info(f"🤖 Skipping auto-reply from: {email_info['sender']}")
+                self.stats['emails_processed'] += 1
+                return True
+            
+            # Classify interest level
+            interest_level = self.classify_interest(reply_text[:CLASSIFY_INPUT_CHARS], use_rules=not from_html)
+            logger.info(f"🎯 Interest level: {interest_level}")
+            
+            # Send appropriate reply
+            reply_sent = self.send_reply(
+                email_info['sender'], 
+                email_info['subject'], 
+                reply_text, 
+                interest_level
+            )
             
-            for response_part in msg_data:
-                if isinstance(response_part, tuple):
-                    msg = email.message_from_bytes(response_part[1])
-                    
-                    # Get email body
-                    email_body = self.extract_email_body(msg)
-                    
-                    if not email_body.strip():
-                        continue
-                    
-                    logger.info(f"📧 Processing reply from: {email_info['sender']}")
-                    
-                    # Classify interest level
-                    interest_level = self.classify_interest(email_body)
-                    logger.info(f"🎯 Interest level: {interest_level}")
-                    
-                    # Send appropriate reply
-                    reply_sent = self.send_reply(
-                        email_info['sender'], 
-                        email_info['subject'], 
-                        email_body, 
-                        interest_level
-                    )
-                    
-                    # Update statistics
-                    self.stats['emails_processed'] += 1
-                    if reply_sent:
-                        self.stats['replies_sent'] += 1
-                        # Update Google Sheet
-                        self.update_lead_status(email_info['sender'], interest_level, email_body)
-                    
-                    # Mark email as read
-                    mail.store(email_info['id'], '+FLAGS', '\\Seen')
-                    
-                    break
+            # Update statistics
+            self.stats['emails_processed'] += 1
+            if reply_sent:
+                self.stats['replies_sent'] += 1
+                # Update Google Sheet
+                self.update_lead_status(email_info['sender'], interest_level, email_body)
             
-            mail.close()
-            mail.logout()
             return True
             
         except Exception as e:
@@ -1015,8 +1301,11 @@ class PeekrAutomationMaster:
                 email_info = self.email_queue.get(timeout=5)
                 success = self.process_email_detailed(email_info)
                 self.email_queue.task_done()
+                # Write the queued status updates once the backlog is drained
+                self.flush_lead_status(force=self.email_queue.empty())
                 
             except queue.Empty:
+                self.flush_lead_status(force=False)
                 continue
             except Exception as e:
                 logger.error(f"ERROR:  Error in email processor worker: {e}")
@@ -1069,7 +1358,11 @@ class PeekrAutomationMaster:
                         # Reload valid emails
                         self.load_valid_emails()
                     
-                    time.sleep(check_interval)
+                    # Sleep until the server pushes new mail (or check_interval without IDLE)
+                    email_config = self.get_email_config()
+                    self.inbox_watcher.wait(email_config['IMAP_SERVER'], email_config['IMAP_PORT'],
+                                            email_config['EMAIL_ACCOUNT'], email_config['EMAIL_PASSWORD'],
+                                            IDLE_WAIT_SECONDS, check_interval)
                     
                 except Exception as e:
                     consecutive_errors += 1
@@ -1095,78 +1388,56 @@ class PeekrAutomationMaster:
     def get_follow_up_candidates(self):
         """Get candidates who need follow-up emails"""
         try:
-            data = self.leads_worksheet.get_all_records()
-            candidates = []
-            current_date = datetime.now(self.timezone)
-            
-            for i, row in enumerate(data, start=2):
-                email = row.get('Valid Email', '').strip().lower()
-                status = row.get('Status', '').strip()
-                mail_received = row.get('Mail Received', '').strip()
-                reply_message = row.get('Reply Message', '').strip()
-                followup_count = int(row.get('Follow-up Count', 0) or 0)
-                last_followup_date = row.get('Last Follow-up Date', '').strip()
-                reply_received = row.get('Reply Received', '').strip()
-                
-                # Skip if no email or already sent 3 follow-ups
-                if not email or followup_count >= 3:
-                    continue
-                
-                needs_followup = False
-                followup_type = None
-                
-                # Case 1: No response (non-responder)
-                if not reply_message and (status == 'Sent' and mail_received != 'YES'):
-                    if followup_count == 0:
-                        sent_date_str = row.get('Mail Send at', '')
-                        if sent_date_str:
-                            try:
-                                sent_date = datetime.strptime(sent_date_str, '%Y-%m-%d')
-                                if current_date >= sent_date + timedelta(days=7):
-                                    needs_followup = True
-                                    followup_type = 'NON_RESPONDER'
-                            except ValueError:
-                                pass
-                    elif followup_count > 0 and last_followup_date:
-                        try:
-                            last_date = datetime.strptime(last_followup_date, '%Y-%m-%d')
-                            if current_date >= last_date + timedelta(days=7):
-                                needs_followup = True
-                                followup_type = 'NON_RESPONDER'
-                        except ValueError:
-                            pass
-                
-                # Case 2: Replied "NOT INTERESTED"
-                elif reply_received and 'NOT INTERESTED' in reply_received.upper():
-                    if followup_count == 0:
-                        reply_date_str = row.get('Reply Date', '')
-                        if reply_date_str:
-                            try:
-                                reply_date = datetime.strptime(reply_date_str, '%Y-%m-%d')
-                                if current_date >= reply_date + timedelta(days=14):
-                                    needs_followup = True
-                                    followup_type = 'NOT_INTERESTED'
-                            except ValueError:
-                                pass
-                    elif followup_count > 0 and last_followup_date:
-                        try:
-                            last_date = datetime.strptime(last_followup_date, '%Y-%m-%d')
-                            if current_date >= last_date + timedelta(days=14):
-                                needs_followup = True
-                                followup_type = 'NOT_INTERESTED'
-                        except ValueError:
-                            pass
-                
-                if needs_followup:
-                    candidates.append({
-                        'row_index': i,
-                        'email': email,
-                        'title': row.get('Title', ''),
-                        'category': row.get('Category', ''),
-                        'website': row.get('Website', ''),
-                        'followup_count': followup_count,
-                        'followup_type': followup_type
-                    })
+            # One raw snapshot of the sheet, filtered with vectorized column operations
+            values = self.leads_worksheet.get_all_values()
+            df = pd.DataFrame(values[1:], columns=values[0] if values else [])
+            df = df.loc[:, ~df.columns.duplicated()]
+            
+            def column(name):
+                return df[name].str.strip() if name in df else pd.Series('', index=df.index)
+            
+            def date_column(name):
+                # Sheet dates are YYYY-MM-DD; anything else becomes NaT and never compares as due
+                return pd.to_datetime(column(name), format='%Y-%m-%d', errors='coerce')
+            
+            # Sheet dates are naive local dates, so compare against naive local time
+            current_date = pd.Timestamp(datetime.now(self.timezone).replace(tzinfo=None))
+            
+            email = column('Valid Email').str.lower()
+            followup_count = pd.to_numeric(column('Follow-up Count'), errors='coerce').fillna(0).astype(int)
+            first_followup = followup_count.eq(0)
+            last_followup_date = date_column('Last Follow-up Date')
+            
+            # Skip if no email or already sent 3 follow-ups
+            eligible = email.ne('') & followup_count.lt(3)
+            
+            # Case 1: No response (non-responder), 7 days after the outreach or last follow-up
+            no_response = (column('Reply Message').eq('') & column('Status').eq('Sent')
+                           & column('Mail Received').ne('YES'))
+            due_since = date_column('Mail Send at').where(first_followup, last_followup_date)
+            non_responder = eligible & no_response & (current_date >= due_since + timedelta(days=7))
+            
+            # Case 2: Replied "NOT INTERESTED", 14 days after the reply or last follow-up
+            replied_not_interested = ~no_response & column('Reply Received').str.upper().str.contains('NOT INTERESTED', regex=False)
+            due_since = date_column('Reply Date').where(first_followup, last_followup_date)
+            not_interested = eligible & replied_not_interested & (current_date >= due_since + timedelta(days=14))
+            
+            selected = non_responder | not_interested
+            candidates = [
+                {
+                    'row_index': index + 2,
+                    'email': lead_email,
+                    'title': title,
+                    'category': category,
+                    'website': website,
+                    'followup_count': count,
+                    'followup_type': 'NON_RESPONDER' if is_non_responder else 'NOT_INTERESTED'
+                }
+                for index, lead_email, title, category, website, count, is_non_responder in zip(
+                    df.index[selected], email[selected], column('Title')[selected],
+                    column('Category')[selected], column('Website')[selected],
+                    followup_count[selected].tolist(), non_responder[selected])
+            ]
             
             logger.info(f"📋 Found {len(candidates)} candidates for follow-up")
             return candidates
@@ -1179,29 +1450,37 @@ class PeekrAutomationMaster:
         """Send follow-up email"""
         try:
             if candidate['followup_type'] == 'NON_RESPONDER':
-                prompt = generate_followup_prompt(
-                    candidate['title'], 
-                    candidate['category'], 
-                    candidate['website']
-                )
+                cache_key = ('NON_RESPONDER', candidate['title'], candidate['category'], candidate['website'])
                 subject = f"Following up - {candidate['title']}"
             else:  # NOT_INTERESTED
-                prompt = generate_not_interested_reply(
-                    f"Previous response: Not interested. Follow-up #{candidate['followup_count'] + 1}"
-                )
+                cache_key = ('NOT_INTERESTED', candidate['followup_count'])
                 subject = f"Re: Following up - {candidate['title']}"
             
-            response = self.openai_client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a professional B2B email writer. Generate follow-up emails in HTML format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
-            
-            email_content = response.choices[0].message.content.strip()
+            email_content = self._draft_cache.get(cache_key)
+            if email_content is None:
+                if candidate['followup_type'] == 'NON_RESPONDER':
+                    prompt = generate_followup_prompt(
+                        candidate['title'], 
+                        candidate['category'], 
+                        candidate['website']
+                    )
+                else:
+                    prompt = generate_not_interested_reply(
+                        f"Previous response: Not interested. Follow-up #{candidate['followup_count'] + 1}"
+                    )
+                
+                response = self.openai_client.chat.completions.create(
+                    model=Config.OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": "You are a professional B2B email writer. Generate follow-up emails in HTML format."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=800
+                )
+                
+                email_content = response.choices[0].message.content.strip()
+                self._draft_cache.set(cache_key, email_content)
             
             # Send email
             # Get current email configuration
@@ -1213,8 +1492,9 @@ class PeekrAutomationMaster:
             msg["Subject"] = subject
             msg.attach(MIMEText(email_content, "html"))
             
-            with smtplib.SMTP_SSL(email_config['SMTP_SERVER'], email_config['SMTP_PORT']) as server:
-                server.login(email_config['EMAIL_ACCOUNT'], email_config['EMAIL_PASSWORD'])
+            # Paced across all follow-up workers
+            self.followup_rate_limiter.wait()
+            with self.smtp_connection(email_config) as server:
                 server.send_message(msg)
             
             logger.info(f"SUCCESS: Follow-up #{candidate['followup_count'] + 1} sent to {candidate['email']}")
@@ -1224,28 +1504,29 @@ class PeekrAutomationMaster:
             logger.error(f"ERROR:  Error sending follow-up to {candidate['email']}: {e}")
             return False
     
-    def update_followup_tracking(self, candidate, success):
-        """Update follow-up tracking in Google Sheets"""
+    def update_followup_tracking(self, candidate, pending_updates):
+        """Queue the follow-up tracking update for a sent follow-up onto pending_updates"""
+        row_index = candidate['row_index']
+        new_count = candidate['followup_count'] + 1
+        current_date = datetime.now(self.timezone).strftime('%Y-%m-%d')
+        
+        # Update status
+        if new_count >= 3:
+            status = f"Follow-up Complete (3/3) SUCCESS:"
+        else:
+            status = f"Follow-up Sent ({new_count}/3) 📧"
+        
+        # Follow-up Count, Last Follow-up Date, Follow-up Status (Columns R-T)
+        pending_updates.append({'range': f'R{row_index}:T{row_index}', 'values': [[new_count, current_date, status]]})
+        
+        logger.info(f"📊 Updated tracking for {candidate['email']}: {new_count}/3")
+    
+    def flush_followup_tracking(self, pending_updates):
+        """Write all queued follow-up tracking updates in one batch_update"""
+        if not pending_updates:
+            return
         try:
-            if success:
-                row_index = candidate['row_index']
-                new_count = candidate['followup_count'] + 1
-                current_date = datetime.now(self.timezone).strftime('%Y-%m-%d')
-                
-                # Update tracking columns
-                self.leads_worksheet.update_cell(row_index, 18, new_count)  # Follow-up Count (Column R)
-                self.leads_worksheet.update_cell(row_index, 19, current_date)  # Last Follow-up Date (Column S)
-                
-                # Update status
-                if new_count >= 3:
-                    status = f"Follow-up Complete (3/3) SUCCESS:"
-                else:
-                    status = f"Follow-up Sent ({new_count}/3) 📧"
-                
-                self.leads_worksheet.update_cell(row_index, 20, status)  # Follow-up Status (Column T)
-                
-                logger.info(f"📊 Updated tracking for {candidate['email']}: {new_count}/3")
-            
+            self.leads_worksheet.batch_update(pending_updates, value_input_option='USER_ENTERED')
         except Exception as e:
             logger.error(f"ERROR:  Error updating tracking: {e}")
     
@@ -1261,14 +1542,21 @@ class PeekrAutomationMaster:
                 return
             
             sent_count = 0
-            for candidate in candidates:
-                success = self.send_followup_email(candidate)
-                self.update_followup_tracking(candidate, success)
-                
-                if success:
-                    sent_count += 1
-                
-                time.sleep(2)  # Rate limiting
+            pending_updates = []
+            
+            def send_and_track(candidate):
+                if not self.send_followup_email(candidate):
+                    return False
+                self.update_followup_tracking(candidate, pending_updates)
+                return True
+            
+            try:
+                # Drafts for upcoming candidates are generated while earlier ones are sent
+                with ThreadPoolExecutor(max_workers=FOLLOWUP_WORKERS) as executor:
+                    sent_count = sum(executor.map(send_and_track, candidates))
+            finally:
+                # Record every follow-up sent so far, even if the campaign stopped early
+                self.flush_followup_tracking(pending_updates)
             
             logger.info(f"🎉 Follow-up campaign completed! Sent {sent_count}/{len(candidates)} emails")
             
@@ -1328,6 +1616,13 @@ class PeekrAutomationMaster:
             logger.info("👋 Peekr Automation Master stopped.")
         except Exception as e:
             logger.error(f"ERROR:  Master automation error: {e}")
+        finally:
+            # Write queued reply statuses and log out the persistent IMAP/SMTP connections
+            # however the loop ends
+            self.flush_lead_status()
+            self.inbox_watcher.close()
+            imap_pool.close_all()
+            smtp_pool.close_all()
 
 # ==========================================
 # MAIN ENTRY POINT
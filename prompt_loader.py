@@ -1,4 +1,11 @@
 import os
+import functools
+
+@functools.lru_cache(maxsize=32)
+def _read_prompt_file(prompt_path, mtime_ns, size):
+    """Read a prompt file; cached per (path, mtime, size) so edits are picked up"""
+    with open(prompt_path, "r", encoding="utf-8") as file:
+        return file.read()
 
 def load_prompt(prompt_name):
     """
@@ -12,8 +19,10 @@ def load_prompt(prompt_name):
     """
     try:
         prompt_path = os.path.join("prompts", f"{prompt_name}.txt")
-        with open(prompt_path, "r", encoding="utf-8") as file:
-            return file.read()
+        # A stat per call instead of open + read; the dashboard can edit prompts
+        # while the automation is running
+        stat = os.stat(prompt_path)
+        return _read_prompt_file(prompt_path, stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
         raise FileNotFoundError(f"Prompt file '{prompt_name}.txt' not found in prompts folder")
     except Exception as e:
@@ -0,0 +1,86 @@
+"""
+SMTP Connection Pool
+Keeps authenticated SMTP connections alive between sends so outreach, replies
+and follow-ups don't pay a TLS handshake + LOGIN for every email
+"""
+
+import ssl
+import time
+import smtplib
+import threading
+from contextlib import contextmanager
+
+# One TLS context for every pooled connection (creating it loads the CA store)
+SSL_CONTEXT = ssl.create_default_context()
+
+# Idle (connection, released_at) pairs keyed on (server, port, account); a connection
+# is removed while borrowed so two threads never talk over the same socket
+_SMTP_POOL = {}
+_pool_lock = threading.Lock()
+
+# SMTP servers close idle sessions after a few minutes; older connections are
+# discarded without spending a NOOP round-trip on them
+MAX_IDLE_SECONDS = 4 * 60
+
+# Errors that mean the connection itself is unusable (SMTPException is an OSError)
+CONNECTION_ERRORS = (smtplib.SMTPException, OSError)
+
+def _discard(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+def get_conn(server, port, account, password):
+    """Borrow an authenticated connection, reusing an idle one when it still answers NOOP"""
+    key = (server, port, account)
+    while True:
+        with _pool_lock:
+            idle = _SMTP_POOL.get(key)
+            conn, released_at = idle.pop() if idle else (None, None)
+        if conn is None:
+            break
+        if time.monotonic() - released_at > MAX_IDLE_SECONDS:
+            _discard(conn)
+            continue
+        try:
+            if conn.noop()[0] == 250:
+                return conn
+        except CONNECTION_ERRORS:
+            pass
+        _discard(conn)
+    
+    conn = smtplib.SMTP_SSL(server, port, context=SSL_CONTEXT)
+    try:
+        conn.login(account, password)
+    except BaseException:
+        _discard(conn)
+        raise
+    return conn
+
+def release_conn(conn, server, port, account):
+    """Return a borrowed connection to the pool"""
+    with _pool_lock:
+        _SMTP_POOL.setdefault((server, port, account), []).append((conn, time.monotonic()))
+
+@contextmanager
+def connection(server, port, account, password):
+    """Context manager around get_conn/release_conn; drops the connection on error"""
+    conn = get_conn(server, port, account, password)
+    try:
+        yield conn
+    except BaseException:
+        _discard(conn)
+        raise
+    release_conn(conn, server, port, account)
+
+def close_all():
+    """Quit every idle pooled connection"""
+    with _pool_lock:
+        conns = [conn for idle in _SMTP_POOL.values() for conn, _ in idle]
+        _SMTP_POOL.clear()
+    for conn in conns:
+        try:
+            conn.quit()
+        except Exception:
+            _discard(conn)
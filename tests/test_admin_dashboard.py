@@ -0,0 +1,76 @@
+"""
+Tests for the dashboard's lead cleaning and headline counts
+"""
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('pyarrow')
+pytest.importorskip('streamlit')
+pytest.importorskip('plotly')
+pytest.importorskip('gspread')
+pytest.importorskip('dotenv')
+pytest.importorskip('psutil')
+
+import admin_dashboard
+from admin_dashboard import AdminDashboard, compute_lead_counts
+
+def make_leads():
+    return pd.DataFrame({
+        'Company': ['Acme', 'Globex', 'Initech', 'Umbrella'],
+        'Category': ['Retail', 'Retail', 'Tech', 'Tech'],
+        'Valid Email': ['a@acme.com', '', 'i@initech.com', None],
+        'Status': [' sent', 'Pending', 'Sent ', 'sent'],
+        'Mail Received': ['YES', '', 'YES', 'NO'],
+        'Reply Received': ['INTERESTED', '', 'NOT INTERESTED', ''],
+        'Mail Send at': ['2024-01-02', '', '2024-01-03', 'bad date'],
+    })
+
+def test_flag_columns_are_numpy_bools():
+    df = AdminDashboard.clean_leads_data(None, make_leads())
+    
+    for flag in admin_dashboard.FLAG_COLUMNS:
+        assert df[flag].dtype == bool
+    assert df['_has_email'].tolist() == [True, False, True, False]
+
+def test_text_columns_move_to_arrow_strings():
+    leads = make_leads().astype({'Company': object})
+    df = AdminDashboard.clean_leads_data(None, leads)
+    
+    assert df['Company'].dtype == admin_dashboard.TEXT_DTYPE
+    assert df['Valid Email'].dtype == admin_dashboard.TEXT_DTYPE
+    assert df['Valid Email'].tolist() == ['a@acme.com', '', 'i@initech.com', '']
+    assert df['Status'].dtype == 'category'
+
+def test_clean_then_count():
+    df = AdminDashboard.clean_leads_data(None, make_leads())
+    
+    assert compute_lead_counts(df) == {
+        'total': 4,
+        'valid': 2,
+        'sent': 3,
+        'responses': 2,
+        'interested': 1,
+    }
+
+@pytest.mark.parametrize('dtype', [bool, 'boolean', 'bool[pyarrow]'])
+def test_count_does_not_depend_on_flag_dtype(dtype):
+    flags = pd.Series([True, False, True], dtype=dtype)
+    leads = pd.DataFrame({flag: flags for flag in admin_dashboard.FLAG_COLUMNS})
+    
+    assert compute_lead_counts(leads) == {
+        'total': 3,
+        'valid': 2,
+        'sent': 2,
+        'responses': 2,
+        'interested': 2,
+    }
+
+def test_count_handles_missing_flags():
+    assert compute_lead_counts(pd.DataFrame({'Company': ['Acme']})) == {
+        'total': 1,
+        'valid': 0,
+        'sent': 0,
+        'responses': 0,
+        'interested': 0,
+    }
@@ -0,0 +1,81 @@
+"""
+Tests for the mtime-keyed active email config cache
+"""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip('dotenv')
+
+import config
+from config import Config, invalidate_email_config_cache
+
+def make_account(email, **extra):
+    account = {
+        'id': email.split('@')[0],
+        'name': 'Sales Team',
+        'email': email,
+        'password': 'secret',
+        'smtp_server': 'smtp.example.com',
+        'smtp_port': 465,
+        'imap_server': 'imap.example.com',
+        'imap_port': 993,
+        'is_active': True,
+    }
+    account.update(extra)
+    return account
+
+def write_accounts(path, *accounts, mtime_ns=None):
+    path.write_text(json.dumps(list(accounts)), encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+@pytest.fixture
+def accounts_file(tmp_path, monkeypatch):
+    path = tmp_path / 'email_accounts.json'
+    monkeypatch.setattr(config, 'EMAIL_ACCOUNTS_FILE', str(path))
+    invalidate_email_config_cache()
+    yield path
+    invalidate_email_config_cache()
+
+def test_unchanged_file_is_served_from_cache(accounts_file):
+    write_accounts(accounts_file, make_account('sales@example.com'))
+    
+    first = Config.get_active_email_config()
+    
+    assert first['EMAIL_ACCOUNT'] == 'sales@example.com'
+    assert Config.get_active_email_config() is first
+
+def test_rewritten_file_is_reloaded(accounts_file):
+    write_accounts(accounts_file, make_account('sales@example.com'), mtime_ns=1_000_000_000)
+    assert Config.get_active_email_config()['EMAIL_ACCOUNT'] == 'sales@example.com'
+    
+    write_accounts(accounts_file, make_account('support@example.com'), mtime_ns=2_000_000_000)
+    assert Config.get_active_email_config()['EMAIL_ACCOUNT'] == 'support@example.com'
+
+def test_invalidate_reloads_same_mtime_and_size(accounts_file):
+    # Same size and mtime: only an explicit invalidation can see the change
+    write_accounts(accounts_file, make_account('sales1@example.com'), mtime_ns=1_000_000_000)
+    assert Config.get_active_email_config()['EMAIL_ACCOUNT'] == 'sales1@example.com'
+    
+    write_accounts(accounts_file, make_account('sales2@example.com'), mtime_ns=1_000_000_000)
+    assert Config.get_active_email_config()['EMAIL_ACCOUNT'] == 'sales1@example.com'
+    
+    invalidate_email_config_cache()
+    assert Config.get_active_email_config()['EMAIL_ACCOUNT'] == 'sales2@example.com'
+
+def test_missing_file_falls_back_to_environment(accounts_file, monkeypatch):
+    monkeypatch.setattr(Config, 'EMAIL_ACCOUNT', 'env@example.com')
+    
+    assert Config.get_active_email_config()['EMAIL_ACCOUNT'] == 'env@example.com'
+    
+    write_accounts(accounts_file, make_account('sales@example.com'))
+    assert Config.get_active_email_config()['EMAIL_ACCOUNT'] == 'sales@example.com'
+
+def test_cached_config_is_read_only(accounts_file):
+    write_accounts(accounts_file, make_account('sales@example.com'))
+    
+    with pytest.raises(TypeError):
+        Config.get_active_email_config()['EMAIL_ACCOUNT'] = 'other@example.com'
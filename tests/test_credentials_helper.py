@@ -0,0 +1,43 @@
+"""
+Tests for service account credential decoding
+"""
+
+import base64
+import json
+
+import pytest
+
+pytest.importorskip('dotenv')
+
+import credentials_helper
+from credentials_helper import create_credentials_from_env
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    credentials_helper._decode_credentials.cache_clear()
+    yield
+    credentials_helper._decode_credentials.cache_clear()
+
+def encode(info):
+    return base64.b64encode(json.dumps(info).encode()).decode()
+
+def test_failure_is_not_cached(monkeypatch):
+    monkeypatch.setattr(credentials_helper.Config, 'GOOGLE_CREDENTIALS_JSON', 'not base64 json')
+    assert create_credentials_from_env() is None
+    
+    monkeypatch.setattr(credentials_helper.Config, 'GOOGLE_CREDENTIALS_JSON', encode({'type': 'service_account'}))
+    assert create_credentials_from_env() == {'type': 'service_account'}
+
+def test_missing_env_is_not_cached(monkeypatch):
+    monkeypatch.setattr(credentials_helper.Config, 'GOOGLE_CREDENTIALS_JSON', None)
+    assert create_credentials_from_env() is None
+    
+    monkeypatch.setattr(credentials_helper.Config, 'GOOGLE_CREDENTIALS_JSON', encode({'project_id': 'peekr'}))
+    assert create_credentials_from_env() == {'project_id': 'peekr'}
+
+def test_success_is_decoded_once(monkeypatch):
+    monkeypatch.setattr(credentials_helper.Config, 'GOOGLE_CREDENTIALS_JSON', encode({'project_id': 'peekr'}))
+    first = create_credentials_from_env()
+    
+    assert create_credentials_from_env() is first
+    assert credentials_helper._decode_credentials.cache_info().hits == 1
@@ -0,0 +1,68 @@
+"""
+Tests for the diagnostic's cached IMAP address resolution
+"""
+
+import socket
+
+import pytest
+
+pytest.importorskip('dotenv')
+
+import diagnose_email_fetching
+from diagnose_email_fetching import ResolvedIMAP4_SSL, resolve_imap_server
+
+class PassthroughContext:
+    def wrap_socket(self, sock, server_hostname=None):
+        return sock
+
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()
+
+def make_client(addrinfos):
+    client = ResolvedIMAP4_SSL.__new__(ResolvedIMAP4_SSL)
+    client.host = 'imap.example.com'
+    client.addrinfos = addrinfos
+    client.ssl_context = PassthroughContext()
+    return client
+
+def test_resolution_keeps_every_address(monkeypatch):
+    diagnose_email_fetching._getaddrinfo_cached.cache_clear()
+    results = [
+        (socket.AF_INET6, socket.SOCK_STREAM, 6, '', ('2001:db8::1', 993, 0, 0)),
+        (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('192.0.2.1', 993)),
+    ]
+    calls = []
+    monkeypatch.setattr(socket, 'getaddrinfo', lambda *args, **kwargs: calls.append(args) or results)
+    
+    addrinfos = resolve_imap_server('imap.example.com', 993)
+    
+    assert [sockaddr for *_, sockaddr in addrinfos] == [('2001:db8::1', 993, 0, 0), ('192.0.2.1', 993)]
+    assert resolve_imap_server('imap.example.com', 993) is addrinfos
+    assert len(calls) == 1
+    diagnose_email_fetching._getaddrinfo_cached.cache_clear()
+
+def test_connect_falls_through_to_next_address():
+    with socket.socket() as server:
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        client = make_client((
+            (socket.AF_INET, socket.SOCK_STREAM, 0, closed_port()),
+            (socket.AF_INET, socket.SOCK_STREAM, 0, server.getsockname()),
+        ))
+        
+        sock = client._create_socket(timeout=5)
+        try:
+            assert sock.getpeername() == server.getsockname()
+        finally:
+            sock.close()
+
+def test_connect_raises_last_error_when_all_fail():
+    client = make_client((
+        (socket.AF_INET, socket.SOCK_STREAM, 0, closed_port()),
+        (socket.AF_INET, socket.SOCK_STREAM, 0, closed_port()),
+    ))
+    
+    with pytest.raises(ConnectionRefusedError):
+        client._create_socket(timeout=5)
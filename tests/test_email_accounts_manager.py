@@ -0,0 +1,53 @@
+"""
+Tests for EmailAccountsManager persistence and lookups
+"""
+
+import pytest
+
+from email_accounts_manager import EmailAccountsManager
+
+def make_account(account_id, email, **extra):
+    account = {
+        'id': account_id,
+        'name': account_id.title(),
+        'email': email,
+        'password': 'secret',
+        'smtp_server': 'smtp.example.com',
+        'smtp_port': 465,
+        'imap_server': 'imap.example.com',
+        'imap_port': 993,
+    }
+    account.update(extra)
+    return account
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = EmailAccountsManager(str(tmp_path / 'email_accounts.json'))
+    assert manager.add_account(make_account('sales', 'sales@example.com', is_active=True))
+    return manager
+
+def test_increment_is_saved_immediately(manager):
+    assert manager.increment_sent_count('sales', last_used='2024-01-02T09:00:00')
+    assert manager.increment_sent_count('sales')
+    
+    reloaded = EmailAccountsManager(manager.accounts_file)
+    account = reloaded.get_account_by_id('sales')
+    assert account['sent_today'] == 2
+    assert account['last_used'] != '2024-01-02T09:00:00'
+
+def test_increment_unknown_account(manager):
+    assert not manager.increment_sent_count('missing')
+    assert manager.get_account_by_id('sales')['sent_today'] == 0
+
+def test_reset_daily_counts_persists(manager):
+    manager.increment_sent_count('sales')
+    assert manager.reset_daily_counts()
+    
+    assert EmailAccountsManager(manager.accounts_file).get_account_stats()['total_sent_today'] == 0
+
+def test_duplicate_id_resolves_to_first_account(manager):
+    assert manager.add_account(make_account('sales', 'other@example.com'))
+    
+    assert manager.get_account_by_id('sales')['email'] == 'sales@example.com'
+    manager._rebuild_index()
+    assert manager.get_account_by_id('sales')['email'] == 'sales@example.com'
@@ -0,0 +1,208 @@
+"""
+Tests for the keyed IMAP connection pool
+"""
+
+import imaplib
+import ssl
+import time
+
+import pytest
+
+import imap_pool
+
+KEY = ('imap.example.com', 993, 'sales@example.com')
+
+class FakeSocket:
+    def __init__(self, session):
+        self.session = session
+
+class FakeIMAP:
+    def __init__(self, host, port, tls_session=None):
+        self.host = host
+        self.port = port
+        self.tls_session = tls_session
+        self.sock = FakeSocket(f"session-{id(self)}")
+        self.state = 'NONAUTH'
+        self.calls = []
+        self.noop_error = None
+        self.close_error = None
+        self.logout_error = None
+        self.login_error = None
+    
+    def login(self, account, password):
+        self.calls.append(('login', account, password))
+        if self.login_error:
+            raise self.login_error
+        self.state = 'AUTH'
+    
+    def noop(self):
+        self.calls.append('noop')
+        if self.noop_error:
+            raise self.noop_error
+        return 'OK', [b'NOOP completed']
+    
+    def close(self):
+        self.calls.append('close')
+        if self.close_error:
+            raise self.close_error
+        self.state = 'AUTH'
+    
+    def logout(self):
+        self.calls.append('logout')
+        if self.logout_error:
+            raise self.logout_error
+    
+    def shutdown(self):
+        self.calls.append('shutdown')
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    imap_pool._IMAP_POOL.clear()
+    imap_pool._TLS_SESSIONS.clear()
+    yield
+    imap_pool._IMAP_POOL.clear()
+    imap_pool._TLS_SESSIONS.clear()
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Connections created by get_conn, in order"""
+    opened = []
+    
+    def factory(host, port, tls_session=None):
+        conn = FakeIMAP(host, port, tls_session)
+        opened.append(conn)
+        return conn
+    
+    monkeypatch.setattr(imap_pool, '_ResumingIMAP4_SSL', factory)
+    return opened
+
+def get_conn():
+    return imap_pool.get_conn(*KEY, 'secret')
+
+def test_new_connection_logs_in_and_remembers_tls_session(opened):
+    conn = get_conn()
+    
+    assert opened == [conn]
+    assert conn.calls == [('login', 'sales@example.com', 'secret')]
+    assert imap_pool._TLS_SESSIONS[KEY] == conn.sock.session
+
+def test_released_connection_is_reused(opened):
+    conn = get_conn()
+    imap_pool.release_conn(conn, *KEY)
+    
+    assert get_conn() is conn
+    assert conn.calls[-1] == 'noop'
+    assert len(opened) == 1
+    assert imap_pool._IMAP_POOL[KEY] == []
+
+def test_pool_is_keyed_per_account(opened):
+    conn = get_conn()
+    imap_pool.release_conn(conn, *KEY)
+    
+    other = imap_pool.get_conn('imap.example.com', 993, 'support@example.com', 'secret')
+    
+    assert other is not conn
+    assert [c for c, _ in imap_pool._IMAP_POOL[KEY]] == [conn]
+
+def test_idle_connection_expires_without_noop(opened):
+    stale = FakeIMAP(*KEY[:2])
+    imap_pool._IMAP_POOL[KEY] = [(stale, time.monotonic() - imap_pool.MAX_IDLE_SECONDS - 1)]
+    
+    conn = get_conn()
+    
+    assert conn is not stale
+    assert stale.calls == ['shutdown']
+
+def test_dead_connection_is_discarded(opened):
+    dead = FakeIMAP(*KEY[:2])
+    dead.noop_error = imaplib.IMAP4.abort('socket error: EOF')
+    imap_pool._IMAP_POOL[KEY] = [(dead, time.monotonic())]
+    
+    conn = get_conn()
+    
+    assert conn is not dead
+    assert dead.calls == ['noop', 'shutdown']
+
+def test_new_connection_offers_cached_tls_session(opened):
+    imap_pool._TLS_SESSIONS[KEY] = 'previous-session'
+    
+    assert get_conn().tls_session == 'previous-session'
+
+def test_rejected_tls_session_falls_back_to_full_handshake(monkeypatch):
+    attempts = []
+    
+    def factory(host, port, tls_session=None):
+        attempts.append(tls_session)
+        if tls_session is not None:
+            raise ssl.SSLError('session rejected')
+        return FakeIMAP(host, port)
+    
+    monkeypatch.setattr(imap_pool, '_ResumingIMAP4_SSL', factory)
+    imap_pool._TLS_SESSIONS[KEY] = 'previous-session'
+    
+    get_conn()
+    
+    assert attempts == ['previous-session', None]
+
+def test_failed_login_closes_connection(monkeypatch):
+    opened = []
+    
+    def factory(host, port, tls_session=None):
+        conn = FakeIMAP(host, port, tls_session)
+        conn.login_error = imaplib.IMAP4.error('[AUTHENTICATIONFAILED] Invalid credentials')
+        opened.append(conn)
+        return conn
+    
+    monkeypatch.setattr(imap_pool, '_ResumingIMAP4_SSL', factory)
+    
+    with pytest.raises(imaplib.IMAP4.error):
+        get_conn()
+    
+    assert opened[0].calls[-1] == 'shutdown'
+    assert imap_pool._IMAP_POOL == {}
+    assert KEY not in imap_pool._TLS_SESSIONS
+
+def test_release_closes_selected_mailbox(opened):
+    conn = get_conn()
+    conn.state = 'SELECTED'
+    
+    imap_pool.release_conn(conn, *KEY)
+    
+    assert conn.calls[-1] == 'close'
+    assert [c for c, _ in imap_pool._IMAP_POOL[KEY]] == [conn]
+
+def test_release_drops_connection_that_fails_to_close(opened):
+    conn = get_conn()
+    conn.state = 'SELECTED'
+    conn.close_error = imaplib.IMAP4.abort('connection reset')
+    
+    imap_pool.release_conn(conn, *KEY)
+    
+    assert conn.calls[-2:] == ['close', 'shutdown']
+    assert KEY not in imap_pool._IMAP_POOL
+
+def test_connection_context_returns_connection_to_pool(opened):
+    with imap_pool.connection(*KEY, 'secret') as conn:
+        pass
+    
+    assert [c for c, _ in imap_pool._IMAP_POOL[KEY]] == [conn]
+
+def test_connection_context_discards_on_error(opened):
+    with pytest.raises(RuntimeError):
+        with imap_pool.connection(*KEY, 'secret') as conn:
+            raise RuntimeError('fetch failed')
+    
+    assert conn.calls[-1] == 'shutdown'
+    assert KEY not in imap_pool._IMAP_POOL
+
+def test_close_all_logs_out_idle_connections(opened):
+    first, second = get_conn(), get_conn()
+    second.logout_error = OSError('broken pipe')
+    imap_pool.release_conn(first, *KEY)
+    imap_pool.release_conn(second, *KEY)
+    
+    imap_pool.close_all()
+    
+    assert first.calls[-1] == 'logout'
+    assert second.calls[-2:] == ['logout', 'shutdown']
+    assert imap_pool._IMAP_POOL == {}
@@ -0,0 +1,40 @@
+"""
+Tests for the mtime-keyed prompt file cache
+"""
+
+import os
+
+import pytest
+
+import prompt_loader
+
+@pytest.fixture
+def prompts_dir(tmp_path, monkeypatch):
+    (tmp_path / 'prompts').mkdir()
+    monkeypatch.chdir(tmp_path)
+    prompt_loader._read_prompt_file.cache_clear()
+    yield tmp_path / 'prompts'
+    prompt_loader._read_prompt_file.cache_clear()
+
+def write_prompt(prompts_dir, text, mtime_ns):
+    path = prompts_dir / 'classify_prompt.txt'
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_unchanged_prompt_is_read_once(prompts_dir):
+    write_prompt(prompts_dir, 'Classify: {cleanMessage}', 1_000_000_000)
+    
+    assert prompt_loader.classify('hello') == 'Classify: hello'
+    assert prompt_loader.classify('again') == 'Classify: again'
+    assert prompt_loader._read_prompt_file.cache_info().misses == 1
+
+def test_edited_prompt_is_picked_up(prompts_dir):
+    write_prompt(prompts_dir, 'Classify: {cleanMessage}', 1_000_000_000)
+    assert prompt_loader.classify('hello') == 'Classify: hello'
+    
+    write_prompt(prompts_dir, 'Label: {cleanMessage}', 2_000_000_000)
+    assert prompt_loader.classify('hello') == 'Label: hello'
+
+def test_missing_prompt_raises(prompts_dir):
+    with pytest.raises(FileNotFoundError):
+        prompt_loader.load_prompt('classify_prompt')
@@ -0,0 +1,201 @@
+"""
+Tests for the rule-based reply pre-filter and auto-reply handling
+"""
+
+from email.message import EmailMessage
+
+import pytest
+
+for module in ('pandas', 'gspread', 'openai', 'schedule', 'oauth2client', 'dotenv'):
+    pytest.importorskip(module)
+
+import peekr_automation_master
+from peekr_automation_master import PeekrAutomationMaster, is_auto_reply, prefilter_reply
+
+def make_msg(body, subject='Re: Quick question', **headers):
+    msg = EmailMessage()
+    msg['From'] = 'lead@example.com'
+    msg['Subject'] = subject
+    for name, value in headers.items():
+        msg[name.replace('_', '-')] = value
+    msg.set_content(body)
+    return msg
+
+@pytest.mark.parametrize('text', [
+    'Please unsubscribe me from this list.',
+    'We are not interested, thanks.',
+    'Remove me from your mailing list',
+    'Stop emailing me.',
+])
+def test_clear_opt_outs_short_circuit(text):
+    assert prefilter_reply(text) == 'NOT INTERESTED'
+
+@pytest.mark.parametrize('text', [
+    'Not really interested at the moment.',
+    'We are no longer interested.',
+    "Please don't call me.",
+    'No demo needed, we already have a supplier.',
+    'The quote is too high for us.',
+    'Sounds great, can we schedule a demo?',
+])
+def test_everything_else_goes_to_the_model(text):
+    assert prefilter_reply(text) is None
+
+@pytest.mark.parametrize('headers', [
+    {'Auto_Submitted': 'auto-replied'},
+    {'Auto_Submitted': 'Auto-Generated'},
+    {'X_Autoreply': 'yes'},
+    {'Precedence': 'auto_reply'},
+    {'X_Auto_Response_Suppress': 'All'},
+])
+def test_auto_reply_headers(headers):
+    assert is_auto_reply(make_msg('Thanks for your email.', **headers))
+
+def test_auto_submitted_no_is_a_person():
+    assert not is_auto_reply(make_msg('Tell me more.', Auto_Submitted='no'))
+
+@pytest.mark.parametrize('subject', [
+    'Out of Office: Re: Quick question',
+    'Automatic reply: Quick question',
+])
+def test_auto_reply_subject(subject):
+    assert is_auto_reply(make_msg('Thanks for your email.', subject=subject))
+
+@pytest.mark.parametrize('text', [
+    'Could you send pricing?',
+    'I am out of the office until Monday.',
+    "Sorry, I was on vacation. Yes, let's book a demo.",
+])
+def test_body_wording_is_not_an_auto_reply(text):
+    assert not is_auto_reply(make_msg(text))
+
+class FakeCompletions:
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = 0
+    
+    def create(self, **kwargs):
+        self.calls += 1
+        message = type('Message', (), {'content': self.answer})
+        choice = type('Choice', (), {'message': message})
+        return type('Response', (), {'choices': [choice]})
+
+class FakeAutomation(PeekrAutomationMaster):
+    """The reply pipeline with OpenAI, SMTP and Sheets replaced by recorders"""
+    
+    def __init__(self, model_answer='INTERESTED'):
+        self.stats = {'emails_processed': 0, 'replies_sent': 0, 'errors': 0}
+        self._classification_cache = peekr_automation_master.TTLCache(16, 60)
+        self.completions = FakeCompletions(model_answer)
+        self.openai_client = type('Client', (), {'chat': type('Chat', (), {'completions': self.completions})})
+        self.replies = []
+        self.status_updates = []
+    
+    def send_reply(self, to_email, original_subject, email_content, interest_level):
+        self.replies.append((to_email, interest_level))
+        return True
+    
+    def update_lead_status(self, email_address, interest_level, reply_content):
+        self.status_updates.append((email_address, interest_level))
+
+@pytest.fixture(autouse=True)
+def plain_classify_prompt(monkeypatch):
+    monkeypatch.setattr(peekr_automation_master, 'classify', lambda body: body)
+
+def process(automation, msg):
+    return automation.process_email_detailed({
+        'msg': msg,
+        'sender': 'lead@example.com',
+        'subject': str(msg['Subject']),
+    })
+
+def test_auto_reply_is_neither_answered_nor_recorded():
+    automation = FakeAutomation()
+    
+    assert process(automation, make_msg('Back on Monday.', subject='Out of Office: Re: Quick question'))
+    assert process(automation, make_msg('Thanks, we got your email.', Auto_Submitted='auto-replied'))
+    
+    assert automation.replies == []
+    assert automation.status_updates == []
+    assert automation.completions.calls == 0
+
+def test_human_reply_mentioning_vacation_is_classified_by_the_model():
+    automation = FakeAutomation(model_answer='INTERESTED')
+    
+    assert process(automation, make_msg("Sorry, I was on vacation. Yes, let's book a demo."))
+    
+    assert automation.completions.calls == 1
+    assert automation.replies == [('lead@example.com', 'INTERESTED')]
+    assert automation.status_updates == [('lead@example.com', 'INTERESTED')]
+
+def test_positive_wording_is_classified_by_the_model():
+    automation = FakeAutomation(model_answer='NOT INTERESTED')
+    
+    assert process(automation, make_msg('No demo needed, thanks.'))
+    
+    assert automation.completions.calls == 1
+    assert automation.replies == [('lead@example.com', 'NOT INTERESTED')]
+    assert automation.status_updates == [('lead@example.com', 'NOT INTERESTED')]
+
+@pytest.mark.parametrize('answer, expected', [
+    ('INTERESTED', 'INTERESTED'),
+    ('NOT INTERESTED', 'NOT INTERESTED'),
+    ('not interested.', 'NOT INTERESTED'),
+])
+def test_model_answer_is_mapped(answer, expected):
+    automation = FakeAutomation(model_answer=answer)
+    
+    assert automation.classify_interest('Could you send pricing?') == expected
+    assert automation.completions.calls == 1
+
+def test_opt_out_skips_the_model():
+    automation = FakeAutomation()
+    
+    assert automation.classify_interest('Please remove me from your list') == 'NOT INTERESTED'
+    assert automation.completions.calls == 0
+
+def make_html_msg(html_body, subject='Re: Quick question'):
+    msg = EmailMessage()
+    msg['From'] = 'lead@example.com'
+    msg['Subject'] = subject
+    msg.set_content(html_body, subtype='html')
+    return msg
+
+HTML_REPLY = """<html><head><style>.demo { color: red }</style></head><body>
+<div dir="ltr">Thanks, but the timing is wrong for us.<br>Maybe next year.</div>
+<div class="footer"><a href="https://example.com/unsubscribe">Unsubscribe</a></div>
+<div class="gmail_quote"><div class="gmail_attr">On Mon, Jan 1, 2024 at 9:00 AM Sales &lt;sales@peekr.com&gt; wrote:</div>
+<blockquote class="gmail_quote">Would you like a demo? Ask us for pricing.</blockquote></div>
+</body></html>"""
+
+def test_html_to_text_drops_markup_and_quoted_history():
+    text = peekr_automation_master.html_to_text(HTML_REPLY)
+    
+    assert 'Thanks, but the timing is wrong for us.\nMaybe next year.' in text
+    assert 'demo' not in text
+    assert 'pricing' not in text
+    assert 'wrote:' not in text
+    assert '<' not in text
+
+def test_html_to_text_drops_outlook_history():
+    text = peekr_automation_master.html_to_text(
+        '<p>Sounds good &amp; let us talk.</p><div id="divRplyFwdMsg"><b>From:</b> Sales<br>Book a demo</div>')
+    
+    assert text.strip() == 'Sounds good & let us talk.'
+
+def test_extract_email_body_reports_html_fallback():
+    automation = FakeAutomation()
+    
+    assert automation.extract_email_body(make_msg('Plain reply')) == ('Plain reply', False)
+    text, from_html = automation.extract_email_body(make_html_msg(HTML_REPLY))
+    assert from_html
+    assert text.startswith('Thanks, but the timing is wrong for us.')
+
+def test_html_reply_is_classified_by_the_model():
+    # The footer's "Unsubscribe" link text must not decide the label
+    automation = FakeAutomation(model_answer='INTERESTED')
+    
+    assert process(automation, make_html_msg(HTML_REPLY))
+    
+    assert automation.completions.calls == 1
+    assert automation.replies == [('lead@example.com', 'INTERESTED')]
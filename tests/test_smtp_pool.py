@@ -0,0 +1,133 @@
+"""
+Tests for the keyed SMTP connection pool
+"""
+
+import smtplib
+import time
+
+import pytest
+
+import smtp_pool
+
+KEY = ('smtp.example.com', 465, 'sales@example.com')
+
+class FakeSMTP:
+    def __init__(self, host, port, context=None):
+        self.host = host
+        self.port = port
+        self.context = context
+        self.calls = []
+        self.noop_reply = (250, b'OK')
+        self.login_error = None
+        self.quit_error = None
+    
+    def login(self, account, password):
+        self.calls.append(('login', account, password))
+        if self.login_error:
+            raise self.login_error
+    
+    def noop(self):
+        self.calls.append('noop')
+        if isinstance(self.noop_reply, Exception):
+            raise self.noop_reply
+        return self.noop_reply
+    
+    def quit(self):
+        self.calls.append('quit')
+        if self.quit_error:
+            raise self.quit_error
+    
+    def close(self):
+        self.calls.append('close')
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    smtp_pool._SMTP_POOL.clear()
+    yield
+    smtp_pool._SMTP_POOL.clear()
+
+class Opened(list):
+    """Connections created by get_conn, in order"""
+    login_error = None
+
+@pytest.fixture
+def opened(monkeypatch):
+    opened = Opened()
+    
+    def factory(host, port, context=None):
+        conn = FakeSMTP(host, port, context)
+        conn.login_error = opened.login_error
+        opened.append(conn)
+        return conn
+    
+    monkeypatch.setattr(smtplib, 'SMTP_SSL', factory)
+    return opened
+
+def get_conn():
+    return smtp_pool.get_conn(*KEY, 'secret')
+
+def test_new_connection_uses_shared_context_and_logs_in(opened):
+    conn = get_conn()
+    
+    assert opened == [conn]
+    assert conn.context is smtp_pool.SSL_CONTEXT
+    assert conn.calls == [('login', 'sales@example.com', 'secret')]
+
+def test_released_connection_is_reused(opened):
+    conn = get_conn()
+    smtp_pool.release_conn(conn, *KEY)
+    
+    assert get_conn() is conn
+    assert conn.calls[-1] == 'noop'
+    assert len(opened) == 1
+
+def test_idle_connection_expires_without_noop(opened):
+    stale = FakeSMTP(*KEY[:2])
+    smtp_pool._SMTP_POOL[KEY] = [(stale, time.monotonic() - smtp_pool.MAX_IDLE_SECONDS - 1)]
+    
+    assert get_conn() is not stale
+    assert stale.calls == ['close']
+
+@pytest.mark.parametrize('noop_reply', [(421, b'Service closing'), smtplib.SMTPServerDisconnected()])
+def test_unresponsive_connection_is_discarded(opened, noop_reply):
+    dead = FakeSMTP(*KEY[:2])
+    dead.noop_reply = noop_reply
+    smtp_pool._SMTP_POOL[KEY] = [(dead, time.monotonic())]
+    
+    assert get_conn() is not dead
+    assert dead.calls == ['noop', 'close']
+
+def test_failed_login_closes_connection(opened):
+    opened.login_error = smtplib.SMTPAuthenticationError(535, b'bad credentials')
+    
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        get_conn()
+    
+    assert opened[0].calls[-1] == 'close'
+    assert smtp_pool._SMTP_POOL == {}
+
+def test_connection_context_returns_connection_to_pool(opened):
+    with smtp_pool.connection(*KEY, 'secret') as conn:
+        pass
+    
+    assert [c for c, _ in smtp_pool._SMTP_POOL[KEY]] == [conn]
+
+def test_connection_context_discards_on_error(opened):
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        with smtp_pool.connection(*KEY, 'secret') as conn:
+            raise smtplib.SMTPRecipientsRefused({})
+    
+    assert conn.calls[-1] == 'close'
+    assert KEY not in smtp_pool._SMTP_POOL
+
+def test_close_all_quits_idle_connections(opened):
+    first, second = get_conn(), get_conn()
+    second.quit_error = smtplib.SMTPServerDisconnected()
+    smtp_pool.release_conn(first, *KEY)
+    smtp_pool.release_conn(second, *KEY)
+    
+    smtp_pool.close_all()
+    
+    assert first.calls[-1] == 'quit'
+    assert second.calls[-2:] == ['quit', 'close']
+    assert smtp_pool._SMTP_POOL == {}